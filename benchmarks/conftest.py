@@ -0,0 +1,68 @@
+"""Fixture documents for the benchmarks, generated once per session.
+
+The benchmarks use pytest-benchmark and are not collected by a plain `pytest` run. `make
+bench` runs them, fails when a mean time grew by more than 10% over the last run saved
+on the same machine, then saves the run as JSON under `.benchmarks/`.
+
+The documents are built with the library itself so the benchmarks need no files beyond
+the test images already in `tests/test_files`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from skelmis.docx import Document
+from skelmis.docx.enum.section import WD_SECTION
+from skelmis.docx.shared import Inches
+from tests.unitutil.file import test_file
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor"
+    " incididunt ut labore et dolore magna aliqua."
+)
+
+
+def build_document(paragraphs: int, tables: int, sections: int, pictures: int):
+    """Return a new document having roughly the given number of each item."""
+    document = Document()
+    for s in range(sections):
+        if s:
+            document.add_section(WD_SECTION.NEW_PAGE)
+        document.add_heading(f"Section {s}", level=1)
+        for p in range(paragraphs // sections):
+            paragraph = document.add_paragraph(LOREM, style="List Bullet" if p % 7 else None)
+            paragraph.add_run(f" {p}").bold = True
+        for _ in range(tables // sections):
+            table = document.add_table(rows=10, cols=5)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"{r},{c}"
+        for _ in range(pictures // sections):
+            document.add_picture(test_file("monty-truth.png"), width=Inches(1))
+    return document
+
+
+def pytest_configure(config: pytest.Config):
+    # -- the first run on a machine has no saved results to compare with --
+    config.addinivalue_line(
+        "filterwarnings", "ignore:Can't compare:pytest_benchmark.logger.PytestBenchmarkWarning"
+    )
+
+
+@pytest.fixture(scope="session")
+def small_docx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Path of a one-page document of a few paragraphs and a table."""
+    path = tmp_path_factory.mktemp("bench") / "small.docx"
+    build_document(paragraphs=20, tables=1, sections=1, pictures=1).save(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def large_docx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Path of a document of several thousand paragraphs, many tables and sections."""
+    path = tmp_path_factory.mktemp("bench") / "large.docx"
+    build_document(paragraphs=5000, tables=50, sections=10, pictures=10).save(path)
+    return path
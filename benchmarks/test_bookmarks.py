@@ -0,0 +1,47 @@
+"""Benchmarks for adding and looking up bookmarks in long documents."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+
+
+class DescribeBookmarks:
+    def it_cross_references_a_manual(self, benchmark: BenchmarkFixture):
+        """Add 3000 bookmarks, each with a link to it, then look each up and check the links."""
+
+        def cross_reference():
+            document = Document()
+            for idx in range(3000):
+                document.add_paragraph(f"See section {idx}").add_internal_hyperlink(
+                    f"s{idx}", " here"
+                )
+                document.add_paragraph().add_bookmark(f"s{idx}", f"Section {idx}")
+            bookmarks = document.bookmarks
+            for idx in range(3000):
+                bookmarks[f"s{idx}"]
+            assert bookmarks.unresolved_links() == []
+
+        benchmark(cross_reference)
+
+
+class DescribeAddBookmark:
+    """Adding bookmarks costs the same however many the story already has."""
+
+    @pytest.mark.parametrize("count", [1000, 4000, 16000])
+    def it_adds_bookmarks_in_linear_time(self, benchmark: BenchmarkFixture, count: int):
+        def setup():
+            document = Document()
+            paragraphs = [document.add_paragraph("Section") for _ in range(count)]
+            return (paragraphs,), {}
+
+        def add_bookmarks(paragraphs):
+            for idx, paragraph in enumerate(paragraphs):
+                paragraph.add_bookmark(f"s{idx}", f" {idx}")
+
+        benchmark.pedantic(add_bookmarks, setup=setup, rounds=3)
+        # -- no stats are kept when benchmarks are run with `--benchmark-disable` --
+        if benchmark.stats is not None:
+            benchmark.extra_info["us_per_bookmark"] = benchmark.stats.stats.mean * 1e6 / count
@@ -0,0 +1,54 @@
+"""Benchmarks for compacting the runs of a document and reading it afterwards."""
+
+from __future__ import annotations
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+from skelmis.docx.oxml.ns import qn
+from skelmis.docx.oxml.parser import OxmlElement
+
+from .conftest import LOREM
+
+
+class DescribeCompact:
+    """Read 1000 paragraphs split into 12 runs each, before and after compacting."""
+
+    def it_compacts_a_fragmented_document(self, benchmark: BenchmarkFixture):
+        documents = []
+
+        def setup():
+            documents.append(_fragmented_document())
+            return (documents[-1],), {}
+
+        benchmark.pedantic(lambda document: document.compact(), setup=setup, rounds=5)
+        size_before = len(_fragmented_document().part.blob)
+        size_after = len(documents[-1].part.blob)
+        benchmark.extra_info["part_bytes_before"] = size_before
+        benchmark.extra_info["part_bytes_after"] = size_after
+        assert size_after < size_before / 3
+
+    def it_reads_runs_before_compacting(self, benchmark: BenchmarkFixture):
+        document = _fragmented_document()
+        benchmark(lambda: [r.text for p in document.paragraphs for r in p.runs])
+
+    def it_reads_runs_after_compacting(self, benchmark: BenchmarkFixture):
+        document = _fragmented_document()
+        document.compact()
+        benchmark(lambda: [r.text for p in document.paragraphs for r in p.runs])
+
+
+def _fragmented_document():
+    """A document of 1000 paragraphs, each in runs with the same formatting but their rsids."""
+    document = Document()
+    words = LOREM.split()[:12]
+    for idx in range(1000):
+        p = document.add_paragraph()._p
+        for w, word in enumerate(words):
+            run = p.add_r()
+            run.set(qn("w:rsidR"), "00%06X" % (idx * 12 + w))
+            run.get_or_add_rPr().get_or_add_rFonts().set(qn("w:ascii"), "Calibri")
+            run.text = word + " "
+            if w % 4 == 3:
+                p.append(OxmlElement("w:proofErr", {qn("w:type"): "spellStart"}))
+    return document
@@ -0,0 +1,61 @@
+"""Benchmarks and regression checks for the cost of `import skelmis.docx`.
+
+Each measurement runs in a fresh interpreter, since a module is only imported once per
+process.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+#: Modules that are only needed for rarely-used features and so aren't imported with the
+#: package. A change importing one of these at module level makes every import slower.
+DEFERRED_MODULES = (
+    "skelmis.docx.image.bmp",
+    "skelmis.docx.image.jpeg",
+    "skelmis.docx.image.optimize",
+    "skelmis.docx.text.toc",
+    "skelmis.docx.utility",
+    "typing_extensions",
+)
+
+
+def import_time_us() -> int:
+    """Cumulative microseconds `python -X importtime` reports for `import skelmis.docx`."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import skelmis.docx"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    for line in process.stderr.splitlines():
+        _, self_us, cumulative_us, name = (
+            field.strip() for field in line.replace("|", ":").split(":")
+        )
+        if name == "skelmis.docx":
+            return int(cumulative_us)
+    raise AssertionError("skelmis.docx missing from -X importtime output")
+
+
+class DescribeImport:
+    def it_imports_the_package(self, benchmark: BenchmarkFixture):
+        benchmark.extra_info["importtime_us"] = import_time_us()
+        benchmark(subprocess.run, [sys.executable, "-c", "import skelmis.docx"], check=True)
+
+    def it_does_not_import_rarely_used_modules(self):
+        process = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, skelmis.docx; print('\\n'.join(sys.modules))",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        imported = set(process.stdout.splitlines())
+
+        assert imported.isdisjoint(DEFERRED_MODULES), imported.intersection(DEFERRED_MODULES)
@@ -0,0 +1,28 @@
+"""Benchmarks for opening and saving packages."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+
+
+class DescribeOpen:
+    def it_opens_a_small_package(self, benchmark: BenchmarkFixture, small_docx: Path):
+        benchmark(Document, str(small_docx))
+
+    def it_opens_a_large_package(self, benchmark: BenchmarkFixture, large_docx: Path):
+        benchmark(Document, str(large_docx))
+
+
+class DescribeSave:
+    def it_saves_a_small_package(self, benchmark: BenchmarkFixture, small_docx: Path):
+        document = Document(str(small_docx))
+        benchmark(document.save, io.BytesIO())
+
+    def it_saves_a_large_package(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+        benchmark(document.save, io.BytesIO())
@@ -0,0 +1,51 @@
+"""Benchmarks for splitting a document into its rendered pages."""
+
+from __future__ import annotations
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+from skelmis.docx.oxml.parser import OxmlElement
+
+from .conftest import LOREM
+
+
+class DescribePages:
+    """Split a 2000-paragraph document into its 100 rendered pages."""
+
+    def it_builds_a_page_index(self, benchmark: BenchmarkFixture):
+        document = _paged_document()
+        index = benchmark(document.page_index)
+        assert len(index) == 100
+
+    def it_splits_pages_with_rendered_page_break_fragments(self, benchmark: BenchmarkFixture):
+        """The same split done with proxy objects, for comparison."""
+        document = _paged_document()
+
+        def split_pages():
+            pages, lines = [], []
+            for paragraph in document.paragraphs:
+                breaks = paragraph.rendered_page_breaks
+                if not breaks:
+                    lines.append(paragraph.text)
+                    continue
+                preceding = breaks[0].preceding_paragraph_fragment
+                lines.append(preceding.text if preceding else "")
+                pages.append("\n".join(lines))
+                following = breaks[0].following_paragraph_fragment
+                lines = [following.text if following else ""]
+            pages.append("\n".join(lines))
+            return pages
+
+        assert len(benchmark(split_pages)) == 100
+
+
+def _paged_document():
+    """A document of 2000 paragraphs, a rendered page break in every 20th."""
+    document = Document()
+    for idx in range(2000):
+        paragraph = document.add_paragraph(LOREM[:200])
+        if idx and idx % 20 == 0:
+            paragraph.runs[0]._r.insert(0, OxmlElement("w:lastRenderedPageBreak"))
+            paragraph.add_run(" continued")
+    return document
@@ -0,0 +1,60 @@
+"""Benchmarks for the time and memory taken by traversing a document's proxy objects.
+
+The peak memory allocated by a traversal, as measured by `tracemalloc`, is saved with
+each result as `peak_bytes`.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+from skelmis.docx.document import Document as DocumentObject
+
+
+def traverse_twice(document: DocumentObject) -> list[Any]:
+    """Visit each paragraph, run, row and cell twice, keeping the first visit's proxies."""
+    first = [(p, p.runs) for p in document.paragraphs]
+    first.extend((t, [row.cells for row in t.rows]) for t in document.tables)
+    second = [(p, p.runs) for p in document.paragraphs]
+    second.extend((t, [row.cells for row in t.rows]) for t in document.tables)
+    return first
+
+
+def peak_bytes(fn: Callable[[], Any]) -> int:
+    """Peak memory in bytes allocated while calling `fn`."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class DescribeProxyTraversal:
+    def it_traverses_a_document(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+
+        benchmark.extra_info["peak_bytes"] = peak_bytes(lambda: traverse_twice(document))
+        benchmark(traverse_twice, document)
+
+    def it_traverses_a_document_with_the_proxy_cache(
+        self, benchmark: BenchmarkFixture, large_docx: Path
+    ):
+        document = Document(str(large_docx))
+        document.enable_proxy_cache()
+
+        benchmark.extra_info["peak_bytes"] = peak_bytes(lambda: traverse_twice(document))
+        benchmark(traverse_twice, document)
+
+
+class DescribeProxyAllocation:
+    def it_creates_paragraph_proxies(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+
+        benchmark.extra_info["peak_bytes"] = peak_bytes(lambda: document.paragraphs)
+        benchmark(lambda: document.paragraphs)
@@ -0,0 +1,25 @@
+"""Benchmarks for iterating sections and block-level content."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+
+
+class DescribeSections:
+    def it_iterates_sections(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+        benchmark(lambda: [s.page_width for s in document.sections])
+
+    def it_iterates_section_inner_content(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+        benchmark(lambda: [list(s.iter_inner_content()) for s in document.sections])
+
+
+class DescribeInnerContent:
+    def it_iterates_document_inner_content(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+        benchmark(lambda: list(document.iter_inner_content()))
@@ -0,0 +1,29 @@
+"""Benchmarks for inserting pictures."""
+
+from __future__ import annotations
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+from skelmis.docx.shared import Inches
+from tests.unitutil.file import test_file
+
+
+class DescribeAddPicture:
+    def it_adds_the_same_picture_repeatedly(self, benchmark: BenchmarkFixture):
+        def add_pictures():
+            document = Document()
+            for _ in range(50):
+                document.add_picture(test_file("monty-truth.png"), width=Inches(1))
+
+        benchmark(add_pictures)
+
+    def it_adds_different_pictures(self, benchmark: BenchmarkFixture):
+        names = ("monty-truth.png", "python-icon.jpeg", "sonic.gif", "python.bmp")
+
+        def add_pictures():
+            document = Document()
+            for name in names:
+                document.add_picture(test_file(name), width=Inches(1))
+
+        benchmark(add_pictures)
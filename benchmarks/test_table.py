@@ -0,0 +1,115 @@
+"""Benchmarks for filling tables."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+from skelmis.docx.table import Table
+
+
+class DescribeTableFill:
+    def it_fills_a_table_by_cell(self, benchmark: BenchmarkFixture):
+        def fill_table():
+            table = Document().add_table(rows=20, cols=10)
+            for r in range(20):
+                for c in range(10):
+                    table.cell(r, c).text = f"{r},{c}"
+
+        benchmark(fill_table)
+
+    def it_fills_a_table_by_row(self, benchmark: BenchmarkFixture):
+        def fill_table():
+            table = Document().add_table(rows=20, cols=10)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"{r},{c}"
+
+        benchmark(fill_table)
+
+
+class DescribeTableRows:
+    def it_adds_rows_one_at_a_time(self, benchmark: BenchmarkFixture):
+        def fill_table():
+            table = Document().add_table(rows=1, cols=5)
+            for r in range(2000):
+                for c, cell in enumerate(table.add_row().cells):
+                    cell.text = f"{r},{c}"
+
+        benchmark(fill_table)
+
+    def it_extends_rows_from_records(self, benchmark: BenchmarkFixture):
+        records = [[f"{r},{c}" for c in range(5)] for r in range(2000)]
+
+        def fill_table():
+            Document().add_table(rows=1, cols=5).extend_rows(records)
+
+        benchmark(fill_table)
+
+
+class DescribeTableFromData:
+    DATA = [[f"{r},{c}" for c in range(10)] for r in range(500)]
+
+    def it_adds_a_table_and_fills_its_cells(self, benchmark: BenchmarkFixture):
+        def add_table():
+            table = Document().add_table(rows=500, cols=10)
+            for row, values in zip(table.rows, self.DATA):
+                for cell, value in zip(row.cells, values):
+                    cell.text = value
+
+        benchmark(add_table)
+
+    def it_adds_a_table_from_data(self, benchmark: BenchmarkFixture):
+        def add_table():
+            Document().add_table_from_data(self.DATA, column_formats=[{"bold": True}])
+
+        benchmark(add_table)
+
+
+class DescribeTableStream:
+    ROWS = 20000
+
+    def it_saves_a_table_built_in_memory(self, benchmark: BenchmarkFixture):
+        def save():
+            document = Document()
+            document.add_table_from_data([(i, f"row {i}", i * 1.5) for i in range(self.ROWS)])
+            document.save(io.BytesIO())
+
+        benchmark(save)
+
+    def it_saves_a_streamed_table(self, benchmark: BenchmarkFixture):
+        def save():
+            document = Document()
+            document.add_table_stream((i, f"row {i}", i * 1.5) for i in range(self.ROWS))
+            document.save(io.BytesIO())
+
+        benchmark(save)
+
+
+class DescribeTableExtraction:
+    @pytest.fixture(scope="class")
+    def table(self):
+        document = Document()
+        return document.add_table_from_data([[f"{r},{c}" for c in range(10)] for r in range(2000)])
+
+    def it_reads_the_text_of_each_cell(self, benchmark: BenchmarkFixture, table: Table):
+        benchmark(lambda: [[cell.text for cell in row.cells] for row in table.rows])
+
+    def it_reads_the_table_as_records(self, benchmark: BenchmarkFixture, table: Table):
+        benchmark(table.to_records)
+
+
+class DescribeTableMerge:
+    def it_merges_blocks_of_cells(self, benchmark: BenchmarkFixture):
+        """Merge a table of 200 rows into blocks of two by two cells, 500 merges in all."""
+
+        def merge():
+            table = Document().add_table(rows=200, cols=10)
+            for r in range(0, 200, 2):
+                for c in range(0, 10, 2):
+                    table.cell(r, c).merge(table.cell(r + 1, c + 1))
+
+        benchmark(merge)
@@ -0,0 +1,50 @@
+"""Benchmarks for rendering a mail-merge template many times with different data."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document, Template
+
+from .conftest import build_document
+
+CONTEXT: Dict[str, Any] = {
+    "name": "Ada Lovelace",
+    "date": "1843-09-05",
+    "lines": [{"item": f"Item {i}", "qty": i} for i in range(20)],
+}
+
+
+@pytest.fixture(scope="module")
+def template_docx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Path of a letter of 500 paragraphs with a few placeholders and a table of lines."""
+    document = build_document(paragraphs=500, tables=5, sections=1, pictures=0)
+    document.paragraphs[0].text = "Dear {{name}}, on {{date}}:"
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "{{#lines}}"
+    table.cell(0, 0).add_paragraph("{{item}}")
+    table.cell(0, 1).text = "{{qty}}"
+    table.cell(1, 0).text = "{{/lines}}"
+    path = tmp_path_factory.mktemp("bench") / "template.docx"
+    document.save(path)
+    return path
+
+
+class DescribeTemplate:
+    def it_renders_a_compiled_template(self, benchmark: BenchmarkFixture, template_docx: Path):
+        template = Template.compile(template_docx)
+        benchmark(template.render, CONTEXT)
+
+    def it_opens_and_fills_in_a_template(self, benchmark: BenchmarkFixture, template_docx: Path):
+        """The same work without a compiled template, for comparison."""
+
+        def render():
+            document = Document(str(template_docx))
+            document.replace("{{(name|date)}}", lambda m: CONTEXT[m[1]])
+            return document
+
+        benchmark(render)
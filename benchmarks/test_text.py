@@ -0,0 +1,129 @@
+"""Benchmarks for adding, styling and reading paragraphs and runs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Tuple, cast
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from skelmis.docx import Document
+from skelmis.docx.document import Document as DocumentObject
+from skelmis.docx.oxml.parser import OxmlElement
+from skelmis.docx.oxml.text.run import CT_R, _RunContentAppender  # pyright: ignore
+
+from .conftest import LOREM
+
+
+class DescribeAddParagraph:
+    def it_adds_paragraphs(self, benchmark: BenchmarkFixture):
+        def add_paragraphs():
+            document = Document()
+            for _ in range(1000):
+                document.add_paragraph(LOREM)
+
+        benchmark(add_paragraphs)
+
+    def it_adds_styled_paragraphs(self, benchmark: BenchmarkFixture):
+        def add_paragraphs():
+            document = Document()
+            for _ in range(1000):
+                document.add_paragraph(LOREM, style="List Bullet")
+
+        benchmark(add_paragraphs)
+
+    def it_adds_styled_paragraphs_in_bulk(self, benchmark: BenchmarkFixture):
+        def add_paragraphs():
+            document = Document()
+            document.add_paragraphs((LOREM, "List Bullet") for _ in range(1000))
+
+        benchmark(add_paragraphs)
+
+
+class DescribeRunText:
+    """Setting the text of a run from a long, multi-line string such as a log file."""
+
+    TEXT = ("2026-01-01 00:00:00 INFO\tworker started\n" + LOREM + "\r\n") * 2000
+
+    def it_sets_long_run_text(self, benchmark: BenchmarkFixture):
+        expected_xml = _char_by_char_run(self.TEXT).xml
+
+        r = benchmark(_run_with_text, self.TEXT)
+
+        assert r.xml == expected_xml
+
+    def it_sets_long_run_text_one_character_at_a_time(self, benchmark: BenchmarkFixture):
+        benchmark(_char_by_char_run, self.TEXT)
+
+
+class DescribeReplace:
+    """Replacing placeholders that Word has split across runs."""
+
+    VALUES = {"name": "Ada Lovelace", "date": "1843-09-05", "total": "42"}
+
+    @staticmethod
+    def _document() -> Tuple[Tuple[DocumentObject], Dict[str, object]]:
+        document = Document()
+        for _ in range(2000):
+            paragraph = document.add_paragraph("Dear {{na")
+            paragraph.add_run("me}}, on {{date}} the total").bold = True
+            paragraph.add_run(" was {{total}}. " + LOREM)
+        return (document,), {}
+
+    def it_replaces_placeholders_in_one_pass(self, benchmark: BenchmarkFixture):
+        def replace(document: DocumentObject):
+            return document.replace("{{(name|date|total)}}", lambda m: self.VALUES[m[1]])
+
+        count = benchmark.pedantic(replace, setup=self._document, rounds=5)
+
+        assert count == 6000
+
+
+class DescribeStyle:
+    def it_assigns_paragraph_styles(self, benchmark: BenchmarkFixture, large_docx: Path):
+        paragraphs = Document(str(large_docx)).paragraphs[:500]
+
+        def assign_styles():
+            for paragraph in paragraphs:
+                paragraph.style = "Body Text"
+
+        benchmark(assign_styles)
+
+    def it_assigns_character_styles(self, benchmark: BenchmarkFixture, large_docx: Path):
+        runs = [run for p in Document(str(large_docx)).paragraphs[:250] for run in p.runs]
+
+        def assign_styles():
+            for run in runs:
+                run.style = "Emphasis"
+
+        benchmark(assign_styles)
+
+
+class DescribeTextExtraction:
+    def it_extracts_paragraph_text(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+        benchmark(lambda: [p.text for p in document.paragraphs])
+
+    def it_extracts_run_text(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+        benchmark(lambda: [r.text for p in document.paragraphs for r in p.runs])
+
+    def it_extracts_document_text(self, benchmark: BenchmarkFixture, large_docx: Path):
+        document = Document(str(large_docx))
+        benchmark(lambda: "".join(document.iter_text()))
+
+
+def _run_with_text(text: str) -> CT_R:
+    r = cast(CT_R, OxmlElement("w:r"))
+    r.text = text
+    return r
+
+
+def _char_by_char_run(text: str) -> CT_R:
+    """A `w:r` having `text`, produced by the former character-at-a-time translation."""
+    r = cast(CT_R, OxmlElement("w:r"))
+    appender = _RunContentAppender(r)
+    for char in text:
+        appender.add_char(char)
+    appender.flush()
+    return r
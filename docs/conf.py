@@ -76,6 +76,12 @@ rst_epilog = """
 
 .. |BlockItemContainer| replace:: :class:`.BlockItemContainer`
 
+.. |Bookmark| replace:: :class:`.Bookmark`
+
+.. |BookmarkRegistry| replace:: :class:`.BookmarkRegistry`
+
+.. |Bookmarks| replace:: :class:`.Bookmarks`
+
 .. |_Body| replace:: :class:`._Body`
 
 .. |_Cell| replace:: :class:`._Cell`
@@ -146,6 +152,10 @@ rst_epilog = """
 
 .. |OpcPackage| replace:: :class:`.OpcPackage`
 
+.. |Page| replace:: :class:`.Page`
+
+.. |PageIndex| replace:: :class:`.PageIndex`
+
 .. |Paragraph| replace:: :class:`.Paragraph`
 
 .. |ParagraphFormat| replace:: :class:`.ParagraphFormat`
@@ -186,12 +196,18 @@ rst_epilog = """
 
 .. |Table| replace:: :class:`.Table`
 
+.. |TableStreamWriter| replace:: :class:`.TableStreamWriter`
+
 .. |_TableStyle| replace:: :class:`._TableStyle`
 
 .. |TabStop| replace:: :class:`.TabStop`
 
 .. |TabStops| replace:: :class:`.TabStops`
 
+.. |Template| replace:: :class:`.Template`
+
+.. |TemplateError| replace:: :class:`.TemplateError`
+
 .. |_Text| replace:: :class:`._Text`
 
 .. |True| replace:: :class:`True`
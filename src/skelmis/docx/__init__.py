@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Type
 
 from skelmis.docx.api import Document
+from skelmis.docx.template import Template
 
 if TYPE_CHECKING:
     from skelmis.docx.opc.part import Part
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
 __version__ = "2.5.0"
 
 
-__all__ = ["Document"]
+__all__ = ["Document", "Template"]
 
 
 # -- register custom Part classes with opc package reader --
@@ -8,13 +8,28 @@ specialized ones like structured document tags.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator
-
-from typing_extensions import TypeAlias
-
+import copy
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    TypeAlias,
+    cast,
+)
+
+from skelmis.docx.enum.style import WD_STYLE_TYPE
+from skelmis.docx.oxml.parser import OxmlElement
 from skelmis.docx.oxml.table import CT_Tbl
 from skelmis.docx.oxml.text.paragraph import CT_P
-from skelmis.docx.shared import StoryChild
+from skelmis.docx.shared import Emu, StoryChild, proxy_cache_of
+from skelmis.docx.text.font import Font
 from skelmis.docx.text.paragraph import Paragraph
 
 if TYPE_CHECKING:
@@ -22,11 +37,18 @@ if TYPE_CHECKING:
     from skelmis.docx.oxml.document import CT_Body
     from skelmis.docx.oxml.section import CT_HdrFtr
     from skelmis.docx.oxml.table import CT_Tc
+    from skelmis.docx.oxml.text.font import CT_RPr
+    from skelmis.docx.oxml.text.run import CT_R
     from skelmis.docx.shared import Length
-    from skelmis.docx.styles.style import ParagraphStyle
+    from skelmis.docx.styles.style import ParagraphStyle, _TableStyle  # pyright: ignore
     from skelmis.docx.table import Table
 
 BlockItemElement: TypeAlias = "CT_Body | CT_HdrFtr | CT_Tc"
+ParagraphSpec: TypeAlias = "str | Tuple[str, str | ParagraphStyle | None]"
+#: Character formatting for a column, as |Font| property names and their values, like
+#: ``{"bold": True, "size": Pt(9)}``.
+ColumnFormat: TypeAlias = "Mapping[str, Any]"
+TableData: TypeAlias = "Sequence[Sequence[Any]] | Mapping[Any, Sequence[Any]]"
 
 
 class BlockItemContainer(StoryChild):
@@ -37,6 +59,8 @@ class BlockItemContainer(StoryChild):
     paragraph or table.
     """
 
+    __slots__ = ("_element",)
+
     def __init__(self, element: BlockItemElement, parent: t.ProvidesStoryPart):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
@@ -57,6 +81,35 @@ class BlockItemContainer(StoryChild):
             paragraph.style = style
         return paragraph
 
+    def add_paragraphs(self, paragraphs: Iterable[ParagraphSpec]) -> List[Paragraph]:
+        """Return paragraphs newly added, in order, to the end of the content in this container.
+
+        Each item of `paragraphs` is either the text of a paragraph or a `(text, style)`
+        pair. The result is the same as calling :meth:`add_paragraph` for each item, but
+        each distinct style is looked up only once and the paragraphs are inserted
+        together, which is much faster when adding thousands of paragraphs.
+        """
+        prototypes: Dict[Any, CT_P] = {}
+        ps: List[CT_P] = []
+        for item in paragraphs:
+            text, style = (item, None) if isinstance(item, str) else item
+            # -- style objects are not hashable, their element is --
+            key = style if style is None or isinstance(style, str) else style.element
+            prototype = prototypes.get(key)
+            if prototype is None:
+                prototype = prototypes[key] = self._new_p(style)
+            p = copy.deepcopy(prototype)
+            if text:
+                p.add_r().text = text
+            ps.append(p)
+
+        if ps:
+            element = self._element
+            element._insert_p(ps[0])  # pyright: ignore[reportPrivateUsage]
+            idx = element.index(ps[0]) + 1
+            element[idx:idx] = ps[1:]
+        return [Paragraph(p, self) for p in ps]
+
     def add_table(self, rows: int, cols: int, width: Length) -> Table:
         """Return table of `width` having `rows` rows and `cols` columns.
 
@@ -70,12 +123,78 @@ class BlockItemContainer(StoryChild):
         self._element._insert_tbl(tbl)  #  # pyright: ignore[reportPrivateUsage]
         return Table(tbl, self)
 
+    def add_table_from_data(
+        self,
+        data: TableData,
+        width: Length,
+        header: Sequence[Any] | None = None,
+        col_widths: Sequence[Length] | None = None,
+        style: str | _TableStyle | None = None,
+        column_formats: Sequence[ColumnFormat | None] | None = None,
+    ) -> Table:
+        """Return a table holding `data`, appended at the end of the content in this container.
+
+        `data` is either a sequence of rows, each a sequence of cell values, or a mapping of
+        column name to the sequence of values in that column. Its keys then become the
+        header unless `header` is given. A value of |None| leaves its cell empty and any
+        other value is written as its `str()`. A row shorter than the others is completed
+        with empty cells.
+
+        `header` is a row placed first and repeated at the top of each page the table
+        spans. Columns have the widths in `col_widths` when given, otherwise share `width`
+        evenly. `style` is a table style object or name, as for :attr:`Table.style`. Each
+        item of `column_formats` is character formatting applied to the values of that
+        column, like ``{"bold": True}``; the header is left to the table style.
+
+        The whole table is built in a single pass, so this is much faster than adding an
+        empty table and then setting the text of each of its cells. Raises |ValueError|
+        when the table would have no columns, as for empty `data` with no `header`.
+        """
+        from skelmis.docx.table import Table
+
+        if isinstance(data, Mapping):
+            columns = cast("Mapping[Any, Sequence[Any]]", data)
+            if header is None:
+                header = list(columns)
+            rows: List[Sequence[Any]] = list(itertools.zip_longest(*columns.values()))
+        else:
+            rows = list(data)
+
+        col_count = max(map(len, rows), default=0)
+        if header is not None:
+            col_count = max(col_count, len(header))
+        if col_widths is None:
+            col_widths = [Emu(width // col_count)] * col_count if col_count else []
+        elif len(col_widths) < col_count:
+            raise ValueError(f"{len(col_widths)} column widths given for {col_count} columns")
+        if not col_widths:
+            raise ValueError("a table needs at least one column, data and header have none")
+        if column_formats is not None and len(column_formats) > len(col_widths):
+            raise ValueError(
+                f"{len(column_formats)} column formats given for {len(col_widths)} columns"
+            )
+
+        def texts(values: Sequence[Any]) -> List[str]:
+            return ["" if value is None else str(value) for value in values]
+
+        tbl = CT_Tbl.new_tbl_from_rows(
+            None if header is None else texts(header),
+            (texts(row) for row in rows),
+            col_widths,
+            [self._new_rPr(column_format) for column_format in column_formats or ()],
+        )
+        tbl.tblStyle_val = self.part.get_style_id(style, WD_STYLE_TYPE.TABLE)
+        self._element._insert_tbl(tbl)  # pyright: ignore[reportPrivateUsage]
+        return Table(tbl, self)
+
     def iter_inner_content(self) -> Iterator[Paragraph | Table]:
         """Generate each `Paragraph` or `Table` in this container in document order."""
         from skelmis.docx.table import Table
 
+        cache = proxy_cache_of(self)
         for element in self._element.inner_content_elements:
-            yield (Paragraph(element, self) if isinstance(element, CT_P) else Table(element, self))
+            proxy_cls = Paragraph if isinstance(element, CT_P) else Table
+            yield proxy_cls(element, self) if cache is None else cache.get(element, proxy_cls, self)
 
     @property
     def paragraphs(self):
@@ -83,7 +202,10 @@ class BlockItemContainer(StoryChild):
 
         Read-only.
         """
-        return [Paragraph(p, self) for p in self._element.p_lst]
+        cache = proxy_cache_of(self)
+        if cache is None:
+            return [Paragraph(p, self) for p in self._element.p_lst]
+        return [cache.get(p, Paragraph, self) for p in self._element.p_lst]
 
     @property
     def tables(self):
@@ -93,8 +215,31 @@ class BlockItemContainer(StoryChild):
         """
         from skelmis.docx.table import Table
 
-        return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        cache = proxy_cache_of(self)
+        if cache is None:
+            return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        return [cache.get(tbl, Table, self) for tbl in self._element.tbl_lst]
 
     def _add_paragraph(self):
         """Return paragraph newly added to the end of the content in this container."""
         return Paragraph(self._element.add_p(), self)
+
+    @staticmethod
+    def _new_rPr(column_format: ColumnFormat | None) -> CT_RPr | None:
+        """A `w:rPr` element having the properties in `column_format`, None if it has none."""
+        if not column_format:
+            return None
+        r = cast("CT_R", OxmlElement("w:r"))
+        font = Font(r)
+        for name, value in column_format.items():
+            if not hasattr(Font, name):
+                raise AttributeError(f"Font has no property '{name}'")
+            setattr(font, name, value)
+        return r.rPr
+
+    def _new_p(self, style: str | ParagraphStyle | None) -> CT_P:
+        """Return a new, unattached `w:p` element having paragraph style `style`."""
+        p = cast(CT_P, OxmlElement("w:p"))
+        if style is not None:
+            p.style = self.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+        return p
@@ -0,0 +1,211 @@
+"""Bookmarks, the named locations in a document that internal hyperlinks link to.
+
+A bookmark is marked by a `w:bookmarkStart` element, holding its name and id, and a
+`w:bookmarkEnd` element having the same id. Each story part, the document body and each
+header and footer, keeps a |BookmarkRegistry| of the bookmarks in it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator, List
+
+from lxml import etree
+
+from skelmis.docx.oxml.ns import nsmap, qn
+
+if TYPE_CHECKING:
+    from skelmis.docx.oxml.xmlchemy import BaseOxmlElement
+    from skelmis.docx.parts.document import DocumentPart
+    from skelmis.docx.parts.story import StoryPart
+    from skelmis.docx.text.paragraph import Paragraph
+
+_BOOKMARK_START, _HYPERLINK, _P = qn("w:bookmarkStart"), qn("w:hyperlink"), qn("w:p")
+_ANCHOR, _ID, _NAME = qn("w:anchor"), qn("w:id"), qn("w:name")
+
+_count_bookmarks = etree.XPath("count(.//w:bookmarkStart)", namespaces=nsmap)
+
+
+class Bookmark:
+    """A bookmark, the location in a story part that internal hyperlinks to its name go to."""
+
+    def __init__(self, bookmarkStart: BaseOxmlElement, part: StoryPart):
+        self._bookmarkStart = bookmarkStart
+        self._part = part
+
+    @property
+    def id(self) -> str:
+        """The id pairing the start of this bookmark with its end."""
+        return self._bookmarkStart.get(_ID, "")
+
+    @property
+    def name(self) -> str:
+        """The name internal hyperlinks to this bookmark use as their anchor."""
+        return self._bookmarkStart.get(_NAME, "")
+
+    @property
+    def paragraph(self) -> Paragraph | None:
+        """The |Paragraph| this bookmark starts in.
+
+        |None| when it starts between paragraphs, such as a bookmark around a table.
+        """
+        from skelmis.docx.text.paragraph import Paragraph
+
+        p = next(self._bookmarkStart.iterancestors(_P), None)
+        return None if p is None else Paragraph(p, self)  # pyright: ignore[reportArgumentType]
+
+    @property
+    def part(self) -> StoryPart:
+        """The story part this bookmark is in."""
+        return self._part
+
+
+class Bookmarks:
+    """The bookmarks of a document, looked up by name.
+
+    Bookmarks in the body are found first, then those in headers and footers. The
+    registry of each story part is only built when a name isn't found in those before.
+    """
+
+    def __init__(self, document_part: DocumentPart):
+        self._document_part = document_part
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def __getitem__(self, name: str) -> Bookmark:
+        bookmark = self.get(name)
+        if bookmark is None:
+            raise KeyError(f"no bookmark named '{name}'")
+        return bookmark
+
+    def __iter__(self) -> Iterator[Bookmark]:
+        for part in self._iter_story_parts():
+            for bookmarkStart in part.bookmarks:
+                yield Bookmark(bookmarkStart, part)
+
+    def __len__(self) -> int:
+        return sum(len(part.bookmarks) for part in self._iter_story_parts())
+
+    def get(self, name: str) -> Bookmark | None:
+        """The bookmark named `name`, |None| when the document has none of that name."""
+        for part in self._iter_story_parts():
+            bookmarkStart = part.bookmarks.get(name)
+            if bookmarkStart is not None:
+                return Bookmark(bookmarkStart, part)
+        return None
+
+    def unresolved_links(self) -> List[str]:
+        """The anchors of internal hyperlinks in the document that no bookmark has.
+
+        Each anchor is listed once, in the order its first hyperlink appears. The
+        registries are brought up to date first, then the hyperlinks of each story are
+        checked in one pass, so links can be added before the bookmarks they go to and
+        validated together once the document is complete.
+        """
+        parts = list(self._iter_story_parts())
+        names = set()
+        for part in parts:
+            part.bookmarks.refresh()
+            names.update(part.bookmarks.names)
+        anchors = (
+            hyperlink.get(_ANCHOR) for part in parts for hyperlink in part.element.iter(_HYPERLINK)
+        )
+        return list(dict.fromkeys(a for a in anchors if a is not None and a not in names))
+
+    def _iter_story_parts(self) -> Iterator[StoryPart]:
+        """Generate the document part, then each header and footer part."""
+        from skelmis.docx.parts.story import StoryPart
+
+        document_part = self._document_part
+        yield document_part
+        for part in document_part.package.iter_parts():
+            if isinstance(part, StoryPart) and part is not document_part:
+                yield part
+
+
+class BookmarkRegistry:
+    """The `w:bookmarkStart` elements of a story, by name, and the ids they use.
+
+    Built in a single pass over the story and kept up to date as bookmarks are added
+    with :meth:`add`, so adding a bookmark costs the same however many the story has. A
+    lookup that finds a bookmark since removed from the story, or that finds nothing
+    while the story has gained or lost bookmarks, builds the registry again. After
+    adding bookmarks some other way, such as by editing the XML or copying paragraphs,
+    call :meth:`refresh` so new bookmarks don't reuse their names or ids.
+    """
+
+    def __init__(self, root: BaseOxmlElement):
+        self._root = root
+        self.refresh()
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def __iter__(self) -> Iterator[BaseOxmlElement]:
+        return iter(list(self._starts.values()))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def add(self, bookmarkStart: BaseOxmlElement):
+        """Register `bookmarkStart`, about to be inserted in the story.
+
+        A `bookmarkStart` having no `w:id` is given a new one, once its name is known to be
+        free. Raises |ValueError| when the story already has a bookmark of the same name.
+        """
+        name = bookmarkStart.get(_NAME, "")
+        existing = self._starts.get(name)
+        if existing is not None and self._is_current(existing, name):
+            raise ValueError(f"a bookmark named '{name}' already exists")
+        if bookmarkStart.get(_ID) is None:
+            self._max_id += 1
+            bookmarkStart.set(_ID, str(self._max_id))
+        self._starts[name] = bookmarkStart
+        self._count += 1
+        self._note_id(bookmarkStart.get(_ID, ""))
+
+    def get(self, name: str) -> BaseOxmlElement | None:
+        """The `w:bookmarkStart` element of the bookmark named `name`, |None| if not present."""
+        bookmarkStart = self._starts.get(name)
+        if bookmarkStart is not None and self._is_current(bookmarkStart, name):
+            return bookmarkStart
+        if bookmarkStart is None and _count_bookmarks(self._root) == self._count:
+            return None
+        self.refresh()
+        return self._starts.get(name)
+
+    @property
+    def names(self) -> List[str]:
+        """The names of the registered bookmarks."""
+        return list(self._starts)
+
+    def next_id(self) -> int:
+        """A new bookmark id, greater than any id registered in the story."""
+        self._max_id += 1
+        return self._max_id
+
+    def refresh(self):
+        """Build the registry again from the bookmarks in the story."""
+        self._starts: Dict[str, BaseOxmlElement] = {}
+        self._max_id = -1
+        self._count = 0
+        for bookmarkStart in self._root.iter(_BOOKMARK_START):
+            # -- like Word, the first of several bookmarks of the same name is the one used --
+            self._starts.setdefault(bookmarkStart.get(_NAME, ""), bookmarkStart)
+            self._count += 1
+            self._note_id(bookmarkStart.get(_ID, ""))
+
+    def _is_current(self, bookmarkStart: BaseOxmlElement, name: str) -> bool:
+        """True when `bookmarkStart` is still in the story and still named `name`."""
+        if bookmarkStart.get(_NAME) != name:
+            return False
+        parent = bookmarkStart.getparent()
+        while parent is not None:
+            if parent is self._root:
+                return True
+            parent = parent.getparent()
+        return False
+
+    def _note_id(self, bookmark_id: str):
+        if bookmark_id.isdigit():
+            self._max_id = max(self._max_id, int(bookmark_id))
@@ -5,20 +5,45 @@
 
 from __future__ import annotations
 
+import itertools
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Iterator, List
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import skelmis.docx
 from skelmis.docx.blkcntnr import BlockItemContainer
+from skelmis.docx.bookmarks import Bookmarks
 from skelmis.docx.enum.section import WD_SECTION
 from skelmis.docx.enum.text import WD_BREAK
 from skelmis.docx.oxml import simpletypes
+from skelmis.docx.oxml.ns import qn
 from skelmis.docx.section import Section, Sections
 from skelmis.docx.shared import ElementProxy, Emu
+from skelmis.docx.table import TableStreamWriter
+from skelmis.docx.text.compact import compact_story
+from skelmis.docx.text.pages import Page, PageIndex, iter_pages
+from skelmis.docx.text.search import compile_pattern, paragraph_text, replace_in_paragraph
 
 if TYPE_CHECKING:
     import skelmis.docx.types as t
+    from skelmis.docx.blkcntnr import ColumnFormat, ParagraphSpec, TableData
+    from skelmis.docx.image.optimize import MediaOptimizer
     from skelmis.docx.oxml.document import CT_Body, CT_Document
+    from skelmis.docx.oxml.section import CT_HdrFtr
+    from skelmis.docx.oxml.text.paragraph import CT_P
+    from skelmis.docx.oxml.xmlchemy import BaseOxmlElement
     from skelmis.docx.parts.document import DocumentPart
     from skelmis.docx.settings import Settings
     from skelmis.docx.shared import Length
@@ -120,6 +145,15 @@ class Document(ElementProxy):
         """
         return self._body.add_paragraph(text, style)
 
+    def add_paragraphs(self, paragraphs: Iterable[ParagraphSpec]) -> List[Paragraph]:
+        """Return paragraphs newly added, in order, to the end of the document.
+
+        Each item of `paragraphs` is either the text of a paragraph or a `(text, style)`
+        pair, as for :meth:`add_paragraph`. Much faster than calling :meth:`add_paragraph`
+        for each one when adding many paragraphs, a long log for example.
+        """
+        return self._body.add_paragraphs(paragraphs)
+
     def add_floating_picture(self):
         """"""
         # Source reference: https://github.com/ArtifexSoftware/pdf2docx/issues/54#issuecomment-715925252
@@ -163,6 +197,117 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    def add_table_from_data(
+        self,
+        data: TableData,
+        header: Sequence[Any] | None = None,
+        col_widths: Sequence[Length] | None = None,
+        style: str | _TableStyle | None = None,
+        column_formats: Sequence[ColumnFormat | None] | None = None,
+    ) -> Table:
+        """Return a table holding `data`, added at the end of the document.
+
+        `data` is a sequence of rows or a mapping of column name to column values, and the
+        columns share the width between the margins unless `col_widths` is given. See
+        :meth:`.BlockItemContainer.add_table_from_data` for the other arguments. Much
+        faster than filling in the cells of a table from :meth:`add_table` one by one.
+        """
+        return self._body.add_table_from_data(
+            data, self._block_width, header, col_widths, style, column_formats
+        )
+
+    def add_table_stream(
+        self,
+        records: Iterable[Sequence[Any]] | Callable[[], Iterable[Sequence[Any]]],
+        header: Sequence[Any] | None = None,
+        col_widths: Sequence[Length] | None = None,
+        style: str | _TableStyle | None = None,
+        column_formats: Sequence[ColumnFormat | None] | None = None,
+    ) -> TableStreamWriter:
+        """Return a |TableStreamWriter| for a table added at the end of the document.
+
+        The rows of the table are made from `records`, only as the document is saved, and
+        written straight into the saved file one at a time. A table of a million rows can
+        so be saved in constant memory. The streamed rows are not otherwise part of the
+        document, so aren't seen by :attr:`tables` or :meth:`content_hash`.
+
+        `records` can be an iterable, like a generator, consumed by the first save of the
+        document; saving it again then raises |ValueError|. It can otherwise be a function
+        returning a fresh iterable of the records on each call, so the document can be
+        saved any number of times.
+
+        The table has as many columns as the longest of `header`, `col_widths` and the
+        first record, and |ValueError| is raised when that is none. The other arguments
+        are as for :meth:`add_table_from_data`.
+        """
+        if callable(records):
+            first = next(iter(records()), None)
+        else:
+            records = iter(records)
+            first = next(records, None)
+            if first is not None:
+                records = itertools.chain([first], records)
+        if col_widths is None:
+            col_count = max(len(header or ()), len(first or ()))
+            col_widths = [Emu(self._block_width // col_count)] * col_count if col_count else []
+
+        table = self._body.add_table_from_data(
+            [], self._block_width, header, col_widths, style, column_formats
+        )
+        rPrs = [self._body._new_rPr(column_format) for column_format in column_formats or ()]
+        writer = TableStreamWriter(table, records, rPrs)
+        self._part.add_table_stream(table._tbl, writer)
+        return writer
+
+    @property
+    def bookmarks(self) -> Bookmarks:
+        """|Bookmarks| object providing access to the bookmarks of this document by name.
+
+        Those of each story are found in a single pass the first time they're needed and
+        kept up to date as bookmarks are added with :meth:`.Paragraph.add_bookmark`.
+        """
+        return Bookmarks(self._part)
+
+    def compact(
+        self, merge_runs: bool = True, drop_rsids: bool = True, drop_proof_errors: bool = True
+    ) -> int:
+        """Remove the markup of this document that doesn't change its text or formatting.
+
+        `drop_proof_errors` removes the spelling and grammar marks Word leaves in the text
+        and `drop_rsids` the editing-session ids on paragraphs, runs and other elements.
+        `merge_runs` then removes empty runs and merges each run into the run before it
+        when both have the same formatting, so a paragraph Word split into many runs while
+        it was edited has as few runs as its formatting needs. The body, including its
+        tables, and each header and footer are compacted. The saved file is smaller and
+        reading the runs and text of the document afterward is faster. Returns the number
+        of elements removed.
+        """
+        return sum(
+            compact_story(story, merge_runs, drop_rsids, drop_proof_errors)
+            for story, _ in self._iter_story_elements(_TEXT_SCOPES)
+        )
+
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the content of this document.
+
+        It is the hash of what saving with `deterministic=True` writes, independent of
+        save time and platform, so a document regenerated the same way has the same
+        hash. Useful to skip work, such as PDF conversion or an upload, when a
+        regenerated document has not changed.
+        """
+        return self._part.package.content_hash()
+
+    def enable_proxy_cache(self):
+        """Reuse the proxy objects of this document's paragraphs, runs, tables, rows and cells.
+
+        Once enabled, accessing the same paragraph again, through `.paragraphs` or
+        `.iter_inner_content()` for example, returns the same |Paragraph| object for as
+        long as it is referenced elsewhere. Repeated traversals then create fewer objects
+        and `is` comparisons between proxies are meaningful. Applies to the body and to
+        headers and footers.
+        """
+        self._part.enable_proxy_cache()
+
     @property
     def core_properties(self):
         """A |CoreProperties| object providing Dublin Core properties of document."""
@@ -182,6 +327,52 @@ class Document(ElementProxy):
         """Generate each `Paragraph` or `Table` in this document in document order."""
         return self._body.iter_inner_content()
 
+    def iter_pages(self) -> Iterator[Page]:
+        """Generate a |Page| for each page of the body of this document, in order.
+
+        Pages are those of the last time the document was laid out by the application
+        that saved it, as recorded by its rendered page breaks, together with the page
+        breaks inserted by its author. Found in a single pass over the XML, without
+        creating any proxy objects. A document not saved by Word since it was generated has
+        only the page breaks its author inserted.
+        """
+        return iter_pages(self._element.body)
+
+    def page_index(self) -> PageIndex:
+        """A |PageIndex| of the pages of this document, for looking up the page of content.
+
+        The index is a snapshot; build it again once the document has changed.
+        """
+        return PageIndex(list(self.iter_pages()))
+
+    def iter_text(
+        self,
+        include: Iterable[str] = ("body", "tables", "headers", "footers"),
+        separator: str = "\n",
+    ) -> Iterator[str]:
+        """Generate the text of each paragraph in this document, followed by `separator`.
+
+        `include` selects where the paragraphs come from: "body" for those of the main
+        document outside of tables, "tables" for those in table cells, including nested
+        tables, and "headers" and "footers" for those of each distinct header and footer.
+        Body paragraphs and tables are generated in document order, then headers and
+        footers in section order. So ``"".join(document.iter_text())`` is the whole text
+        of the document, one paragraph per line.
+
+        The text of each paragraph is the same as its |Paragraph| `.text` but is read
+        directly from the XML, without creating any proxy objects, which is much faster
+        for large documents.
+        """
+        include = set(include)
+        unknown = include - _TEXT_SCOPES
+        if unknown:
+            raise ValueError(f"unknown text scope(s): {', '.join(sorted(unknown))}")
+
+        tables = "tables" in include
+        for story, top_level in self._iter_story_elements(include):
+            for p in _iter_p(story, top_level, tables):
+                yield paragraph_text(p) + separator
+
     @property
     def paragraphs(self) -> List[Paragraph]:
         """The |Paragraph| instances in the document, in document order.
@@ -196,16 +387,85 @@ class Document(ElementProxy):
         """The |DocumentPart| object of this document."""
         return self._part
 
-    def save(self, path_or_stream: str | Path | IO[bytes]):
+    def replace(
+        self,
+        pattern: str | Pattern[str],
+        repl: str | Callable[[Match[str]], str],
+        *,
+        regex: bool = True,
+        scope: Iterable[str] = ("body", "tables", "headers", "footers"),
+    ) -> int:
+        """Replace each match of `pattern` in the text of this document by `repl`.
+
+        `pattern` is a regular expression, or literal text when `regex` is False. `repl`
+        is the replacement text, in which backreferences like ``\\1`` are expanded when
+        `regex` is True, or a callable returning the replacement for a match object. A
+        callable makes it possible to replace many placeholders in a single pass::
+
+            document.replace("{{(name|date|total)}}", lambda m: values[m[1]])
+
+        Matches are found in the text of each paragraph as a whole, so text split over
+        several runs, as Word often does, is found too. The replacement takes the
+        formatting of the run where its match starts. Runs of hyperlinks are included. A
+        match never spans paragraphs. `scope` selects the paragraphs searched, as
+        `include` does for :meth:`iter_text`. Returns the number of replacements made.
+        """
+        scope = set(scope)
+        unknown = scope - _TEXT_SCOPES
+        if unknown:
+            raise ValueError(f"unknown text scope(s): {', '.join(sorted(unknown))}")
+
+        compiled = compile_pattern(pattern, regex)
+        if callable(repl):
+            replacement = repl
+        elif regex:
+            replacement = lambda match: match.expand(repl)  # noqa: E731
+        else:
+            replacement = lambda match: repl  # noqa: E731
+
+        count = 0
+        tables = "tables" in scope
+        for story, top_level in self._iter_story_elements(scope):
+            for p in _iter_p(story, top_level, tables):
+                count += replace_in_paragraph(p, compiled, replacement)
+        return count
+
+    def save(
+        self,
+        path_or_stream: str | Path | IO[bytes],
+        *,
+        optimize_media: bool | MediaOptimizer = False,
+        dedupe_headers_footers: bool = False,
+        deterministic: bool = False,
+    ):
         """Save this document to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
         file-like object.
+
+        When `optimize_media` is |True|, PNG and JPEG images in the document are
+        losslessly recompressed and stripped of metadata before the package is written.
+        `optimize_media` can also be a |MediaOptimizer|, which keeps its results from one
+        save to the next, so an image appearing in many documents is optimized only once.
+
+        When `dedupe_headers_footers` is |True|, sections having identical header or
+        footer content are made to share a single header or footer part. A shared
+        header or footer changes for all its sections when edited after saving.
+
+        When `deterministic` is |True|, the package is written in a stable order with
+        fixed zip timestamps, so the saved file is independent of save time and platform.
+        See also :meth:`content_hash`.
         """
         if isinstance(path_or_stream, Path):
             path_or_stream = str(path_or_stream)
 
-        self._part.save(path_or_stream)
+        if optimize_media is True:
+            self._part.package.optimize_media()
+        elif optimize_media:
+            self._part.package.optimize_media(optimize_media)
+        if dedupe_headers_footers:
+            self._part.dedupe_header_footer_parts()
+        self._part.save(path_or_stream, deterministic)
 
     @property
     def sections(self) -> Sections:
@@ -233,12 +493,52 @@ class Document(ElementProxy):
         """
         return self._body.tables
 
+    def update_toc(self) -> int:
+        """Fill in the entries of each table of contents in this document.
+
+        Entries are generated for the heading paragraphs selected by the `\\o` (outline
+        levels) and `\\t` (styles) switches of each TOC field, such as one inserted with
+        :meth:`Paragraph.insert_table_of_contents`. Each entry links to a bookmark added
+        to its heading when the `\\h` switch is present. Page numbers are taken from the
+        page breaks recorded when the document was last rendered by Word and are left
+        blank when there are none. Returns the number of tables of contents updated.
+
+        Unlike :func:`skelmis.docx.utility.update_toc`, this does not need LibreOffice.
+        """
+        # -- imported here so documents that never update a TOC don't load it --
+        from skelmis.docx.text.toc import TocUpdater
+
+        return TocUpdater(
+            self._element.body, self.styles, self._block_width, self._part.bookmarks
+        ).update()
+
     @property
     def _block_width(self) -> Length:
         """A |Length| object specifying the space between margins in last section."""
         section = self.sections[-1]
         return Emu(section.page_width - section.left_margin - section.right_margin)
 
+    def _iter_story_elements(self, include: Set[str]) -> Iterator[Tuple[CT_Body | CT_HdrFtr, bool]]:
+        """Generate the root element of each story in `include`, once each.
+
+        Each is paired with whether its own paragraphs, those outside tables, are
+        included; the body is generated, without its paragraphs, when only its tables
+        are included.
+        """
+        if include & {"body", "tables"}:
+            yield self._element.body, "body" in include
+        ref_tags = {qn(f"w:{kind[:-1]}Reference") for kind in include & {"headers", "footers"}}
+        if not ref_tags:
+            return
+        seen: Set[str] = set()
+        for sectPr in self._element.sectPr_lst:
+            for ref in sectPr.iterchildren(*ref_tags):
+                rId = ref.get(qn("r:id"))
+                if rId is None or rId in seen:
+                    continue
+                seen.add(rId)
+                yield self._part.related_parts[rId].element, True
+
     @property
     def _body(self) -> _Body:
         """The |_Body| instance containing the content for this document."""
@@ -247,6 +547,27 @@ class Document(ElementProxy):
         return self.__body
 
 
+_TEXT_SCOPES = {"body", "tables", "headers", "footers"}
+
+_P, _TBL, _TR, _TC = qn("w:p"), qn("w:tbl"), qn("w:tr"), qn("w:tc")
+
+
+def _iter_p(container: BaseOxmlElement, top_level: bool, tables: bool) -> Iterator[CT_P]:
+    """Generate the `w:p` elements of block-item `container` in document order.
+
+    Paragraphs directly in `container` are included when `top_level` is True, and those
+    in its tables, at any depth, when `tables` is True.
+    """
+    for child in container.iterchildren(_P, _TBL):
+        if child.tag == _P:
+            if top_level:
+                yield child
+        elif tables:
+            for tr in child.iterchildren(_TR):
+                for tc in tr.iterchildren(_TC):
+                    yield from _iter_p(tc, True, True)
+
+
 class _Body(BlockItemContainer):
     """Proxy for `<w:body>` element in this document.
 
@@ -16,3 +16,8 @@ class InvalidSpanError(PythonDocxError):
 class InvalidXmlError(PythonDocxError):
     """Raised when invalid XML is encountered, such as on attempt to access a missing
     required child element."""
+
+
+class TemplateError(PythonDocxError):
+    """Raised when the repeating-region markers of a template are unbalanced or
+    misplaced."""
@@ -2,22 +2,36 @@
 
 That characterization is as to content type and size, as a required step in including
 them in a document.
+
+The header parsers are loaded when `SIGNATURES` is first used, so importing the package
+doesn't import them.
 """
 
-from skelmis.docx.image.bmp import Bmp
-from skelmis.docx.image.gif import Gif
-from skelmis.docx.image.jpeg import Exif, Jfif
-from skelmis.docx.image.png import Png
-from skelmis.docx.image.tiff import Tiff
-
-SIGNATURES = (
-    # class, offset, signature_bytes
-    (Png, 0, b"\x89PNG\x0d\x0a\x1a\x0a"),
-    (Jfif, 6, b"JFIF"),
-    (Exif, 6, b"Exif"),
-    (Gif, 0, b"GIF87a"),
-    (Gif, 0, b"GIF89a"),
-    (Tiff, 0, b"MM\x00*"),  # big-endian (Motorola) TIFF
-    (Tiff, 0, b"II*\x00"),  # little-endian (Intel) TIFF
-    (Bmp, 0, b"BM"),
-)
+from __future__ import annotations
+
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    if name != "SIGNATURES":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from skelmis.docx.image.bmp import Bmp
+    from skelmis.docx.image.gif import Gif
+    from skelmis.docx.image.jpeg import Exif, Jfif
+    from skelmis.docx.image.png import Png
+    from skelmis.docx.image.tiff import Tiff
+
+    global SIGNATURES
+    SIGNATURES = (
+        # class, offset, signature_bytes
+        (Png, 0, b"\x89PNG\x0d\x0a\x1a\x0a"),
+        (Jfif, 6, b"JFIF"),
+        (Exif, 6, b"Exif"),
+        (Gif, 0, b"GIF87a"),
+        (Gif, 0, b"GIF89a"),
+        (Tiff, 0, b"MM\x00*"),  # big-endian (Motorola) TIFF
+        (Tiff, 0, b"II*\x00"),  # little-endian (Intel) TIFF
+        (Bmp, 0, b"BM"),
+    )
+    return SIGNATURES
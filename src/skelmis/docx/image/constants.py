@@ -40,6 +40,7 @@ class JPEG_MARKER_CODE:
     DRI = b"\xdd"
     DHP = b"\xde"
     EXP = b"\xdf"
+    COM = b"\xfe"  # Comment
 
     APP0 = b"\xe0"
     APP1 = b"\xe1"
@@ -113,6 +114,8 @@ class PNG_CHUNK_TYPE:
     IHDR = "IHDR"
     pHYs = "pHYs"
     IEND = "IEND"
+    IDAT = "IDAT"
+    acTL = "acTL"
 
 
 class TIFF_FLD_TYPE:
@@ -143,6 +146,7 @@ class TIFF_TAG:
     IMAGE_LENGTH = 0x0101
     X_RESOLUTION = 0x011A
     Y_RESOLUTION = 0x011B
+    ORIENTATION = 0x0112
     RESOLUTION_UNIT = 0x0128
 
     tag_names = {
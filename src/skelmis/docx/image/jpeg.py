@@ -6,6 +6,7 @@ Includes both JFIF and Exif sub-formats.
 import io
 
 from skelmis.docx.image.constants import JPEG_MARKER_CODE, MIME_TYPE
+from skelmis.docx.image.exceptions import UnexpectedEndOfFileError
 from skelmis.docx.image.helpers import BIG_ENDIAN, StreamReader
 from skelmis.docx.image.image import BaseImageHeader
 from skelmis.docx.image.tiff import Tiff
@@ -217,11 +218,11 @@ class _MarkerFinder:
     def _read_byte(self):
         """Return the next byte read from stream.
 
-        Raise Exception if stream is at end of file.
+        Raise |UnexpectedEndOfFileError| if stream is at end of file.
         """
         byte_ = self._stream.read(1)
         if not byte_:  # pragma: no cover
-            raise Exception("unexpected end of file")
+            raise UnexpectedEndOfFileError("unexpected end of file")
         return byte_
 
 
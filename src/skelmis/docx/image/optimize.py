@@ -0,0 +1,218 @@
+"""Lossless size optimization of image blobs, applied to image parts at save time.
+
+PNG images have their image data re-deflated at a higher compression level and their
+metadata-only chunks removed. JPEG images have their metadata segments (Exif, XMP,
+Photoshop, comments, thumbnails) removed. Pixel data is never re-encoded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import struct
+import zlib
+from typing import Dict, List
+
+from skelmis.docx.image.constants import JPEG_MARKER_CODE, MIME_TYPE, PNG_CHUNK_TYPE, TIFF_TAG
+from skelmis.docx.image.exceptions import InvalidImageStreamError, UnexpectedEndOfFileError
+from skelmis.docx.image.helpers import BIG_ENDIAN, StreamReader
+from skelmis.docx.image.jpeg import _App1Marker, _MarkerParser  # pyright: ignore
+from skelmis.docx.image.png import _ChunkParser  # pyright: ignore[reportPrivateUsage]
+from skelmis.docx.image.tiff import _TiffParser  # pyright: ignore[reportPrivateUsage]
+
+_PNG_SIGNATURE = b"\x89PNG\x0d\x0a\x1a\x0a"
+
+# -- raised when parsing a truncated or corrupt image; the parsers read field values
+# -- without validating them, so a garbled value can also raise a `ValueError` or
+# -- `TypeError` further on
+_PARSE_ERRORS = (
+    InvalidImageStreamError,
+    UnexpectedEndOfFileError,
+    struct.error,
+    zlib.error,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+
+# -- ancillary PNG chunks that affect how the image is rendered, or sized in the case of
+# -- `pHYs`, and so are retained. All other ancillary chunks are metadata.
+_PNG_RENDERING_CHUNKS = frozenset(("tRNS", "gAMA", "cHRM", "sRGB", "iCCP", "sBIT", "pHYs"))
+
+# -- JPEG APPn segments that affect rendering are retained: APP0 (JFIF, density), APP2
+# -- (ICC color profile) and APP14 (Adobe color transform).
+_JPEG_METADATA_MARKERS = frozenset(
+    (
+        JPEG_MARKER_CODE.APP1,
+        JPEG_MARKER_CODE.APP3,
+        JPEG_MARKER_CODE.APP4,
+        JPEG_MARKER_CODE.APP5,
+        JPEG_MARKER_CODE.APP6,
+        JPEG_MARKER_CODE.APP7,
+        JPEG_MARKER_CODE.APP8,
+        JPEG_MARKER_CODE.APP9,
+        JPEG_MARKER_CODE.APPA,
+        JPEG_MARKER_CODE.APPB,
+        JPEG_MARKER_CODE.APPC,
+        JPEG_MARKER_CODE.APPD,
+        JPEG_MARKER_CODE.APPF,
+        JPEG_MARKER_CODE.COM,
+    )
+)
+
+
+class MediaOptimizer:
+    """Losslessly reduces the size of PNG and JPEG image blobs.
+
+    Results are cached by the SHA1 digest of the input blob, so an image that appears in
+    many documents, a logo for example, is only optimized once when the same optimizer
+    is used to save each of them. At most `cache_size` results are retained, the oldest
+    being discarded first. A blob that optimization doesn't make smaller is cached by
+    digest alone, so only the blobs actually made smaller are kept in memory.
+    """
+
+    def __init__(self, png_compress_level: int = 9, cache_size: int = 256):
+        self._png_compress_level = png_compress_level
+        self._cache_size = cache_size
+        # -- |None| for a blob that is already as small as optimization makes it --
+        self._cache: Dict[str, bytes | None] = {}
+
+    def optimize(self, blob: bytes, content_type: str) -> bytes:
+        """Return an optimized version of image `blob` having `content_type`.
+
+        `blob` itself is returned when the image is not a PNG or JPEG, cannot be parsed,
+        or when optimization does not make it smaller.
+        """
+        if content_type not in (MIME_TYPE.PNG, MIME_TYPE.JPEG):
+            return blob
+
+        digest = hashlib.sha1(blob).hexdigest()
+        if digest in self._cache:
+            optimized = self._cache[digest]
+            return blob if optimized is None else optimized
+        optimized = self._optimize(blob, content_type)
+        if optimized is blob:
+            self._cache_result(digest, None)
+        else:
+            self._cache_result(digest, optimized)
+            # -- an already-optimized blob is known as such, making a second save cheap --
+            self._cache_result(hashlib.sha1(optimized).hexdigest(), None)
+        return optimized
+
+    def _cache_result(self, digest: str, blob: bytes | None):
+        """Add `blob` to the cache under `digest`, evicting the oldest entry if full."""
+        if digest not in self._cache and len(self._cache) >= self._cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[digest] = blob
+
+    def _optimize(self, blob: bytes, content_type: str) -> bytes:
+        """Return the smaller of `blob` and its optimized form."""
+        try:
+            if content_type == MIME_TYPE.PNG:
+                optimized = _optimize_png(blob, self._png_compress_level)
+            else:
+                optimized = _optimize_jpeg(blob)
+        except _PARSE_ERRORS:
+            # -- optimization is best-effort; an image we can't parse is left as-is --
+            return blob
+        return optimized if len(optimized) < len(blob) else blob
+
+
+def _optimize_png(blob: bytes, compress_level: int) -> bytes:
+    """Return PNG `blob` with metadata chunks removed and image data re-deflated."""
+    if not blob.startswith(_PNG_SIGNATURE):
+        return blob
+    chunk_parser = _ChunkParser.from_stream(io.BytesIO(blob))
+
+    chunks: List[bytes] = []
+    idat_data: List[bytes] = []
+    idat_idx = None
+    for chunk_type, data_offset, data_len in chunk_parser.iter_chunk_spans():
+        # -- animated PNG frame data is spread across chunks we don't rewrite --
+        if chunk_type == PNG_CHUNK_TYPE.acTL:
+            return blob
+        if chunk_type == PNG_CHUNK_TYPE.IDAT:
+            if idat_idx is None:
+                idat_idx = len(chunks)
+            idat_data.append(blob[data_offset : data_offset + data_len])
+            continue
+        # -- critical chunks have an uppercase first letter --
+        if chunk_type[0].islower() and chunk_type not in _PNG_RENDERING_CHUNKS:
+            continue
+        chunks.append(blob[data_offset - 8 : data_offset + data_len + 4])
+
+    if idat_idx is None:
+        return blob
+    raw = zlib.decompress(b"".join(idat_data))
+    chunks.insert(idat_idx, _png_chunk(b"IDAT", zlib.compress(raw, compress_level)))
+    return _PNG_SIGNATURE + b"".join(chunks)
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Return serialized PNG chunk of `chunk_type` containing `data`."""
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack(">L", len(data)) + chunk_type + data + struct.pack(">L", crc)
+
+
+def _optimize_jpeg(blob: bytes) -> bytes:
+    """Return JPEG `blob` with metadata segments removed.
+
+    Only the segments preceding the first start-of-scan (SOS) marker are examined; the
+    entropy-coded image data that follows is copied unchanged.
+    """
+    stream = StreamReader(io.BytesIO(blob), BIG_ENDIAN)
+    marker_parser = _MarkerParser(stream)
+
+    segments: List[bytes] = []
+    has_jfif = False
+    exif_dpi = None
+    for marker in marker_parser.iter_markers():
+        marker_code = marker.marker_code
+        start, end = marker.offset - 2, marker.offset + marker.segment_length
+        if marker_code == JPEG_MARKER_CODE.SOI:
+            continue
+        if marker_code == JPEG_MARKER_CODE.SOS:
+            segments.append(blob[start:])
+            break
+        if marker_code == JPEG_MARKER_CODE.APP0:
+            if blob[marker.offset + 2 : marker.offset + 7] != b"JFIF\x00" or has_jfif:
+                continue  # -- JFXX thumbnail extension --
+            has_jfif = True
+            segments.append(_jfif_app0(blob[marker.offset + 9 : marker.offset + 14]))
+            continue
+        if marker_code == JPEG_MARKER_CODE.APP1 and isinstance(marker, _App1Marker):
+            if _exif_orientation(stream, marker.offset, marker.segment_length) != 1:
+                # -- removing a rotation would change how the image is displayed --
+                segments.append(blob[start:end])
+                continue
+            if exif_dpi is None:
+                exif_dpi = (marker.horz_dpi, marker.vert_dpi)
+        if marker_code in _JPEG_METADATA_MARKERS:
+            continue
+        segments.append(blob[start:end])
+
+    # -- an image recognized only by its Exif segment gets a JFIF one in its place --
+    if not has_jfif and exif_dpi is not None and blob[6:10] == b"Exif":
+        horz_dpi, vert_dpi = exif_dpi
+        segments.insert(0, _jfif_app0(struct.pack(">BHH", 1, horz_dpi, vert_dpi)))
+    return b"\xff\xd8" + b"".join(segments)
+
+
+def _exif_orientation(stream: StreamReader, offset: int, segment_length: int) -> int:
+    """Return the Exif orientation value in the APP1 segment at `offset`, 1 if absent."""
+    stream.seek(offset + 2)
+    if stream.read(6) != b"Exif\x00\x00":
+        return 1
+    stream.seek(offset + 8)
+    substream = io.BytesIO(stream.read(segment_length - 8))
+    tiff_parser = _TiffParser.parse(substream)
+    return tiff_parser._ifd_entries.get(TIFF_TAG.ORIENTATION, 1)  # pyright: ignore
+
+
+def _jfif_app0(density: bytes) -> bytes:
+    """Return a thumbnail-free JFIF APP0 segment having 5-byte `density` field.
+
+    `density` is the density-units byte followed by the horizontal and vertical density
+    as big-endian shorts, as it appears at offset 9 in a JFIF APP0 segment.
+    """
+    return b"\xff\xe0\x00\x10JFIF\x00\x01\x01" + density + b"\x00\x00"
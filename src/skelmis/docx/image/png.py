@@ -147,6 +147,22 @@ class _ChunkParser:
             chunk = _ChunkFactory(chunk_type, self._stream_rdr, offset)
             yield chunk
 
+    def iter_chunk_spans(self):
+        """Generate a (chunk_type, data_offset, data_len) 3-tuple for each of the chunks
+        in the PNG image stream.
+
+        Unlike |iter_chunks|, chunk data is not interpreted, which allows a chunk to be
+        copied verbatim from the stream. Iteration stops after the IEND chunk.
+        """
+        chunk_offset = 8
+        while True:
+            chunk_data_len = self._stream_rdr.read_long(chunk_offset)
+            chunk_type = self._stream_rdr.read_str(4, chunk_offset, 4)
+            yield chunk_type, chunk_offset + 8, chunk_data_len
+            if chunk_type == "IEND":
+                break
+            chunk_offset += 4 + 4 + chunk_data_len + 4
+
     def _iter_chunk_offsets(self):
         """Generate a (chunk_type, chunk_offset) 2-tuple for each of the chunks in the
         PNG image stream.
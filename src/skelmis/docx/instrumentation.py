@@ -0,0 +1,177 @@
+"""Opt-in instrumentation of the time spent opening and saving documents.
+
+A listener is a callable receiving an |Event| for each step of loading or saving a
+package. Listeners are global to the process. While none is registered, instrumented code
+pays for a single module-attribute check::
+
+    with instrumentation.timing() as report:
+        document = Document("slow.docx")
+    print(report)
+
+The phases reported are:
+
+``"open"``, ``"save"``
+    The whole of loading or saving a package.
+``"read"``
+    Reading a member from the package file. `bytes_in` is its compressed size.
+``"parse"``
+    Parsing the XML of a part or of a part's relationships.
+``"unmarshal_parts"``, ``"unmarshal_relationships"``
+    Constructing all the parts, including their "parse" events, and then linking them
+    with their relationships.
+``"after_unmarshal"``
+    Post-load processing of each part, and of the package itself, which is when image
+    parts are gathered. The event for the package has no `partname`.
+``"serialize"``
+    Serializing the XML of a part.
+``"write"``
+    Compressing and writing a member to the package file. `bytes_out` is its compressed
+    size.
+
+Events nest, "read" events happen within "open" for example, so totals over phases count
+some time more than once.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+
+#: True while at least one listener is registered. Instrumented code tests this before
+#: taking any timing.
+enabled = False
+
+_listeners: List[Callable[[Event], None]] = []
+
+
+class Event:
+    """A single timed step of loading or saving a package.
+
+    `partname` is the |PackURI| of the part or package member the step worked on, or
+    |None| for a step on the package as a whole. `bytes_in` and `bytes_out` are the sizes
+    of what the step consumed and produced, 0 when not meaningful for the phase.
+    """
+
+    def __init__(
+        self, phase: str, partname: str | None, bytes_in: int, bytes_out: int, elapsed_ns: int
+    ):
+        self.phase = phase
+        self.partname = partname
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+        self.elapsed_ns = elapsed_ns
+
+    def __repr__(self) -> str:
+        return (
+            f"<Event {self.phase} {self.partname or '-'} in={self.bytes_in}"
+            f" out={self.bytes_out} {self.elapsed_ns / 1e6:.3f}ms>"
+        )
+
+
+def add_listener(listener: Callable[[Event], None]):
+    """Call `listener` with each |Event| from now on."""
+    global enabled
+    _listeners.append(listener)
+    enabled = True
+
+
+def remove_listener(listener: Callable[[Event], None]):
+    """Stop calling `listener`, which must have been added with :func:`add_listener`."""
+    global enabled
+    _listeners.remove(listener)
+    enabled = bool(_listeners)
+
+
+def emit(phase: str, partname: str | None, bytes_in: int, bytes_out: int, start_ns: int):
+    """Send an |Event| for a step started at `start_ns` to each listener.
+
+    `start_ns` is a :func:`time.perf_counter_ns` value taken when the step started.
+    """
+    event = Event(phase, partname, bytes_in, bytes_out, time.perf_counter_ns() - start_ns)
+    for listener in list(_listeners):
+        listener(event)
+
+
+@contextmanager
+def listening(listener: Callable[[Event], None]) -> Iterator[Callable[[Event], None]]:
+    """Context manager calling `listener` with each |Event| occurring within its body."""
+    add_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+@contextmanager
+def timing() -> Iterator[TimingReport]:
+    """Context manager providing a |TimingReport| of the events occurring within its body."""
+    with listening(TimingReport()) as report:
+        yield report  # pyright: ignore[reportReturnType]
+
+
+class _Total:
+    """Running totals of the events of one phase, or of one phase of one part."""
+
+    def __init__(self):
+        self.count = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.elapsed_ns = 0
+
+    def add(self, event: Event):
+        self.count += 1
+        self.bytes_in += event.bytes_in
+        self.bytes_out += event.bytes_out
+        self.elapsed_ns += event.elapsed_ns
+
+
+class TimingReport:
+    """Listener aggregating events into totals per phase and per part.
+
+    Its string form is a table of the totals of each phase followed by the parts that took
+    the longest.
+    """
+
+    def __init__(self):
+        self.events: List[Event] = []
+        self._phases: Dict[str, _Total] = {}
+        self._parts: Dict[str, Dict[str, _Total]] = {}
+
+    def __call__(self, event: Event):
+        self.events.append(event)
+        self._phases.setdefault(event.phase, _Total()).add(event)
+        if event.partname is not None:
+            part_phases = self._parts.setdefault(event.partname, {})
+            part_phases.setdefault(event.phase, _Total()).add(event)
+
+    def __str__(self) -> str:
+        return self.format()
+
+    def elapsed_ns(self, phase: str, partname: str | None = None) -> int:
+        """Total nanoseconds spent in `phase`, for `partname` only when given."""
+        totals = self._phases if partname is None else self._parts.get(partname, {})
+        total = totals.get(phase)
+        return 0 if total is None else total.elapsed_ns
+
+    def format(self, parts: int = 10) -> str:
+        """Return the report as text, listing the `parts` parts that took the longest."""
+        lines = [f"{'phase':<24} {'count':>6} {'bytes in':>12} {'bytes out':>12} {'ms':>10}"]
+        for phase, total in sorted(self._phases.items(), key=lambda item: -item[1].elapsed_ns):
+            lines.append(
+                f"{phase:<24} {total.count:>6} {total.bytes_in:>12} {total.bytes_out:>12}"
+                f" {total.elapsed_ns / 1e6:>10.3f}"
+            )
+
+        def part_ns(item: tuple[str, Dict[str, _Total]]) -> int:
+            return sum(total.elapsed_ns for total in item[1].values())
+
+        slowest = sorted(self._parts.items(), key=part_ns, reverse=True)[:parts]
+        if slowest:
+            lines.extend(["", f"{'part':<40} {'ms':>10}  phases"])
+        for partname, phases in slowest:
+            detail = ", ".join(
+                f"{phase} {total.elapsed_ns / 1e6:.3f}" for phase, total in phases.items()
+            )
+            lines.append(f"{partname:<40} {part_ns((partname, phases)) / 1e6:>10.3f}  {detail}")
+        return "\n".join(lines)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import time
 from typing import IO, TYPE_CHECKING, Iterator, cast
 
+from skelmis.docx import instrumentation
 from skelmis.docx.opc.constants import RELATIONSHIP_TYPE as RT
 from skelmis.docx.opc.packuri import PACKAGE_URI, PackURI
 from skelmis.docx.opc.part import PartFactory
@@ -49,9 +51,9 @@ class OpcPackage:
         performing a depth-first traversal of the rels graph."""
 
         def walk_rels(
-            source: OpcPackage | Part, visited: list[Part] | None = None
+            source: OpcPackage | Part, visited: set[Part] | None = None
         ) -> Iterator[_Relationship]:
-            visited = [] if visited is None else visited
+            visited = set() if visited is None else visited
             for rel in source.rels.values():
                 yield rel
                 if rel.is_external:
@@ -59,7 +61,7 @@ class OpcPackage:
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 new_source = part
                 for rel in walk_rels(new_source, visited):
                     yield rel
@@ -71,14 +73,14 @@ class OpcPackage:
         """Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph."""
 
-        def walk_parts(source, visited=[]):
+        def walk_parts(source, visited=set()):
             for rel in source.rels.values():
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 yield part
                 new_source = part
                 for part in walk_parts(new_source, visited):
@@ -124,9 +126,12 @@ class OpcPackage:
     @classmethod
     def open(cls, pkg_file: str | IO[bytes]) -> OpcPackage:
         """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
+        start = time.perf_counter_ns() if instrumentation.enabled else 0
         pkg_reader = PackageReader.from_file(pkg_file)
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        if instrumentation.enabled:
+            instrumentation.emit("open", None, 0, 0, start)
         return package
 
     def part_related_by(self, reltype: str) -> Part:
@@ -157,14 +162,51 @@ class OpcPackage:
         relationships for this package."""
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file: str | IO[bytes]):
+    def clone(self) -> OpcPackage:
+        """Return an independent copy of this package.
+
+        Each part is copied with :meth:`Part.clone`, so changing the copy leaves this
+        package unchanged. Much faster than saving this package and opening it again,
+        since no XML is serialized or parsed.
+        """
+        package = type(self)()
+        parts = {part: part.clone(package) for part in self.iter_parts()}
+        sources: list[tuple[OpcPackage | Part, OpcPackage | Part]] = [(self, package)]
+        sources.extend(parts.items())
+        for source, copied_source in sources:
+            for rel in source.rels.values():
+                target = rel.target_ref if rel.is_external else parts[rel.target_part]
+                copied_source.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+        for part in parts.values():
+            part.after_unmarshal()
+        package.after_unmarshal()
+        return package
+
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the content of this package.
+
+        It is the digest of what a deterministic :meth:`save` would write, so it is
+        independent of save time and platform. Partnames and relationship ids are part of
+        the content, so packages built by adding the same parts in a different order may
+        have different digests.
+        """
+        parts = self.parts
+        for part in parts:
+            part.before_marshal()
+        return PackageWriter.digest(self.rels, parts)
+
+    def save(self, pkg_file: str | IO[bytes], deterministic: bool = False):
         """Save this package to `pkg_file`.
 
-        `pkg_file` can be either a file-path or a file-like object.
+        `pkg_file` can be either a file-path or a file-like object. When `deterministic`
+        is True, the output is independent of save time and platform.
         """
+        start = time.perf_counter_ns() if instrumentation.enabled else 0
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        PackageWriter.write(pkg_file, self.rels, self.parts, deterministic)
+        if instrumentation.enabled:
+            instrumentation.emit("save", None, 0, 0, start)
 
     @property
     def _core_properties_part(self) -> CorePropertiesPart:
@@ -190,11 +232,31 @@ class Unmarshaller:
 
         Package relationships are added to `pkg`.
         """
+        if instrumentation.enabled:
+            Unmarshaller._unmarshal_instrumented(pkg_reader, package, part_factory)
+            return
+        parts = Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory)
+        Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
+        for part in parts.values():
+            part.after_unmarshal()
+        package.after_unmarshal()
+
+    @staticmethod
+    def _unmarshal_instrumented(pkg_reader, package, part_factory):
+        """Same as :meth:`unmarshal`, emitting an instrumentation event for each step."""
+        start = time.perf_counter_ns()
         parts = Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory)
+        instrumentation.emit("unmarshal_parts", None, 0, 0, start)
+        start = time.perf_counter_ns()
         Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
+        instrumentation.emit("unmarshal_relationships", None, 0, 0, start)
         for part in parts.values():
+            start = time.perf_counter_ns()
             part.after_unmarshal()
+            instrumentation.emit("after_unmarshal", part.partname, 0, 0, start)
+        start = time.perf_counter_ns()
         package.after_unmarshal()
+        instrumentation.emit("after_unmarshal", None, 0, 0, start)
 
     @staticmethod
     def _unmarshal_parts(pkg_reader, package, part_factory):
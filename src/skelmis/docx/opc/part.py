@@ -4,8 +4,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Type, cast
+import copy
+import time
+from typing import IO, TYPE_CHECKING, Callable, Type, cast
 
+from skelmis.docx import instrumentation
 from skelmis.docx.opc.oxml import serialize_part_xml
 from skelmis.docx.opc.packuri import PackURI
 from skelmis.docx.opc.rel import Relationships
@@ -67,6 +70,26 @@ class Part:
         """
         return self._blob or b""
 
+    @property
+    def streams_blob(self) -> bool:
+        """True when this part is saved with :meth:`write_blob` rather than from :attr:`blob`.
+
+        Overridden by a part whose saved content may be too large to hold in memory at
+        once.
+        """
+        return False
+
+    def write_blob(self, stream: IO[bytes]):
+        """Write the contents of this part to `stream`, as saved in a package."""
+        stream.write(self.blob)
+
+    def clone(self, package: Package) -> Part:
+        """Return a copy of this part belonging to `package`, without its relationships.
+
+        The copy shares the blob of this part, which is immutable.
+        """
+        return type(self).load(self.partname, self.content_type, self.blob, package)
+
     @property
     def content_type(self):
         """Content type of this part."""
@@ -215,11 +238,42 @@ class XmlPart(Part):
         self, partname: PackURI, content_type: str, element: BaseOxmlElement, package: Package
     ):
         super(XmlPart, self).__init__(partname, content_type, package=package)
-        self._element = element
+        self._parsed_element: BaseOxmlElement | None = element
+        self._unparsed_blob: bytes | None = None
 
     @property
     def blob(self):
-        return serialize_part_xml(self._element)
+        if self._unparsed_blob is not None:
+            return self._unparsed_blob
+        if not instrumentation.enabled:
+            return serialize_part_xml(self._element)
+        start = time.perf_counter_ns()
+        blob = serialize_part_xml(self._element)
+        instrumentation.emit("serialize", self.partname, 0, len(blob), start)
+        return blob
+
+    def clone(self, package: Package) -> XmlPart:
+        """Return a copy of this part belonging to `package`, without its relationships.
+
+        The XML of the copy is a deep copy of this part's element, which is much faster
+        than serializing and parsing it again. When parsing of this part is deferred, the
+        copy shares its blob instead and is parsed only if its element is used.
+        """
+        if self._unparsed_blob is not None:
+            return type(self).load_deferred(
+                self.partname, self.content_type, self._unparsed_blob, package
+            )
+        return type(self)(self.partname, self.content_type, copy.deepcopy(self._element), package)
+
+    def defer_parsing(self):
+        """Replace the element of this part by its serialized XML, parsed again on next use.
+
+        Copies made by :meth:`clone` then share that XML, so a part that is not changed in
+        a copy costs nothing to copy or save. Objects obtained from the element before the
+        call no longer affect this part.
+        """
+        self._unparsed_blob = self.blob
+        self._parsed_element = None
 
     @property
     def element(self):
@@ -228,9 +282,24 @@ class XmlPart(Part):
 
     @classmethod
     def load(cls, partname: PackURI, content_type: str, blob: bytes, package: Package):
+        if not instrumentation.enabled:
+            return cls(partname, content_type, parse_xml(blob), package)
+        start = time.perf_counter_ns()
         element = parse_xml(blob)
+        instrumentation.emit("parse", partname, len(blob), 0, start)
         return cls(partname, content_type, element, package)
 
+    @classmethod
+    def load_deferred(cls, partname: PackURI, content_type: str, blob: bytes, package: Package):
+        """Return a part like :meth:`load` does, but parsing `blob` only when first used.
+
+        Until then the part is saved as `blob` itself. The part is constructed without an
+        element, so the `__init__()` of a subclass must not use it.
+        """
+        part = cls(partname, content_type, cast("BaseOxmlElement", None), package)
+        part._unparsed_blob = blob
+        return part
+
     @property
     def part(self):
         """Part of the parent protocol, "children" of the document will not know the
@@ -240,6 +309,15 @@ class XmlPart(Part):
         """
         return self
 
+    @property
+    def _element(self) -> BaseOxmlElement:
+        """The root XML element of this part, parsed from its blob on first use if deferred."""
+        element = self._parsed_element
+        if element is None:
+            element = self._parsed_element = parse_xml(cast(bytes, self._unparsed_blob))
+            self._unparsed_blob = None
+        return element
+
     def _rel_ref_count(self, rId: str) -> int:
         """Return the count of references in this part's XML to the relationship
         identified by `rId`."""
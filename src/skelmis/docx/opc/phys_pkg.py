@@ -1,11 +1,17 @@
 """Provides a general interface to a `physical` OPC package, such as a zip file."""
 
+import contextlib
 import os
-from zipfile import ZIP_DEFLATED, ZipFile, is_zipfile
+import time
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo, is_zipfile
 
+from skelmis.docx import instrumentation
 from skelmis.docx.opc.exceptions import PackageNotFoundError
 from skelmis.docx.opc.packuri import CONTENT_TYPES_URI
 
+# -- earliest timestamp a zip archive can record, used for reproducible output --
+_FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
 
 class PhysPkgReader:
     """Factory for physical package reader objects."""
@@ -28,7 +34,7 @@ class PhysPkgReader:
 class PhysPkgWriter:
     """Factory for physical package writer objects."""
 
-    def __new__(cls, pkg_file):
+    def __new__(cls, pkg_file, deterministic=False):
         return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
 
 
@@ -80,7 +86,13 @@ class _ZipPkgReader(PhysPkgReader):
 
         Raises |ValueError| if no matching member is present in zip archive.
         """
-        return self._zipf.read(pack_uri.membername)
+        if not instrumentation.enabled:
+            return self._zipf.read(pack_uri.membername)
+        start = time.perf_counter_ns()
+        blob = self._zipf.read(pack_uri.membername)
+        compress_size = self._zipf.getinfo(pack_uri.membername).compress_size
+        instrumentation.emit("read", pack_uri, compress_size, len(blob), start)
+        return blob
 
     def close(self):
         """Close the zip archive, releasing any resources it is using."""
@@ -104,9 +116,10 @@ class _ZipPkgReader(PhysPkgReader):
 class _ZipPkgWriter(PhysPkgWriter):
     """Implements |PhysPkgWriter| interface for a zip file OPC package."""
 
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, deterministic=False):
         super(_ZipPkgWriter, self).__init__()
         self._zipf = ZipFile(pkg_file, "w", compression=ZIP_DEFLATED)
+        self._deterministic = deterministic
 
     def close(self):
         """Close the zip archive, flushing any pending physical writes and releasing any
@@ -115,5 +128,46 @@ class _ZipPkgWriter(PhysPkgWriter):
 
     def write(self, pack_uri, blob):
         """Write `blob` to this zip package with the membername corresponding to
-        `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+        `pack_uri`.
+
+        When this writer is deterministic, the member is given a fixed timestamp and
+        file attributes so the archive does not depend on when or where it is written.
+        """
+        start = time.perf_counter_ns() if instrumentation.enabled else 0
+        self._zipf.writestr(self._zinfo(pack_uri), blob)
+        if instrumentation.enabled:
+            compress_size = self._zipf.filelist[-1].compress_size
+            instrumentation.emit("write", pack_uri, len(blob), compress_size, start)
+
+    @contextlib.contextmanager
+    def open(self, pack_uri):
+        """Context manager providing a binary stream to write the member for `pack_uri` to.
+
+        For content too large to hold in memory as a single blob; it is compressed as it
+        is written. The member may exceed the 4 GiB limit of a plain zip archive.
+        """
+        start = time.perf_counter_ns() if instrumentation.enabled else 0
+        with self._zipf.open(self._zinfo(pack_uri), "w", force_zip64=True) as stream:
+            yield stream
+        if instrumentation.enabled:
+            zinfo = self._zipf.filelist[-1]
+            instrumentation.emit("write", pack_uri, zinfo.file_size, zinfo.compress_size, start)
+
+    def _zinfo(self, pack_uri):
+        """The zip member info for `pack_uri`.
+
+        When this writer is deterministic, the member is given a fixed timestamp and file
+        attributes so the archive does not depend on when or where it is written.
+        Otherwise it has the current time and the attributes `ZipFile.writestr()` gives a
+        member named by a str.
+        """
+        if not self._deterministic:
+            zinfo = ZipInfo(pack_uri.membername, date_time=time.localtime(time.time())[:6])
+            zinfo.compress_type = ZIP_DEFLATED
+            zinfo.external_attr = 0o600 << 16
+            return zinfo
+        zinfo = ZipInfo(pack_uri.membername, date_time=_FIXED_DATE_TIME)
+        zinfo.compress_type = ZIP_DEFLATED
+        zinfo.create_system = 3
+        zinfo.external_attr = 0o644 << 16
+        return zinfo
@@ -1,5 +1,8 @@
 """Low-level, read-only API to a serialized Open Packaging Convention (OPC) package."""
 
+import time
+
+from skelmis.docx import instrumentation
 from skelmis.docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from skelmis.docx.opc.oxml import parse_xml
 from skelmis.docx.opc.packuri import PACKAGE_URI, PackURI
@@ -59,7 +62,12 @@ class PackageReader:
         """Return |_SerializedRelationships| instance populated with relationships for
         source identified by `source_uri`."""
         rels_xml = phys_reader.rels_xml_for(source_uri)
-        return _SerializedRelationships.load_from_xml(source_uri.baseURI, rels_xml)
+        if not instrumentation.enabled or rels_xml is None:
+            return _SerializedRelationships.load_from_xml(source_uri.baseURI, rels_xml)
+        start = time.perf_counter_ns()
+        srels = _SerializedRelationships.load_from_xml(source_uri.baseURI, rels_xml)
+        instrumentation.emit("parse", source_uri.rels_uri, len(rels_xml), 0, start)
+        return srels
 
     @staticmethod
     def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
@@ -6,6 +6,7 @@ OpcPackage.save().
 
 from __future__ import annotations
 
+import hashlib
 from typing import TYPE_CHECKING, Iterable
 
 from skelmis.docx.opc.constants import CONTENT_TYPE as CT
@@ -28,15 +29,46 @@ class PackageWriter:
     """
 
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, deterministic=False):
         """Write a physical package (.pptx file) to `pkg_file` containing `pkg_rels` and
-        `parts` and a content types stream based on the content types of the parts."""
-        phys_writer = PhysPkgWriter(pkg_file)
+        `parts` and a content types stream based on the content types of the parts.
+
+        When `deterministic` is True, parts are written in partname order, relationships
+        in rId order and zip members with a fixed timestamp, so the file written is
+        independent of save time and platform.
+        """
+        phys_writer = PhysPkgWriter(pkg_file, deterministic)
+        if deterministic:
+            parts = sorted(parts, key=lambda part: part.partname)
         PackageWriter._write_content_types_stream(phys_writer, parts)
-        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, pkg_rels, deterministic)
+        PackageWriter._write_parts(phys_writer, parts, deterministic)
         phys_writer.close()
 
+    @staticmethod
+    def digest(pkg_rels, parts) -> str:
+        """SHA-256 hex digest of the package a deterministic :meth:`write` would produce.
+
+        The digest is computed over the uncompressed member names and content, so it
+        does not depend on the zip format.
+        """
+        sha256 = hashlib.sha256()
+
+        def add(pack_uri: str, blob: bytes | str):
+            data = blob.encode("utf-8") if isinstance(blob, str) else blob
+            for item in (pack_uri.encode("utf-8"), data):
+                sha256.update(len(item).to_bytes(8, "big"))
+                sha256.update(item)
+
+        parts = sorted(parts, key=lambda part: part.partname)
+        add(CONTENT_TYPES_URI, _ContentTypesItem.from_parts(parts).blob)
+        add(PACKAGE_URI.rels_uri, pkg_rels.sorted_xml)
+        for part in parts:
+            add(part.partname, part.blob)
+            if len(part.rels):
+                add(part.partname.rels_uri, part.rels.sorted_xml)
+        return sha256.hexdigest()
+
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
         """Write ``[Content_Types].xml`` part to the physical package with an
@@ -45,18 +77,26 @@ class PackageWriter:
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer: PhysPkgWriter, parts: Iterable[Part]):
+    def _write_parts(
+        phys_writer: PhysPkgWriter, parts: Iterable[Part], deterministic: bool = False
+    ):
         """Write the blob of each part in `parts` to the package, along with a rels item
         for its relationships if and only if it has any."""
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            if part.streams_blob:
+                with phys_writer.open(part.partname) as stream:
+                    part.write_blob(stream)
+            else:
+                phys_writer.write(part.partname, part.blob)
             if len(part.rels):
-                phys_writer.write(part.partname.rels_uri, part.rels.xml)
+                rels_xml = part.rels.sorted_xml if deterministic else part.rels.xml
+                phys_writer.write(part.partname.rels_uri, rels_xml)
 
     @staticmethod
-    def _write_pkg_rels(phys_writer, pkg_rels):
+    def _write_pkg_rels(phys_writer, pkg_rels, deterministic=False):
         """Write the XML rels item for `pkg_rels` ('/_rels/.rels') to the package."""
-        phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
+        rels_xml = pkg_rels.sorted_xml if deterministic else pkg_rels.xml
+        phys_writer.write(PACKAGE_URI.rels_uri, rels_xml)
 
 
 class _ContentTypesItem:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, cast
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Tuple, cast
 
 from skelmis.docx.opc.oxml import CT_Relationships
 
@@ -62,10 +63,16 @@ class Relationships(Dict[str, "_Relationship"]):
     def xml(self) -> str:
         """Serialize this relationship collection into XML suitable for storage as a
         .rels file in an OPC package."""
-        rels_elm = CT_Relationships.new()
-        for rel in self.values():
-            rels_elm.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
-        return rels_elm.xml
+        return self._xml_for(self.values())
+
+    @property
+    def sorted_xml(self) -> str:
+        """Serialize this relationship collection like :attr:`xml`, but in rId order.
+
+        `rId2` sorts before `rId10`. The result does not depend on the order in which
+        relationships were added, so equivalent collections serialize identically.
+        """
+        return self._xml_for(sorted(self.values(), key=_rId_sort_key))
 
     def _get_matching(
         self, reltype: str, target: Part | str, is_external: bool = False
@@ -103,6 +110,13 @@ class Relationships(Dict[str, "_Relationship"]):
             raise ValueError(tmpl % reltype)
         return matching[0]
 
+    @staticmethod
+    def _xml_for(rels: Iterable[_Relationship]) -> str:
+        rels_elm = CT_Relationships.new()
+        for rel in rels:
+            rels_elm.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
+        return rels_elm.xml
+
     @property
     def _next_rId(self) -> str:  # pyright: ignore[reportReturnType]
         """Next available rId in collection, starting from 'rId1' and making use of any
@@ -153,3 +167,11 @@ class _Relationship:
         else:
             target = cast("Part", self._target)
             return target.partname.relative_ref(self._baseURI)
+
+
+def _rId_sort_key(rel: _Relationship) -> Tuple[str, int, str]:
+    """Sort key placing "rId2" before "rId10"; rIds not of that form sort by string."""
+    match = re.fullmatch(r"(\D*)(\d+)", rel.rId)
+    if match is None:
+        return (rel.rId, -1, "")
+    return (match.group(1), int(match.group(2)), rel.rId)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable, List
 
-from skelmis.docx.oxml.section import CT_SectPr
+from skelmis.docx.oxml.section import CT_SectPr, SectionIndex
 from skelmis.docx.oxml.xmlchemy import BaseOxmlElement, ZeroOrMore, ZeroOrOne
 
 if TYPE_CHECKING:
@@ -28,8 +28,7 @@ class CT_Document(BaseOxmlElement):
         `w:sectPr` elements appear in document order. The last one is always
         `w:body/w:sectPr`, all preceding are `w:p/w:pPr/w:sectPr`.
         """
-        xpath = "./w:body/w:p/w:pPr/w:sectPr | ./w:body/w:sectPr"
-        return self.xpath(xpath)
+        return SectionIndex.for_document(self).sectPrs
 
 
 class CT_Body(BaseOxmlElement):
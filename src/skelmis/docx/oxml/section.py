@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
+import weakref
 from copy import deepcopy
-from typing import Callable, Iterator, List, Sequence, cast
-
-from lxml import etree
-from typing_extensions import TypeAlias
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TypeAlias, cast
 
 from skelmis.docx.enum.section import WD_HEADER_FOOTER, WD_ORIENTATION, WD_SECTION_START
-from skelmis.docx.oxml.ns import nsmap
+from skelmis.docx.oxml.ns import qn
 from skelmis.docx.oxml.shared import CT_OnOff
 from skelmis.docx.oxml.simpletypes import ST_SignedTwipsMeasure, ST_TwipsMeasure, XsdString
 from skelmis.docx.oxml.table import CT_Tbl
@@ -21,7 +19,7 @@ from skelmis.docx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
 )
-from skelmis.docx.shared import Length, lazyproperty
+from skelmis.docx.shared import Length
 
 BlockElement: TypeAlias = "CT_P | CT_Tbl"
 
@@ -266,7 +264,8 @@ class CT_SectPr(BaseOxmlElement):
         Elements appear in document order. Elements shaded by nesting in a `w:ins` or
         other "wrapper" element will not be included.
         """
-        return _SectBlockElementIterator.iter_sect_block_elements(self)
+        document_elm = self.getroottree().getroot()
+        return SectionIndex.for_document(document_elm).iter_sect_block_elements(self)
 
     @property
     def left_margin(self) -> Length | None:
@@ -434,104 +433,154 @@ class CT_SectType(BaseOxmlElement):
 # == HELPERS =========================================================================
 
 
-class _SectBlockElementIterator:
-    """Generates the block-item XML elements in a section.
+class SectionIndex:
+    """Maps each section in a document to the block-items (ps and tbls) it contains.
 
-    A block-item element is a `CT_P` (paragraph) or a `CT_Tbl` (table).
+    The index is built in a single pass over the children of `w:body` and cached per
+    document element, so section lookup and per-section iteration don't rescan the
+    body. On each access only the number of body children and the children from the last
+    indexed block to the end of the body are checked. Blocks appended at the end of the
+    body, including the `w:p` added for a new section break, are indexed incrementally;
+    any other change seen that way causes a rebuild. An edit leaving both unchanged, like
+    replacing a block one-for-one or adding a `w:sectPr` to an existing paragraph, cannot
+    be seen; call `discard()` after such an edit.
     """
 
-    _compiled_blocks_xpath: etree.XPath | None = None
-    _compiled_count_xpath: etree.XPath | None = None
+    _indexes: weakref.WeakKeyDictionary[BaseOxmlElement, SectionIndex] = weakref.WeakKeyDictionary()
+
+    def __init__(self):
+        self._body: BaseOxmlElement | None = None
+        self._n_children = 0
+        self._blocks: List[BlockElement] = []
+        self._trailing: List[BaseOxmlElement] = []
+        self._p_sectPrs: List[CT_SectPr] = []
+        self._p_sectPr_ends: List[int] = []
+        self._ordinals: Dict[CT_SectPr, int] = {}
+        self._sentinel_sectPr: CT_SectPr | None = None
 
-    def __init__(self, sectPr: CT_SectPr):
-        self._sectPr = sectPr
+    @classmethod
+    def discard(cls, document_elm: BaseOxmlElement):
+        """Drop any cached index for `document_elm`, causing a rebuild on next access."""
+        cls._indexes.pop(document_elm, None)
 
     @classmethod
-    def iter_sect_block_elements(cls, sectPr: CT_SectPr) -> Iterator[BlockElement]:
+    def for_document(cls, document_elm: BaseOxmlElement) -> SectionIndex:
+        """The up-to-date index for the `w:document` element `document_elm`."""
+        index = cls._indexes.get(document_elm)
+        if index is None:
+            index = cls._indexes[document_elm] = cls()
+        index._refresh(document_elm.find(qn("w:body")))
+        return index
+
+    def iter_sect_block_elements(self, sectPr: CT_SectPr) -> Iterator[BlockElement]:
         """Generate each CT_P or CT_Tbl element within extents governed by `sectPr`."""
-        return cls(sectPr)._iter_sect_block_elements()
-
-    def _iter_sect_block_elements(self) -> Iterator[BlockElement]:
-        """Generate each CT_P or CT_Tbl element in section."""
-        # -- General strategy is to get all block (<w;p> and <w:tbl>) elements from
-        # -- start of doc to and including this section, then compute the count of those
-        # -- elements that came from prior sections and skip that many to leave only the
-        # -- ones in this section. It's possible to express this "between here and
-        # -- there" (end of prior section and end of this one) concept in XPath, but it
-        # -- would be harder to follow because there are special cases (e.g. no prior
-        # -- section) and the boundary expressions are fairly hairy. I also believe it
-        # -- would be computationally more expensive than doing it this straighforward
-        # -- albeit (theoretically) slightly wasteful way.
-
-        sectPr, sectPrs = self._sectPr, self._sectPrs
-        sectPr_idx = sectPrs.index(sectPr)
-
-        # -- count block items belonging to prior sections --
-        n_blks_to_skip = (
-            0
-            if sectPr_idx == 0
-            else self._count_of_blocks_in_and_above_section(sectPrs[sectPr_idx - 1])
-        )
+        if sectPr is self._sentinel_sectPr:
+            start = self._p_sectPr_ends[-1] if self._p_sectPr_ends else 0
+            return iter(self._blocks[start:])
+        ordinal = self._ordinals.get(sectPr)
+        if ordinal is None:
+            return iter(())
+        start = self._p_sectPr_ends[ordinal - 1] if ordinal else 0
+        return iter(self._blocks[start : self._p_sectPr_ends[ordinal]])
 
-        # -- and skip those in set of all blks from doc start to end of this section --
-        for element in self._blocks_in_and_above_section(sectPr)[n_blks_to_skip:]:
-            yield element
-
-    def _blocks_in_and_above_section(self, sectPr: CT_SectPr) -> Sequence[BlockElement]:
-        """All ps and tbls in section defined by `sectPr` and all prior sections."""
-        if self._compiled_blocks_xpath is None:
-            self._compiled_blocks_xpath = etree.XPath(
-                self._blocks_in_and_above_section_xpath,
-                namespaces=nsmap,
-                regexp=False,
-            )
-        xpath = self._compiled_blocks_xpath
-        # -- XPath callable results are Any (basically), so need a cast. --
-        return cast(Sequence[BlockElement], xpath(sectPr))
-
-    @lazyproperty
-    def _blocks_in_and_above_section_xpath(self) -> str:
-        """XPath expr for ps and tbls in context of a sectPr and all prior sectPrs."""
-        # -- "p_sect" is a section with sectPr located at w:p/w:pPr/w:sectPr.
-        # -- "body_sect" is a section with sectPr located at w:body/w:sectPr. The last
-        # -- section in the document is a "body_sect". All others are of the "p_sect"
-        # -- variety. "term" means "terminal", like the last p or tbl in the section.
-        # -- "pred" means "predecessor", like a preceding p or tbl in the section.
-
-        # -- the terminal block in a p-based sect is the p the sectPr appears in --
-        p_sect_term_block = "./parent::w:pPr/parent::w:p"
-        # -- the terminus of a body-based sect is the sectPr itself (not a block) --
-        body_sect_term = "self::w:sectPr[parent::w:body]"
-        # -- all the ps and tbls preceding (but not including) the context node --
-        pred_ps_and_tbls = "preceding-sibling::*[self::w:p | self::w:tbl]"
-
-        # -- p_sect_term_block and body_sect_term(inus) are mutually exclusive. So the
-        # -- result is either the union of nodes found by the first two selectors or the
-        # -- nodes found by the last selector, never both.
-        return (
-            # -- include the p containing a sectPr --
-            f"{p_sect_term_block}"
-            # -- along with all the blocks that precede it --
-            f" | {p_sect_term_block}/{pred_ps_and_tbls}"
-            # -- or all the preceding blocks if sectPr is body-based (last sectPr) --
-            f" | {body_sect_term}/{pred_ps_and_tbls}"
-        )
+    @property
+    def sectPrs(self) -> List[CT_SectPr]:
+        """All `w:sectPr` elements in the document body, in document order."""
+        if self._sentinel_sectPr is None:
+            return list(self._p_sectPrs)
+        return self._p_sectPrs + [self._sentinel_sectPr]
+
+    def _add_children(self, children: Iterable[BaseOxmlElement]):
+        """Add the block-items and section breaks in `children` to the end of the index."""
+        blocks, p_sectPrs, p_sectPr_ends = self._blocks, self._p_sectPrs, self._p_sectPr_ends
+        trailing = self._trailing
+        for child in children:
+            tag = child.tag
+            if tag == _P_TAG:
+                blocks.append(cast(CT_P, child))
+                trailing.clear()
+                sectPr = child.find(_P_SECTPR_PATH)
+                if sectPr is not None:
+                    self._ordinals[sectPr] = len(p_sectPrs)
+                    p_sectPrs.append(sectPr)
+                    p_sectPr_ends.append(len(blocks))
+                continue
+            if tag == _TBL_TAG:
+                blocks.append(cast(CT_Tbl, child))
+                trailing.clear()
+                continue
+            if tag == _SECTPR_TAG:
+                self._sentinel_sectPr = cast(CT_SectPr, child)
+            trailing.append(child)
+
+    def _extend(self, body: BaseOxmlElement, n_children: int) -> bool:
+        """Index blocks appended since last refresh, False if body changed otherwise.
+
+        `CT_Body` inserts a new `w:p` or `w:tbl` before the body-level `w:sectPr`, so
+        appended blocks appear between the last indexed block and the non-block
+        children that trailed it when last indexed.
+        """
+        n_added = n_children - self._n_children
+        if n_added <= 0 or not self._blocks:
+            return False
+        tail = _tail(body, len(self._trailing) + n_added + 1)
+        if tail[0] is not self._blocks[-1] or not _same(tail[n_added + 1 :], self._trailing):
+            return False
+        added = tail[1 : n_added + 1]
+        if any(e.tag == _SECTPR_TAG for e in added):
+            return False
+        trailing, self._trailing = self._trailing, []
+        self._add_children(added)
+        self._trailing.extend(trailing)
+        return True
+
+    def _is_current(self, body: BaseOxmlElement, n_children: int) -> bool:
+        """True when `body` ends as it did and has as many children as when last indexed."""
+        if n_children != self._n_children:
+            return False
+        last_indexed = self._blocks[-1:] + self._trailing
+        return _same(_tail(body, len(last_indexed)), last_indexed)
+
+    def _rebuild(self, body: BaseOxmlElement | None):
+        """Index the block-items and sections in `body` from scratch."""
+        self._blocks, self._trailing = [], []
+        self._p_sectPrs, self._p_sectPr_ends, self._ordinals = [], [], {}
+        self._sentinel_sectPr = None
+        if body is not None:
+            self._add_children(body.iterchildren())
+
+    def _refresh(self, body: BaseOxmlElement | None):
+        """Bring this index up-to-date with the current children of `body`."""
+        n_children = 0 if body is None else len(body)
+        if body is self._body and (
+            body is None or self._is_current(body, n_children) or self._extend(body, n_children)
+        ):
+            self._n_children = n_children
+            return
+        self._rebuild(body)
+        self._body = body
+        self._n_children = n_children
 
-    def _count_of_blocks_in_and_above_section(self, sectPr: CT_SectPr) -> int:
-        """All ps and tbls in section defined by `sectPr` and all prior sections."""
-        if self._compiled_count_xpath is None:
-            self._compiled_count_xpath = etree.XPath(
-                f"count({self._blocks_in_and_above_section_xpath})",
-                namespaces=nsmap,
-                regexp=False,
-            )
-        xpath = self._compiled_count_xpath
-        # -- numeric XPath results are always float, so need an int() conversion --
-        return int(cast(float, xpath(sectPr)))
-
-    @lazyproperty
-    def _sectPrs(self) -> Sequence[CT_SectPr]:
-        """All w:sectPr elements in document, in document-order."""
-        return self._sectPr.xpath(
-            "/w:document/w:body/w:p/w:pPr/w:sectPr | /w:document/w:body/w:sectPr",
-        )
+
+def _same(elements: List[Any], other_elements: List[Any]) -> bool:
+    """True when both lists hold the same elements, compared by identity, in order."""
+    return len(elements) == len(other_elements) and all(
+        e is o for e, o in zip(elements, other_elements)
+    )
+
+
+def _tail(body: BaseOxmlElement, n: int) -> List[BaseOxmlElement]:
+    """The last `n` children of `body`, found from its end without visiting the others."""
+    tail: List[BaseOxmlElement] = []
+    child = next(body.iterchildren(reversed=True), None) if n else None
+    while child is not None and len(tail) < n:
+        tail.append(child)
+        child = child.getprevious()
+    tail.reverse()
+    return tail
+
+
+_P_TAG = qn("w:p")
+_TBL_TAG = qn("w:tbl")
+_SECTPR_TAG = qn("w:sectPr")
+_P_SECTPR_PATH = "%s/%s" % (qn("w:pPr"), qn("w:sectPr"))
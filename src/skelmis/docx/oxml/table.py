@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, cast
+import copy
+import itertools
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Sequence, Set, Tuple, cast
 
 from skelmis.docx.enum.table import (
     WD_CELL_VERTICAL_ALIGNMENT,
@@ -11,7 +13,7 @@ from skelmis.docx.enum.table import (
 )
 from skelmis.docx.exceptions import InvalidSpanError
 from skelmis.docx.oxml.ns import nsdecls, qn
-from skelmis.docx.oxml.parser import parse_xml
+from skelmis.docx.oxml.parser import OxmlElement, parse_xml
 from skelmis.docx.oxml.shared import CT_DecimalNumber
 from skelmis.docx.oxml.simpletypes import (
     ST_Merge,
@@ -21,6 +23,7 @@ from skelmis.docx.oxml.simpletypes import (
     XsdInt,
 )
 from skelmis.docx.oxml.text.paragraph import CT_P
+from skelmis.docx.oxml.text.run import _RunContentAppender  # pyright: ignore
 from skelmis.docx.oxml.xmlchemy import (
     BaseOxmlElement,
     OneAndOnlyOne,
@@ -36,8 +39,17 @@ if TYPE_CHECKING:
     from skelmis.docx.enum.table import WD_TABLE_ALIGNMENT
     from skelmis.docx.enum.text import WD_ALIGN_PARAGRAPH
     from skelmis.docx.oxml.shared import CT_OnOff, CT_String
+    from skelmis.docx.oxml.text.font import CT_RPr
     from skelmis.docx.oxml.text.parfmt import CT_Jc
 
+_TC, _TR, _TCPR, _TRPR = qn("w:tc"), qn("w:tr"), qn("w:tcPr"), qn("w:trPr")
+_GRID_BEFORE, _GRID_SPAN, _VMERGE, _VAL = (
+    qn("w:gridBefore"),
+    qn("w:gridSpan"),
+    qn("w:vMerge"),
+    qn("w:val"),
+)
+
 
 class CT_Height(BaseOxmlElement):
     """Used for `w:trHeight` to specify a row height and row height rule."""
@@ -80,6 +92,34 @@ class CT_Row(BaseOxmlElement):
             return 0
         return trPr.grid_before
 
+    def prototype(self) -> Tuple[CT_Row, List[Tuple[int, int, int]]]:
+        """Return a copy of this row having one empty run per cell, and where those runs are.
+
+        Each cell of the copy keeps its properties, those of its first paragraph and those
+        of the first run in that paragraph, but its content is reduced to that paragraph
+        holding that run without any text. The location of each run is given as the child
+        index of its cell in the row, of the paragraph in the cell and of the run in the
+        paragraph.
+        """
+        tr = copy.deepcopy(self)
+        slots: List[Tuple[int, int, int]] = []
+        for tc in tr.tc_lst:
+            p_lst = tc.p_lst
+            p = p_lst[0] if p_lst else tc.add_p()
+            r_lst = p.r_lst
+            rPr = r_lst[0].rPr if r_lst else None
+            for child in list(tc):
+                if child is not tc.tcPr and child is not p:
+                    tc.remove(child)
+            for child in list(p):
+                if child is not p.pPr:
+                    p.remove(child)
+            r = p.add_r()
+            if rPr is not None:
+                r.append(rPr)
+            slots.append((tr.index(tc), tc.index(p), p.index(r)))
+        return tr, slots
+
     def tc_at_grid_offset(self, grid_offset: int) -> CT_Tc:
         """The `tc` element in this tr at exact `grid offset`.
 
@@ -200,6 +240,34 @@ class CT_Tbl(BaseOxmlElement):
         """
         return cast(CT_Tbl, parse_xml(cls._tbl_xml(rows, cols, width)))
 
+    @classmethod
+    def new_tbl_from_rows(
+        cls,
+        header: Sequence[str] | None,
+        rows: Iterable[Sequence[str]],
+        widths: Sequence[Length],
+        rPrs: Sequence[CT_RPr | None],
+    ) -> CT_Tbl:
+        """Return a new `w:tbl` element holding the text of `header` and `rows`.
+
+        There is a column for each of `widths`, of that width. Each item of a row is the
+        text of the cell in that column, a row shorter than the grid being completed with
+        empty cells. The text of a row in `rows` takes the run properties in `rPrs` for its
+        column, if any. `header`, when present, becomes the first row, marked to repeat at
+        the top of each page.
+        """
+        tbl = cls.new_tbl(0, len(widths), Emu(sum(widths)))
+        for gridCol, width in zip(tbl.tblGrid.gridCol_lst, widths):
+            gridCol.w = width
+
+        factory = RowFactory(widths, rPrs)
+        trs: List[CT_Row] = []
+        if header is not None:
+            trs.append(factory.new_header_tr(header))
+        trs.extend(factory.new_tr(texts) for texts in rows)
+        tbl.extend(trs)
+        return tbl
+
     @property
     def tblStyle_val(self) -> str | None:
         """`w:tblPr/w:tblStyle/@w:val` (a table style id) or |None| if not present."""
@@ -509,15 +577,23 @@ class CT_Tc(BaseOxmlElement):
         """The grid column index at which this ``<w:tc>`` element appears."""
         return self.grid_offset
 
-    def merge(self, other_tc: CT_Tc) -> CT_Tc:
+    def merge(self, other_tc: CT_Tc, geometry: TableGeometry | None = None) -> CT_Tc:
         """Return top-left `w:tc` element of a new span.
 
         Span is formed by merging the rectangular region defined by using this tc
-        element and `other_tc` as diagonal corners.
+        element and `other_tc` as diagonal corners. The positions of the cells are looked
+        up in `geometry`, the |TableGeometry| of their table, which is updated for the
+        merge. It is built here when not given.
         """
-        top, left, height, width = self._span_dimensions(other_tc)
-        top_tc = self._tbl.tr_lst[top].tc_at_grid_offset(left)
-        top_tc._grow_to(width, height)
+        geometry = TableGeometry(self._tbl) if geometry is None else geometry
+        top, left, height, width = _merged_dimensions(
+            geometry.extents(self), geometry.extents(other_tc)
+        )
+        top_tc = geometry.tc_at(top, left)
+        try:
+            top_tc._grow_to(width, height, geometry=geometry)
+        finally:
+            geometry.update_rows(top, top + height)
         return top_tc
 
     @classmethod
@@ -576,11 +652,17 @@ class CT_Tc(BaseOxmlElement):
         if self.width and other_tc.width:
             self.width = Length(self.width + other_tc.width)
 
-    def _grow_to(self, width: int, height: int, top_tc: CT_Tc | None = None):
+    def _grow_to(
+        self,
+        width: int,
+        height: int,
+        top_tc: CT_Tc | None = None,
+        geometry: TableGeometry | None = None,
+    ):
         """Grow this cell to `width` grid columns and `height` rows.
 
         This is accomplished by expanding horizontal spans and creating continuation
-        cells to form vertical spans.
+        cells to form vertical spans. The cells below are found in `geometry` when given.
         """
 
         def vMerge_val(top_tc: CT_Tc):
@@ -593,9 +675,9 @@ class CT_Tc(BaseOxmlElement):
         top_tc = self if top_tc is None else top_tc
         self._span_to_width(width, top_tc, vMerge_val(top_tc))
         if height > 1:
-            tc_below = self._tc_below
+            tc_below = self._tc_below if geometry is None else geometry.tc_below(self)
             assert tc_below is not None
-            tc_below._grow_to(width, height - 1, top_tc)
+            tc_below._grow_to(width, height - 1, top_tc, geometry)
 
     def _insert_tcPr(self, tcPr: CT_TcPr) -> CT_TcPr:
         """Override default `._insert_tcPr()`."""
@@ -666,31 +748,10 @@ class CT_Tc(BaseOxmlElement):
         """Return a (top, left, height, width) 4-tuple specifying the extents of the
         merged cell formed by using this tc and `other_tc` as opposite corner
         extents."""
-
-        def raise_on_inverted_L(a: CT_Tc, b: CT_Tc):
-            if a.top == b.top and a.bottom != b.bottom:
-                raise InvalidSpanError("requested span not rectangular")
-            if a.left == b.left and a.right != b.right:
-                raise InvalidSpanError("requested span not rectangular")
-
-        def raise_on_tee_shaped(a: CT_Tc, b: CT_Tc):
-            top_most, other = (a, b) if a.top < b.top else (b, a)
-            if top_most.top < other.top and top_most.bottom > other.bottom:
-                raise InvalidSpanError("requested span not rectangular")
-
-            left_most, other = (a, b) if a.left < b.left else (b, a)
-            if left_most.left < other.left and left_most.right > other.right:
-                raise InvalidSpanError("requested span not rectangular")
-
-        raise_on_inverted_L(self, other_tc)
-        raise_on_tee_shaped(self, other_tc)
-
-        top = min(self.top, other_tc.top)
-        left = min(self.left, other_tc.left)
-        bottom = max(self.bottom, other_tc.bottom)
-        right = max(self.right, other_tc.right)
-
-        return top, left, bottom - top, right - left
+        return _merged_dimensions(
+            (self.top, self.left, self.bottom, self.right),
+            (other_tc.top, other_tc.left, other_tc.bottom, other_tc.right),
+        )
 
     def _span_to_width(self, grid_width: int, top_tc: CT_Tc, vMerge: str | None):
         """Incorporate `w:tc` elements to the right until this cell spans `grid_width`.
@@ -979,3 +1040,232 @@ class CT_VMerge(BaseOxmlElement):
     val: str | None = OptionalAttribute(  # pyright: ignore[reportAssignmentType]
         "w:val", ST_Merge, default=ST_Merge.CONTINUE
     )
+
+
+class RowFactory:
+    """Makes `w:tr` elements holding given text, copying a prototype cell and run per column.
+
+    `widths` is the width of each column, |None| for a column without one, and `rPrs`
+    the run properties for the text in each column, |None| or missing for none. Copying
+    prototypes makes each row much faster to build than adding its cells one at a time.
+    """
+
+    def __init__(self, widths: Sequence[Length | None], rPrs: Sequence[CT_RPr | None] = ()):
+        self._tcs: List[CT_Tc] = []
+        for width in widths:
+            tc = CT_Tc.new()
+            if width is not None:
+                tc.width = width
+            self._tcs.append(tc)
+        self._rs: List[BaseOxmlElement] = []
+        for rPr in itertools.islice(itertools.chain(rPrs, itertools.repeat(None)), len(widths)):
+            r = OxmlElement("w:r")
+            if rPr is not None:
+                r.append(copy.deepcopy(rPr))
+            self._rs.append(r)
+        self._plain_rs = [OxmlElement("w:r")] * len(widths)
+
+    def new_header_tr(self, texts: Sequence[str]) -> CT_Row:
+        """A row holding `texts` without column formatting, repeated at the top of each page."""
+        tr = self._new_tr(texts, self._plain_rs)
+        trPr = OxmlElement("w:trPr")
+        trPr.append(OxmlElement("w:tblHeader"))
+        tr.insert(0, trPr)
+        return tr
+
+    def new_tr(self, texts: Sequence[str]) -> CT_Row:
+        """A row holding `texts`, one for each cell and completed with empty cells.
+
+        Raises |ValueError| when there are more `texts` than columns.
+        """
+        return self._new_tr(texts, self._rs)
+
+    def _new_tr(self, texts: Sequence[str], rs: Sequence[BaseOxmlElement]) -> CT_Row:
+        if len(texts) > len(self._tcs):
+            raise ValueError(f"{len(texts)} values given for a row of {len(self._tcs)} cells")
+        tr = cast(CT_Row, OxmlElement("w:tr"))
+        for tc_prototype, r_prototype, text in itertools.zip_longest(self._tcs, rs, texts):
+            tc = copy.deepcopy(tc_prototype)
+            if text:
+                r = copy.deepcopy(r_prototype)
+                _RunContentAppender.append_to_run_from_text(r, text)
+                tc[-1].append(r)
+            tr.append(tc)
+        return tr
+
+
+class TableGeometry:
+    """Where each `w:tc` element of a table sits in its layout grid.
+
+    Built in a single pass over the table, it gives the grid position and extents of a
+    cell without scanning the cells before it in its row or the rows above and below it.
+    |CT_Tc.merge| keeps it up to date as it merges cells, so cells can be merged many
+    times over for the cost of indexing the table once. Vertical merges are read from
+    the cells themselves, so are always current.
+    """
+
+    def __init__(self, tbl: CT_Tbl):
+        self._tbl = tbl
+        self._trs: List[CT_Row] = list(tbl.iterchildren(_TR))
+        self._col_count = len(tbl.tblGrid.gridCol_lst)
+        # -- the row index and the grid columns spanned of each cell --
+        self._cells: Dict[CT_Tc, Tuple[int, int, int]] = {}
+        # -- the cell occupying each grid column of each row, |None| before its first cell --
+        self._rows: List[List[CT_Tc | None]] = [[] for _ in self._trs]
+        self._row_lengths = [0] * len(self._trs)
+        # -- rows not filling the grid exactly, for which `Table._cells` can't be mapped --
+        self._ragged_rows: Set[int] = set()
+        self.update_rows(0, len(self._trs))
+
+    def cell_tc(self, row_idx: int, col_idx: int) -> CT_Tc | None:
+        """The `w:tc` holding the content of the grid cell at `row_idx`, `col_idx`.
+
+        This is the cell a continuation cell of a vertical span continues, the same
+        `w:tc` as the cell at that position in `Table._cells`. |None| when that position
+        is out of range or the rows of the table don't each fill its grid.
+        """
+        rows = self._rows
+        if self._ragged_rows or not (0 <= row_idx < len(rows) and 0 <= col_idx < self._col_count):
+            return None
+        tc = cast(CT_Tc, rows[row_idx][col_idx])
+        while tc_vMerge(tc) == ST_Merge.CONTINUE:
+            if row_idx == 0:
+                return None
+            row_idx -= 1
+            tc = cast(CT_Tc, rows[row_idx][col_idx])
+        return tc
+
+    def extents(self, tc: CT_Tc) -> Tuple[int, int, int, int]:
+        """The top, left, bottom and right extents of `tc`, as its properties of those names.
+
+        Raises |KeyError| when `tc` is not in this table.
+        """
+        row_idx, left, right = self._cells[tc]
+        vMerge = tc_vMerge(tc)
+
+        top, tc_above = row_idx, tc
+        while tc_vMerge(tc_above) == ST_Merge.CONTINUE:
+            tc_above = self._tc_starting_at(top - 1, left)
+            if tc_above is None:
+                break
+            top -= 1
+
+        bottom = row_idx + 1
+        if vMerge is not None:
+            tc_below = self._tc_starting_at(bottom, left)
+            while tc_below is not None and tc_vMerge(tc_below) == ST_Merge.CONTINUE:
+                bottom += 1
+                tc_below = self._tc_starting_at(bottom, left)
+
+        return top, left, bottom, right
+
+    @property
+    def is_current(self) -> bool:
+        """True when the table still has the grid columns, rows and cells indexed here.
+
+        Rows and cells added or removed in any way are noticed, but not a horizontal span
+        changed directly in the XML of a cell.
+        """
+        trs = list(self._tbl.iterchildren(_TR))
+        return (
+            trs == self._trs
+            and [len(tr) for tr in trs] == self._row_lengths
+            and len(self._tbl.tblGrid.gridCol_lst) == self._col_count
+        )
+
+    def tc_at(self, row_idx: int, grid_offset: int) -> CT_Tc:
+        """The `w:tc` in the row at `row_idx` starting at exactly `grid_offset`.
+
+        Raises |ValueError| when no cell of that row starts there.
+        """
+        tc = self._tc_starting_at(row_idx, grid_offset)
+        if tc is None:
+            raise ValueError(f"no `tc` element at grid_offset={grid_offset}")
+        return tc
+
+    def tc_below(self, tc: CT_Tc) -> CT_Tc | None:
+        """The `w:tc` starting in the same grid column as `tc` in the next row, if any."""
+        row_idx, left, _ = self._cells[tc]
+        return self._tc_starting_at(row_idx + 1, left)
+
+    def update_rows(self, start: int, stop: int):
+        """Index again the rows from `start` up to `stop`, after their cells have changed."""
+        cells = self._cells
+        for row_idx in range(start, stop):
+            for tc in dict.fromkeys(self._rows[row_idx]):
+                cells.pop(tc, None)  # pyright: ignore[reportArgumentType]
+            tr = self._trs[row_idx]
+            row: List[CT_Tc | None] = [None] * tr_grid_before(tr)
+            for tc in tr.iterchildren(_TC):
+                span = tc_grid_span(tc)
+                cells[tc] = (row_idx, len(row), len(row) + span)
+                row.extend([tc] * span)
+
+            self._rows[row_idx] = row
+            self._row_lengths[row_idx] = len(tr)
+            if len(row) == self._col_count and (not row or row[0] is not None):
+                self._ragged_rows.discard(row_idx)
+            else:
+                self._ragged_rows.add(row_idx)
+
+    def _tc_starting_at(self, row_idx: int, grid_offset: int) -> CT_Tc | None:
+        """The `w:tc` starting at `grid_offset` in the row at `row_idx`, |None| if none does."""
+        if not 0 <= row_idx < len(self._rows):
+            return None
+        row = self._rows[row_idx]
+        if not 0 <= grid_offset < len(row):
+            return None
+        tc = row[grid_offset]
+        if tc is None or self._cells[tc][1] != grid_offset:
+            return None
+        return tc
+
+
+def tc_grid_span(tc: BaseOxmlElement) -> int:
+    """The gridSpan value of `tc`, as `CT_Tc.grid_span` but without the descriptor lookups."""
+    tcPr = tc.find(_TCPR)
+    gridSpan = None if tcPr is None else tcPr.find(_GRID_SPAN)
+    return 1 if gridSpan is None else int(gridSpan.get(_VAL, 1))
+
+
+def tc_vMerge(tc: BaseOxmlElement) -> str | None:
+    """The vMerge value of `tc`, as `CT_Tc.vMerge` but without the descriptor lookups."""
+    tcPr = tc.find(_TCPR)
+    vMerge = None if tcPr is None else tcPr.find(_VMERGE)
+    return None if vMerge is None else vMerge.get(_VAL, ST_Merge.CONTINUE)
+
+
+def tr_grid_before(tr: BaseOxmlElement) -> int:
+    """The gridBefore value of `tr`, as `CT_Row.grid_before` but without descriptor lookups."""
+    trPr = tr.find(_TRPR)
+    gridBefore = None if trPr is None else trPr.find(_GRID_BEFORE)
+    return 0 if gridBefore is None else int(gridBefore.get(_VAL, 0))
+
+
+def _merged_dimensions(
+    a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]
+) -> Tuple[int, int, int, int]:
+    """The (top, left, height, width) of the span having cells `a` and `b` as corners.
+
+    `a` and `b` are the (top, left, bottom, right) extents of each cell. Raises
+    |InvalidSpanError| when the cells don't define a rectangular span.
+    """
+    (a_top, a_left, a_bottom, a_right), (b_top, b_left, b_bottom, b_right) = a, b
+
+    # -- an inverted-L shape --
+    if a_top == b_top and a_bottom != b_bottom:
+        raise InvalidSpanError("requested span not rectangular")
+    if a_left == b_left and a_right != b_right:
+        raise InvalidSpanError("requested span not rectangular")
+
+    # -- a tee shape --
+    top_most, other = (a, b) if a_top < b_top else (b, a)
+    if top_most[0] < other[0] and top_most[2] > other[2]:
+        raise InvalidSpanError("requested span not rectangular")
+    left_most, other = (a, b) if a_left < b_left else (b, a)
+    if left_most[1] < other[1] and left_most[3] > other[3]:
+        raise InvalidSpanError("requested span not rectangular")
+
+    top, left = min(a_top, b_top), min(a_left, b_left)
+    bottom, right = max(a_bottom, b_bottom), max(a_right, b_right)
+    return top, left, bottom - top, right - left
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Callable, Iterator, List
 
+from lxml import etree
+
 from skelmis.docx.oxml.drawing import CT_Drawing
 from skelmis.docx.oxml.ns import qn
 from skelmis.docx.oxml.simpletypes import ST_BrClear, ST_BrType
@@ -227,6 +230,12 @@ class CT_Text(BaseOxmlElement):
 # ------------------------------------------------------------------------------------
 # Utility
 
+# -- splits text into stretches of regular characters and the single characters that
+# -- become their own run-content element, keeping the latter --
+_SPECIAL_CHARS = re.compile(r"([\t\r\n])")
+
+_BR, _TAB, _T, _XML_SPACE = qn("w:br"), qn("w:tab"), qn("w:t"), qn("xml:space")
+
 
 class _RunContentAppender:
     """Translates a Python string into run content elements appended in a `w:r` element.
@@ -248,10 +257,26 @@ class _RunContentAppender:
         appender.add_text(text)
 
     def add_text(self, text: str):
-        """Append inner-content elements for `text` to the `w:r` element."""
-        for char in text:
-            self.add_char(char)
+        """Append inner-content elements for `text` to the `w:r` element.
+
+        `text` is split on its tab and line-break characters in a single pass and each
+        resulting element is appended directly, which matters for long text such as a
+        whole log file.
+        """
         self.flush()
+        r = self._r
+        for piece in _SPECIAL_CHARS.split(text):
+            if not piece:
+                continue
+            if piece == "\t":
+                etree.SubElement(r, _TAB)
+            elif piece in ("\r", "\n"):
+                etree.SubElement(r, _BR)
+            else:
+                t = etree.SubElement(r, _T)
+                t.text = piece
+                if len(piece.strip()) < len(piece):
+                    t.set(_XML_SPACE, "preserve")
 
     def add_char(self, char: str):
         """Process next character of input through finite state maching (FSM).
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import IO, cast
+from typing import IO, TYPE_CHECKING, cast
 
 from skelmis.docx.image.image import Image
 from skelmis.docx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -11,6 +11,9 @@ from skelmis.docx.opc.packuri import PackURI
 from skelmis.docx.parts.image import ImagePart
 from skelmis.docx.shared import lazyproperty
 
+if TYPE_CHECKING:
+    from skelmis.docx.image.optimize import MediaOptimizer
+
 
 class Package(OpcPackage):
     """Customizations specific to a WordprocessingML package."""
@@ -30,6 +33,21 @@ class Package(OpcPackage):
         """
         return self.image_parts.get_or_add_image_part(image_descriptor)
 
+    def optimize_media(self, optimizer: MediaOptimizer | None = None):
+        """Losslessly reduce the size of each PNG and JPEG image part in this package.
+
+        `optimizer` defaults to a new one used for this call only. An optimizer keeps its
+        results, so passing the same one for many packages optimizes an image appearing
+        in each of them only once.
+        """
+        if optimizer is None:
+            # -- imported here so the image parsers it needs load only when media is optimized --
+            from skelmis.docx.image.optimize import MediaOptimizer
+
+            optimizer = MediaOptimizer()
+        for image_part in self.image_parts:
+            image_part.optimize(optimizer)
+
     @lazyproperty
     def image_parts(self) -> ImageParts:
         """|ImageParts| collection object for this package."""
@@ -88,7 +106,8 @@ class ImageParts:
         """Return the image part in this collection having a SHA1 hash matching `sha1`,
         or |None| if not found."""
         for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
+            # -- an optimized part still matches the image it was made from --
+            if image_part.sha1 == sha1 or image_part.original_sha1 == sha1:
                 return image_part
         return None
 
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, cast
+import hashlib
+import re
+from typing import IO, TYPE_CHECKING, Dict, List, Tuple, cast
+
+from lxml import etree
 
 from skelmis.docx.document import Document
 from skelmis.docx.enum.style import WD_STYLE_TYPE
@@ -17,8 +21,14 @@ from skelmis.docx.shared import lazyproperty
 
 if TYPE_CHECKING:
     from skelmis.docx.opc.coreprops import CoreProperties
+    from skelmis.docx.oxml.table import CT_Tbl
     from skelmis.docx.settings import Settings
     from skelmis.docx.styles.style import BaseStyle
+    from skelmis.docx.table import TableStreamWriter
+
+# -- marks the end of a streamed table while the rest of the document is serialized --
+_STREAM_MARKER = "skelmis-docx-table-stream-%d"
+_STREAM_MARKER_RE = re.compile(rb"<!--skelmis-docx-table-stream-(\d+)-->")
 
 
 class DocumentPart(StoryPart):
@@ -33,21 +43,56 @@ class DocumentPart(StoryPart):
     def add_footer_part(self):
         """Return (footer_part, rId) pair for newly-created footer part."""
         footer_part = FooterPart.new(self.package)
+        if self.proxy_cache is not None:
+            footer_part.enable_proxy_cache()
         rId = self.relate_to(footer_part, RT.FOOTER)
         return footer_part, rId
 
     def add_header_part(self):
         """Return (header_part, rId) pair for newly-created header part."""
         header_part = HeaderPart.new(self.package)
+        if self.proxy_cache is not None:
+            header_part.enable_proxy_cache()
         rId = self.relate_to(header_part, RT.HEADER)
         return header_part, rId
 
+    def add_table_stream(self, tbl: CT_Tbl, writer: TableStreamWriter):
+        """Have `writer` write `tbl` and its streamed rows when this part is saved."""
+        self._table_streams.append((tbl, writer))
+
     @property
     def core_properties(self) -> CoreProperties:
         """A |CoreProperties| object providing read/write access to the core properties
         of this document."""
         return self.package.core_properties
 
+    def dedupe_header_footer_parts(self) -> int:
+        """Relate sections having identical header or footer content to a single part.
+
+        Header and footer parts are compared by a digest of their canonicalized XML and
+        relationships. Each section referring to a duplicate is re-pointed at the first
+        part having the same content and the duplicate is dropped from the package.
+        Note that editing a shared header or footer afterward changes it for all the
+        sections it is shared by. Returns the number of parts dropped.
+        """
+        canonical_rIds: Dict[str, str] = {}
+        replacements: Dict[str, str] = {}
+        for rId, rel in list(self.rels.items()):
+            if rel.is_external or rel.reltype not in (RT.HEADER, RT.FOOTER):
+                continue
+            digest = self._hdrftr_digest(cast(StoryPart, rel.target_part))
+            canonical_rId = canonical_rIds.setdefault(digest, rId)
+            if canonical_rId != rId:
+                replacements[rId] = canonical_rId
+
+        if not replacements:
+            return 0
+        for hdrftr_ref in self._element.xpath("//w:headerReference | //w:footerReference"):
+            hdrftr_ref.rId = replacements.get(hdrftr_ref.rId, hdrftr_ref.rId)
+        for rId in replacements:
+            self.drop_rel(rId)
+        return len(replacements)
+
     @property
     def document(self):
         """A |Document| object providing access to the content of this document."""
@@ -57,6 +102,13 @@ class DocumentPart(StoryPart):
         """Remove related header part identified by `rId`."""
         self.drop_rel(rId)
 
+    def enable_proxy_cache(self):
+        """Reuse the proxies of this part and of each of its header and footer parts."""
+        super(DocumentPart, self).enable_proxy_cache()
+        for rel in self.rels.values():
+            if not rel.is_external and isinstance(rel.target_part, StoryPart):
+                rel.target_part.enable_proxy_cache()
+
     def footer_part(self, rId: str):
         """Return |FooterPart| related by `rId`."""
         return self.related_parts[rId]
@@ -102,10 +154,58 @@ class DocumentPart(StoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def save(self, path_or_stream: str | IO[bytes], deterministic: bool = False):
         """Save this document to `path_or_stream`, which can be either a path to a
-        filesystem location (a string) or a file-like object."""
-        self.package.save(path_or_stream)
+        filesystem location (a string) or a file-like object.
+
+        Raises |ValueError|, before anything is written, when the document holds a streamed
+        table whose records were consumed by an earlier save.
+        """
+        for tbl in self._consumed_table_streams:
+            if tbl.getparent() is not None:
+                raise ValueError(
+                    "a streamed table's records were consumed when the document was first"
+                    " saved, pass a function returning them to save it again"
+                )
+        self.package.save(path_or_stream, deterministic)
+
+    @property
+    def streams_blob(self) -> bool:
+        """True when this document has tables whose rows are written as it is saved."""
+        return bool(self._table_streams)
+
+    def write_blob(self, stream: IO[bytes]):
+        """Write the XML of this part to `stream`, the rows of each streamed table as they come.
+
+        The document is serialized with a marker in place of each streamed table, and
+        each marker is replaced by its table as it is written, so the streamed rows are
+        never all in memory. A writer whose records are then consumed is dropped.
+        """
+        # -- a table removed from the document since is left out --
+        markers: List[Tuple[etree._Element, CT_Tbl]] = []
+        for idx, (tbl, _) in enumerate(self._table_streams):
+            parent = tbl.getparent()
+            if parent is None:
+                continue
+            marker = etree.Comment(_STREAM_MARKER % idx)
+            parent.replace(tbl, marker)
+            markers.append((marker, tbl))
+        try:
+            blob = self.blob
+        finally:
+            for marker, tbl in markers:
+                parent = marker.getparent()
+                parent.replace(marker, tbl)  # pyright: ignore[reportOptionalMemberAccess]
+
+        pieces = _STREAM_MARKER_RE.split(blob)
+        stream.write(pieces[0])
+        for idx, piece in zip(pieces[1::2], pieces[2::2]):
+            self._table_streams[int(idx)][1].write(stream)
+            stream.write(piece)
+
+        table_streams = self._table_streams
+        self._consumed_table_streams.extend(tbl for tbl, w in table_streams if w.consumed)
+        table_streams[:] = [(tbl, w) for tbl, w in table_streams if not w.consumed]
 
     @property
     def settings(self) -> Settings:
@@ -119,6 +219,19 @@ class DocumentPart(StoryPart):
         document."""
         return self._styles_part.styles
 
+    @staticmethod
+    def _hdrftr_digest(hdrftr_part: StoryPart) -> str:
+        """Digest identifying the content of `hdrftr_part`, the same for identical parts.
+
+        The relationships of the part are included because the same `r:embed` rId can
+        refer to different images in different parts.
+        """
+        sha1 = hashlib.sha1(hdrftr_part.content_type.encode("utf-8"))
+        sha1.update(etree.tostring(hdrftr_part.element, method="c14n"))
+        for rId, rel in sorted(hdrftr_part.rels.items()):
+            sha1.update(("|%s|%s|%s" % (rId, rel.reltype, rel.target_ref)).encode("utf-8"))
+        return sha1.hexdigest()
+
     @property
     def _settings_part(self) -> SettingsPart:
         """A |SettingsPart| object providing access to the document-level settings for
@@ -133,6 +246,16 @@ class DocumentPart(StoryPart):
             self.relate_to(settings_part, RT.SETTINGS)
             return settings_part
 
+    @lazyproperty
+    def _consumed_table_streams(self) -> List[CT_Tbl]:
+        """Each streamed table whose records were consumed by an earlier save."""
+        return []
+
+    @lazyproperty
+    def _table_streams(self) -> List[Tuple[CT_Tbl, TableStreamWriter]]:
+        """Each table whose rows are written as this part is saved, with its writer."""
+        return []
+
     @property
     def _styles_part(self) -> StylesPart:
         """Instance of |StylesPart| for this document.
@@ -10,6 +10,7 @@ from skelmis.docx.opc.part import Part
 from skelmis.docx.shared import Emu, Inches
 
 if TYPE_CHECKING:
+    from skelmis.docx.image.optimize import MediaOptimizer
     from skelmis.docx.opc.package import OpcPackage
     from skelmis.docx.opc.packuri import PackURI
 
@@ -25,6 +26,7 @@ class ImagePart(Part):
     ):
         super(ImagePart, self).__init__(partname, content_type, blob)
         self._image = image
+        self._original_sha1: str | None = None
 
     @property
     def default_cx(self):
@@ -74,6 +76,28 @@ class ImagePart(Part):
         package being opened by ``Document(...)`` call."""
         return cls(partname, content_type, blob)
 
+    def optimize(self, optimizer: MediaOptimizer):
+        """Replace the blob of this image part with its losslessly optimized form.
+
+        The image dimensions and resolution are unchanged, so drawings referring to this
+        part need no update.
+        """
+        blob = self.blob
+        optimized = optimizer.optimize(blob, self.content_type)
+        if optimized is blob:
+            return
+        if self._original_sha1 is None:
+            self._original_sha1 = self.sha1
+        self._blob = optimized
+
+    @property
+    def original_sha1(self) -> str | None:
+        """SHA1 hash digest of the blob of this image part before it was optimized.
+
+        |None| when the blob hasn't been changed by :meth:`optimize`.
+        """
+        return self._original_sha1
+
     @property
     def sha1(self):
         """SHA1 hash digest of the blob of this image part."""
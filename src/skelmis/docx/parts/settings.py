@@ -23,7 +23,6 @@ class SettingsPart(XmlPart):
         self, partname: PackURI, content_type: str, element: CT_Settings, package: Package
     ):
         super().__init__(partname, content_type, element, package)
-        self._settings = element
 
     @classmethod
     def default(cls, package: Package):
@@ -40,7 +39,7 @@ class SettingsPart(XmlPart):
 
         Contains the document-level settings for this document.
         """
-        return Settings(self._settings)
+        return Settings(cast("CT_Settings", self._element))
 
     @classmethod
     def _default_settings_xml(cls):
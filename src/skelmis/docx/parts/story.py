@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from typing import IO, TYPE_CHECKING, Tuple, cast
 
+from skelmis.docx.bookmarks import BookmarkRegistry
 from skelmis.docx.opc.constants import RELATIONSHIP_TYPE as RT
 from skelmis.docx.opc.part import XmlPart
 from skelmis.docx.oxml.shape import CT_Anchor, CT_Inline
-from skelmis.docx.shared import Length, lazyproperty
+from skelmis.docx.shared import Length, ProxyCache, lazyproperty
 
 if TYPE_CHECKING:
     from skelmis.docx.enum.style import WD_STYLE_TYPE
@@ -24,6 +25,23 @@ class StoryPart(XmlPart):
     `.add_paragraph()`, `.add_table()` etc.
     """
 
+    #: |ProxyCache| reusing the proxies of elements in this part, |None| when disabled.
+    proxy_cache: ProxyCache | None = None
+
+    @lazyproperty
+    def bookmarks(self) -> BookmarkRegistry:
+        """|BookmarkRegistry| of the bookmarks in this part, built the first time it's used."""
+        return BookmarkRegistry(self._element)
+
+    def enable_proxy_cache(self):
+        """Reuse the paragraph, run, table, row and cell proxies of this part.
+
+        Once enabled, accessing the same element again returns the same proxy object,
+        for as long as it is referenced elsewhere.
+        """
+        if self.proxy_cache is None:
+            self.proxy_cache = ProxyCache()
+
     def get_or_add_image(self, image_descriptor: str | IO[bytes]) -> Tuple[str, Image]:
         """Return (rId, image) pair for image identified by `image_descriptor`.
 
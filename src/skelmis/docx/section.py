@@ -8,7 +8,7 @@ from skelmis.docx.blkcntnr import BlockItemContainer
 from skelmis.docx.enum.section import WD_HEADER_FOOTER
 from skelmis.docx.oxml.text.paragraph import CT_P
 from skelmis.docx.parts.hdrftr import FooterPart, HeaderPart
-from skelmis.docx.shared import lazyproperty
+from skelmis.docx.shared import lazyproperty, proxy_cache_of
 from skelmis.docx.table import Table
 from skelmis.docx.text.paragraph import Paragraph
 
@@ -159,8 +159,10 @@ class Section:
 
         Items appear in document order.
         """
+        cache = proxy_cache_of(self)
         for element in self._sectPr.iter_inner_content():
-            yield (Paragraph(element, self) if isinstance(element, CT_P) else Table(element, self))
+            proxy_cls = Paragraph if isinstance(element, CT_P) else Table
+            yield proxy_cls(element, self) if cache is None else cache.get(element, proxy_cls, self)
 
     @property
     def left_margin(self) -> Length | None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import functools
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -282,8 +283,13 @@ class ElementProxy:
     An element proxy class is one whose primary responsibilities are fulfilled by
     manipulating the attributes and child elements of an XML element. They are the most
     common type of class in python-docx other than custom element (oxml) classes.
+
+    Proxies declare `__slots__` to keep them small, so attributes of your own can't be set
+    on them; keep any such state in a mapping keyed by the proxy instead.
     """
 
+    __slots__ = ("_element", "_parent", "__weakref__")
+
     def __init__(self, element: BaseOxmlElement, parent: t.ProvidesXmlPart | None = None):
         self._element = element
         self._parent = parent
@@ -326,6 +332,8 @@ class Parented:
     Provides ``self._parent`` attribute to subclasses.
     """
 
+    __slots__ = ("_parent", "__weakref__")
+
     def __init__(self, parent: t.ProvidesXmlPart):
         self._parent = parent
 
@@ -343,9 +351,12 @@ class StoryChild:
     ancestor object to provide access to part-level or package-level items like styles
     or images or to add or drop a relationship.
 
-    Provides `self._parent` attribute to subclasses.
+    Provides `self._parent` attribute to subclasses. Like |ElementProxy|, paragraphs, runs
+    and the other story children declare `__slots__` and don't accept new attributes.
     """
 
+    __slots__ = ("_parent", "__weakref__")
+
     def __init__(self, parent: t.ProvidesStoryPart):
         self._parent = parent
 
@@ -355,6 +366,41 @@ class StoryChild:
         return self._parent.part
 
 
+class ProxyCache:
+    """Weak mapping of XML element to the proxy object created for it.
+
+    A cached proxy is returned for an element for as long as the proxy is referenced
+    elsewhere, so repeated traversals of the same content return the same objects and
+    `is` comparisons between them are meaningful. Each story part can have one, see
+    :meth:`.StoryPart.enable_proxy_cache`.
+    """
+
+    def __init__(self):
+        # -- lxml elements can't be weakly referenced, so elements are the (strong) keys
+        # -- and the proxies the weak values
+        self._proxies: weakref.WeakValueDictionary[Any, Any] = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    def get(self, element: Any, proxy_cls: Callable[[Any, Any], T], parent: Any) -> T:
+        """The cached `proxy_cls` proxy of `element`, newly created with `parent` if none."""
+        proxy = self._proxies.get(element)
+        if type(proxy) is not proxy_cls:
+            proxy = proxy_cls(element, parent)
+            self._proxies[element] = proxy
+        return cast(T, proxy)
+
+
+def proxy_cache_of(obj: t.ProvidesStoryPart) -> ProxyCache | None:
+    """The proxy cache of the story part containing `obj`, |None| when it has none.
+
+    |None| is also returned for an `obj` having no part.
+    """
+    cache = getattr(getattr(obj, "part", None), "proxy_cache", None)
+    return cache if isinstance(cache, ProxyCache) else None
+
+
 class TextAccumulator:
     """Accepts `str` fragments and joins them together, in order, on `.pop().
 
@@ -2,21 +2,46 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, cast, overload
-
-from typing_extensions import TypeAlias
+import copy
+import itertools
+import re
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeAlias,
+    cast,
+    overload,
+)
+
+from lxml import etree
 
 from skelmis.docx.blkcntnr import BlockItemContainer
 from skelmis.docx.enum.style import WD_STYLE_TYPE
 from skelmis.docx.enum.table import WD_CELL_VERTICAL_ALIGNMENT
+from skelmis.docx.oxml.ns import qn
 from skelmis.docx.oxml.simpletypes import ST_Merge
-from skelmis.docx.oxml.table import CT_TblGridCol
-from skelmis.docx.shared import Inches, Parented, StoryChild, lazyproperty
+from skelmis.docx.oxml.table import (
+    CT_TblGridCol,
+    RowFactory,
+    TableGeometry,
+    tc_grid_span,
+    tc_vMerge,
+    tr_grid_before,
+)
+from skelmis.docx.oxml.text.run import _RunContentAppender  # pyright: ignore
+from skelmis.docx.shared import Inches, Parented, StoryChild, lazyproperty, proxy_cache_of
+from skelmis.docx.text.search import paragraph_text
 
 if TYPE_CHECKING:
     import skelmis.docx.types as t
     from skelmis.docx.enum.table import WD_ROW_HEIGHT_RULE, WD_TABLE_ALIGNMENT, WD_TABLE_DIRECTION
     from skelmis.docx.oxml.table import CT_Row, CT_Tbl, CT_TblPr, CT_Tc
+    from skelmis.docx.oxml.text.font import CT_RPr
     from skelmis.docx.shared import Length
     from skelmis.docx.styles.style import (
         ParagraphStyle,
@@ -24,6 +49,10 @@ if TYPE_CHECKING:
     )
 
 TableParent: TypeAlias = "Table | _Columns | _Rows"
+Records: TypeAlias = "Iterable[Sequence[Any]] | Callable[[], Iterable[Sequence[Any]]]"
+
+_P, _TC, _TR = qn("w:p"), qn("w:tc"), qn("w:tr")
+_NS_DECLARATION_RE = re.compile(rb' xmlns(?::[\w.-]+)?="[^"]*"')
 
 
 class Table(StoryChild):
@@ -33,6 +62,7 @@ class Table(StoryChild):
         super(Table, self).__init__(parent)
         self._element = tbl
         self._tbl = tbl
+        self._geometry_cache: TableGeometry | None = None
 
     def add_column(self, width: Length):
         """Return a |_Column| object of `width`, newly added rightmost to the table."""
@@ -54,6 +84,38 @@ class Table(StoryChild):
                 tc.width = gridCol.w
         return _Row(tr, self)
 
+    def extend_rows(self, records: Iterable[Sequence[Any]], template_row: int = -1):
+        """Add a row bottom-most to this table for each of `records`, formatted like `template_row`.
+
+        Each record holds the values of the cells of its row, in order, one for each cell
+        actually present in the template row. A value of |None| leaves its cell empty and
+        any other value is written as its `str()`. A record may hold fewer values than
+        there are cells, but not more. `template_row` is the index of the row to copy and
+        defaults to the last row.
+
+        Each new cell keeps the properties of its template cell, of that cell's first
+        paragraph and of the first run in that paragraph, but none of its content. The
+        template row is prepared once, then copied for each record and all the rows
+        inserted together, which is much faster than :meth:`add_row` for thousands of rows.
+        """
+        prototype, slots = self._tbl.tr_lst[template_row].prototype()
+        trs: list[CT_Row] = []
+        for record in records:
+            if len(record) > len(slots):
+                raise ValueError(
+                    f"record has {len(record)} values but template row has {len(slots)} cells"
+                )
+            tr = copy.deepcopy(prototype)
+            for (tc_idx, p_idx, r_idx), value in itertools.zip_longest(slots, record):
+                p = tr[tc_idx][p_idx]
+                text = "" if value is None else str(value)
+                if text:
+                    _RunContentAppender.append_to_run_from_text(p[r_idx], text)
+                else:
+                    p.remove(p[r_idx])
+            trs.append(tr)
+        self._tbl.extend(trs)
+
     @property
     def alignment(self) -> WD_TABLE_ALIGNMENT | None:
         """Read/write.
@@ -87,8 +149,12 @@ class Table(StoryChild):
 
         (0, 0) is the top, left-most cell.
         """
-        cell_idx = col_idx + (row_idx * self._column_count)
-        return self._cells[cell_idx]
+        tc = self._geometry.cell_tc(row_idx, col_idx)
+        if tc is None:
+            cell_idx = col_idx + (row_idx * self._column_count)
+            return self._cells[cell_idx]
+        cache = proxy_cache_of(self)
+        return _Cell(tc, self) if cache is None else cache.get(tc, _Cell, self)
 
     def column_cells(self, column_idx: int) -> list[_Cell]:
         """Sequence of cells in the column at `column_idx` in this table."""
@@ -160,6 +226,55 @@ class Table(StoryChild):
     def table_direction(self, value: WD_TABLE_DIRECTION | None):
         self._element.bidiVisual_val = value
 
+    def to_columns(self, fill_merged: bool = True, nested: bool = False) -> list[list[str]]:
+        """The text of each cell of the layout grid of this table, as a list per column.
+
+        The transpose of :meth:`to_records`, taking the same arguments.
+        """
+        return [list(column) for column in zip(*self.to_records(fill_merged, nested))]
+
+    def to_records(self, fill_merged: bool = True, nested: bool = False) -> list[list[str]]:
+        """The text of each cell of the layout grid of this table, as a list per row.
+
+        Every row has an item for each grid column, "" for a grid position no cell covers.
+        A cell spanning several positions, horizontally or vertically, has its text at
+        each of them, or only at its top-left one when `fill_merged` is False. The text of
+        a cell is that of its paragraphs, one per line, as for :attr:`_Cell.text`, and also
+        includes the paragraphs of any tables nested in it when `nested` is True.
+
+        The XML is read in a single pass without creating any cell or paragraph objects,
+        which is much faster than reading the `.text` of each of :attr:`_Row.cells`.
+        """
+        col_count = self._tbl.col_count
+        records: list[list[str]] = []
+        above = [""] * col_count
+        for tr in self._tbl.iterchildren(_TR):
+            record = [""] * col_count
+            # -- text of the cell covering each grid position, whether or not it starts there --
+            texts = [""] * col_count
+            offset = tr_grid_before(tr)
+            for tc in tr.iterchildren(_TC):
+                # -- a malformed row can have cells beyond the grid, with no column to go in --
+                if offset >= col_count:
+                    break
+                span = tc_grid_span(tc)
+                continues = tc_vMerge(tc) == ST_Merge.CONTINUE
+                if continues:
+                    text = above[offset]
+                else:
+                    ps = tc.iter(_P) if nested else tc.iterchildren(_P)
+                    text = "\n".join(paragraph_text(p) for p in ps)  # pyright: ignore
+                end = min(offset + span, col_count)
+                texts[offset:end] = [text] * (end - offset)
+                if fill_merged:
+                    record[offset:end] = [text] * (end - offset)
+                elif not continues:
+                    record[offset] = text
+                offset = end
+            records.append(record)
+            above = texts
+        return records
+
     @property
     def _cells(self) -> list[_Cell]:
         """A sequence of |_Cell| objects, one for each cell of the layout grid.
@@ -168,6 +283,7 @@ class Table(StoryChild):
         repeated.
         """
         col_count = self._column_count
+        cache = proxy_cache_of(self)
         cells: list[_Cell] = []
         for tc in self._tbl.iter_tcs():
             for grid_span_idx in range(tc.grid_span):
@@ -176,7 +292,7 @@ class Table(StoryChild):
                 elif grid_span_idx > 0:
                     cells.append(cells[-1])
                 else:
-                    cells.append(_Cell(tc, self))
+                    cells.append(_Cell(tc, self) if cache is None else cache.get(tc, _Cell, self))
         return cells
 
     @property
@@ -184,14 +300,104 @@ class Table(StoryChild):
         """The number of grid columns in this table."""
         return self._tbl.col_count
 
+    @property
+    def _geometry(self) -> TableGeometry:
+        """The |TableGeometry| of this table, indexed again only once its shape has changed."""
+        geometry = self._geometry_cache
+        if geometry is None or not geometry.is_current:
+            geometry = self._geometry_cache = TableGeometry(self._tbl)
+        return geometry
+
     @property
     def _tblPr(self) -> CT_TblPr:
         return self._tbl.tblPr
 
 
+class TableStreamWriter:
+    """Writes rows of a table from records as its document is saved, without keeping them.
+
+    Created by :meth:`.Document.add_table_stream`. Each record is made into a row, written
+    and discarded in turn, so memory use does not grow with the number of records.
+
+    `records` is either an iterable, consumed by the first write, or a function returning
+    a fresh iterable of the records each time it is called, so the table can be written
+    any number of times.
+    """
+
+    def __init__(self, table: Table, records: Records, rPrs: Sequence[CT_RPr | None] = ()):
+        self._table = table
+        self._records: Records | None = records
+        self._rPrs = rPrs
+
+    @property
+    def consumed(self) -> bool:
+        """True when the records were an iterable, used up by writing the table once."""
+        return self._records is None
+
+    @property
+    def table(self) -> Table:
+        """The |Table| the rows are written in.
+
+        It holds the header row, if any, but none of the streamed rows. Its properties,
+        like its style or alignment, can still be changed until the document is saved.
+        """
+        return self._table
+
+    def write(self, stream: IO[bytes]):
+        """Write the `w:tbl` element of the table to `stream`, consuming the records.
+
+        Its properties, grid and existing rows are written once, followed by a `w:tr`
+        element for each record. The values of a record go in the cells of its row in
+        order, formatted as their column. A value of |None| leaves its cell empty and any
+        other value is written as its `str()`. Raises |ValueError| on a record having
+        more values than the table has columns, and when the records were an iterable
+        already consumed by an earlier write.
+
+        A table needs at least one row, so a single empty row is written when the table
+        has no rows and there are no records.
+        """
+        if self._records is None:
+            raise ValueError(
+                "the records of this table were consumed when it was first saved, pass a"
+                " function returning them to save it again"
+            )
+        if callable(self._records):
+            records = self._records()
+        else:
+            records, self._records = self._records, None
+        tbl = self._table._tbl  # pyright: ignore[reportPrivateUsage]
+        factory = RowFactory([gridCol.w for gridCol in tbl.tblGrid.gridCol_lst], self._rPrs)
+        tbl_xml = etree.tostring(tbl, encoding="UTF-8", xml_declaration=False, with_tail=False)
+        end_tag_idx = tbl_xml.rindex(b"</")
+        # -- a row serialized on its own declares the namespaces it uses, which `w:tbl`
+        # -- already does, so those declarations are removed from each row
+        declarations = _NS_DECLARATION_RE.findall(tbl_xml[: tbl_xml.index(b">")])
+        stream.write(tbl_xml[:end_tag_idx])
+        has_rows = bool(tbl.tr_lst)
+        for record in records:
+            texts = ["" if value is None else str(value) for value in record]
+            stream.write(_without_declarations(factory.new_tr(texts), declarations))
+            has_rows = True
+        if not has_rows:
+            stream.write(_without_declarations(factory.new_tr([]), declarations))
+        stream.write(tbl_xml[end_tag_idx:])
+
+
+def _without_declarations(element: etree._Element, declarations: Sequence[bytes]) -> bytes:
+    """The XML of `element` without those of the namespace `declarations` on its start tag."""
+    xml = etree.tostring(element, encoding="UTF-8", xml_declaration=False)
+    start_tag_end = xml.index(b">")
+    start_tag = xml[:start_tag_end]
+    for declaration in declarations:
+        start_tag = start_tag.replace(declaration, b"", 1)
+    return start_tag + xml[start_tag_end:]
+
+
 class _Cell(BlockItemContainer):
     """Table cell."""
 
+    __slots__ = ("_tc",)
+
     def __init__(self, tc: CT_Tc, parent: TableParent):
         super(_Cell, self).__init__(tc, cast("t.ProvidesStoryPart", parent))
         self._parent = parent
@@ -241,7 +447,10 @@ class _Cell(BlockItemContainer):
         Raises |InvalidSpanError| if the cells do not define a rectangular region.
         """
         tc, tc_2 = self._tc, other_cell._tc
-        merged_tc = tc.merge(tc_2)
+        parent = self._parent
+        # -- the table keeps the positions of its cells from one merge to the next --
+        geometry = parent._geometry if isinstance(parent, Table) else None  # pyright: ignore
+        merged_tc = tc.merge(tc_2, geometry)
         return _Cell(merged_tc, self._parent)
 
     @property
@@ -387,6 +596,8 @@ class _Columns(Parented):
 class _Row(Parented):
     """Table row."""
 
+    __slots__ = ("_tr", "_element")
+
     def __init__(self, tr: CT_Row, parent: TableParent):
         super(_Row, self).__init__(parent)
         self._parent = parent
@@ -426,10 +637,13 @@ class _Row(Parented):
 
             # -- Otherwise, vMerge is either "restart" or None, meaning this `tc` holds the actual
             # -- content of the cell (whether it is vertically merged or not).
-            cell = _Cell(tc, self.table)
+            cell = _Cell(tc, table) if cache is None else cache.get(tc, _Cell, table)
             for _ in range(tc.grid_span):
                 yield cell
 
+        table = self.table
+        cache = proxy_cache_of(table)
+
         def _iter_row_cells() -> Iterator[_Cell]:
             """Generate `_Cell` instance for each populated layout-grid cell in this row."""
             for tc in self._tr.tc_lst:
@@ -526,7 +740,10 @@ class _Rows(Parented):
         return list(self)[idx]
 
     def __iter__(self):
-        return (_Row(tr, self) for tr in self._tbl.tr_lst)
+        cache = proxy_cache_of(self)
+        if cache is None:
+            return (_Row(tr, self) for tr in self._tbl.tr_lst)
+        return (cache.get(tr, _Row, self) for tr in self._tbl.tr_lst)
 
     def __len__(self):
         return len(self._tbl.tr_lst)
@@ -0,0 +1,336 @@
+"""Templates analysed once then rendered many times, for mail-merge style documents.
+
+A template is a ``.docx`` file containing placeholders like ``{{ name }}`` or
+``{{ customer.address }}``. A placeholder may be split over several runs. It takes the
+formatting of the run where it starts.
+
+A repeating region is delimited by two paragraphs, one holding only ``{{#items}}`` and
+one holding only ``{{/items}}``. The region is rendered once for each item of `items`.
+When both marker paragraphs are in the same body, cell, header or footer, the paragraphs
+and tables between them are repeated. When they are in rows of the same table,
+possibly the same row, the rows from the one holding the opening marker to the one
+holding the closing marker are repeated. Regions can be nested. Within a region,
+names are looked up in the current item first, then in the enclosing items and
+finally in the context.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import re
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Mapping, Sequence, Tuple, cast
+
+from skelmis.docx.exceptions import TemplateError
+from skelmis.docx.opc.part import XmlPart
+from skelmis.docx.oxml.ns import qn
+from skelmis.docx.oxml.parser import OxmlElement
+from skelmis.docx.parts.document import DocumentPart
+from skelmis.docx.parts.hdrftr import FooterPart, HeaderPart
+from skelmis.docx.text.search import (
+    iter_text_runs,
+    locate_span,
+    paragraph_text,
+    run_text,
+    splice_runs,
+)
+
+if TYPE_CHECKING:
+    from skelmis.docx.document import Document
+    from skelmis.docx.opc.part import Part
+    from skelmis.docx.oxml.xmlchemy import BaseOxmlElement
+    from skelmis.docx.package import Package
+
+_P, _TR = qn("w:p"), qn("w:tr")
+
+_FIELD = re.compile(r"\{\{\s*([A-Za-z_][\w.]*)\s*\}\}")
+_MARKER = re.compile(r"\{\{\s*([#/])\s*([A-Za-z_][\w.]*)\s*\}\}")
+
+_MISSING = object()
+
+
+class Template:
+    """A `.docx` template, ready to be rendered with different data.
+
+    Use :meth:`compile` to create one. Compiling opens the template and finds its
+    placeholders and repeating regions once. Each :meth:`render` then copies the
+    already-parsed stories holding placeholders and fills in those locations directly,
+    without searching the document again. The other XML parts, like the styles, are
+    kept serialized and shared by the rendered documents until one of them is used, so
+    they are neither copied nor serialized again for a document that is only saved.
+    """
+
+    def __init__(self, package: Package, stories: Dict[str, List[_Node]]):
+        self._package = package
+        self._stories = stories
+
+    @classmethod
+    def compile(cls, docx: str | Path | IO[bytes]) -> Template:
+        """Return a |Template| for the ``.docx`` file at path or in stream `docx`.
+
+        Raises |TemplateError| when the repeating-region markers of the template are not
+        balanced, share a paragraph with other text or are placed where their region
+        can't be determined.
+        """
+        from skelmis.docx.api import Document
+
+        package = cast("Package", Document(docx).part.package)
+        stories: Dict[str, List[_Node]] = {}
+        for part in package.iter_parts():
+            root = _story_root(part)
+            if root is None:
+                continue
+            nodes = _compile(root)
+            if nodes:
+                stories[part.partname] = nodes
+        main_document_part = package.main_document_part
+        for part in package.iter_parts():
+            if not isinstance(part, XmlPart) or part is main_document_part:
+                continue
+            if part.partname not in stories:
+                part.defer_parsing()
+        return cls(package, stories)
+
+    def render(self, context: Mapping[str, Any]) -> Document:
+        """Return a new |Document| made from this template filled in from `context`.
+
+        A dotted name like ``customer.address`` looks up each further name in the value
+        of the one before, by key for a mapping and by attribute otherwise. A value of
+        |None| renders as empty text and any other value as its `str()`. Raises
+        |KeyError| when a name is not found.
+        """
+        package = cast("Package", self._package.clone())
+        for part in package.iter_parts():
+            nodes = self._stories.get(part.partname)
+            if nodes:
+                _render(cast("BaseOxmlElement", _story_root(part)), nodes, (context,))
+        return package.main_document_part.document
+
+
+class _Node:
+    """A location in a story that rendering fills in.
+
+    `path` is the child index of each element from the story root, or from the region
+    holding the node, down to the element.
+    """
+
+    path: Tuple[int, ...] = ()
+
+    def render(self, element: BaseOxmlElement, scopes: Sequence[Any]):
+        """Fill in `element`, the copy of this node's element, from `scopes`."""
+        raise NotImplementedError("must be implemented by each subclass")
+
+
+class _Fields(_Node):
+    """The placeholders of a paragraph, each with the run span it occupies."""
+
+    def __init__(self, fields: List[Tuple[int, int, int, int, str]]):
+        self._fields = fields
+
+    def render(self, element: BaseOxmlElement, scopes: Sequence[Any]):
+        runs = list(iter_text_runs(element))  # pyright: ignore[reportArgumentType]
+        edits = [
+            (first, start, last, stop, _format(_lookup(scopes, name)))
+            for first, start, last, stop, name in self._fields
+        ]
+        splice_runs(runs, [run_text(r) for r in runs], edits)
+
+
+class _Region(_Node):
+    """A repeating region, its content kept apart and an empty anchor left in its place.
+
+    `content` is a scratch element holding the repeated paragraphs and tables, or rows,
+    and `nodes` are the nodes within that content.
+    """
+
+    def __init__(self, name: str, content: BaseOxmlElement, nodes: List[_Node]):
+        self._name = name
+        self._content = content
+        self._nodes = nodes
+
+    def render(self, element: BaseOxmlElement, scopes: Sequence[Any]):
+        for item in _lookup(scopes, self._name):
+            content = copy.deepcopy(self._content)
+            _render(content, self._nodes, (item, *scopes))
+            for child in list(content):
+                element.addprevious(child)
+        parent = element.getparent()
+        if parent is not None:
+            parent.remove(element)
+
+
+def _compile(root: BaseOxmlElement) -> List[_Node]:
+    """Return the nodes of the story or region content `root`.
+
+    The content of each repeating region is moved out of `root` and an anchor left in
+    its place.
+    """
+    targets: List[Tuple[_Node, BaseOxmlElement]] = [
+        (region, anchor) for anchor, region in _extract_regions(root)
+    ]
+    for p in root.iter(_P):
+        runs = list(iter_text_runs(p))  # pyright: ignore[reportArgumentType]
+        texts = [run_text(r) for r in runs]
+        text = "".join(texts)
+        if "{{" not in text:
+            continue
+        ends = list(itertools.accumulate(len(t) for t in texts))
+        fields = [
+            (*locate_span(ends, m.start(), m.end()), m.group(1)) for m in _FIELD.finditer(text)
+        ]
+        if fields:
+            targets.append((_Fields(fields), p))  # pyright: ignore[reportArgumentType]
+
+    for node, element in targets:
+        node.path = _path(root, element)
+    return [node for node, _ in targets]
+
+
+def _extract_regions(root: BaseOxmlElement) -> List[Tuple[BaseOxmlElement, _Region]]:
+    """Move the content of each outermost repeating region in `root` out of it.
+
+    Returns the anchor left in place of each region, paired with the region.
+    """
+    stack: List[Tuple[str, BaseOxmlElement]] = []
+    pairs: List[Tuple[str, BaseOxmlElement, BaseOxmlElement]] = []
+    for p in root.iter(_P):
+        text = paragraph_text(p).strip()  # pyright: ignore[reportArgumentType]
+        match = _MARKER.fullmatch(text)
+        if match is None:
+            stray = _MARKER.search(text)
+            if stray is not None:
+                raise TemplateError(f"'{stray.group()}' must be alone in its paragraph")
+            continue
+        kind, name = match.groups()
+        if kind == "#":
+            stack.append((name, p))
+            continue
+        if not stack or stack[-1][0] != name:
+            raise TemplateError(f"'{{{{/{name}}}}}' has no matching '{{{{#{name}}}}}'")
+        _, open_p = stack.pop()
+        if not stack:
+            pairs.append((name, open_p, p))
+    if stack:
+        raise TemplateError(f"'{{{{#{stack[-1][0]}}}}}' has no matching closing marker")
+
+    return [_extract_region(name, open_p, close_p) for name, open_p, close_p in pairs]
+
+
+def _extract_region(
+    name: str, open_p: BaseOxmlElement, close_p: BaseOxmlElement
+) -> Tuple[BaseOxmlElement, _Region]:
+    """Move the region between marker paragraphs `open_p` and `close_p` into a scratch element.
+
+    Returns the anchor left in place of the region and the region.
+    """
+    parent = open_p.getparent()
+    if parent is not None and parent is close_p.getparent():
+        content = cast("BaseOxmlElement", OxmlElement("w:body"))
+        items = _siblings_between(open_p, close_p)[1:-1]
+        anchor = OxmlElement("w:p")
+        open_p.addprevious(anchor)
+        parent.remove(open_p)
+        parent.remove(close_p)
+    else:
+        open_tr, close_tr = _ancestor_tr(open_p), _ancestor_tr(close_p)
+        if open_tr is None or close_tr is None or open_tr.getparent() is not close_tr.getparent():
+            raise TemplateError(
+                f"markers of region '{name}' must be in the same container or in rows of"
+                f" the same table"
+            )
+        items = _siblings_between(open_tr, close_tr)
+        if not items:
+            raise TemplateError(f"'{{{{/{name}}}}}' comes before '{{{{#{name}}}}}'")
+        for marker in (open_p, close_p):
+            tc = marker.getparent()
+            tc.remove(marker)  # pyright: ignore[reportOptionalMemberAccess]
+            # -- a cell must contain at least one paragraph --
+            if tc is not None and tc.find(_P) is None:
+                tc.append(OxmlElement("w:p"))
+        content = cast("BaseOxmlElement", OxmlElement("w:tbl"))
+        anchor = OxmlElement("w:tr")
+        open_tr.addprevious(anchor)
+
+    for item in items:
+        content.append(item)
+    return cast("BaseOxmlElement", anchor), _Region(name, content, _compile(content))
+
+
+def _siblings_between(first: BaseOxmlElement, last: BaseOxmlElement) -> List[BaseOxmlElement]:
+    """Return `first`, its following siblings up to `last`, and `last`.
+
+    Returns an empty list when `last` does not follow `first`.
+    """
+    siblings = [first]
+    element = first
+    while element is not last:
+        element = element.getnext()
+        if element is None:
+            return []
+        siblings.append(element)
+    return siblings
+
+
+def _ancestor_tr(element: BaseOxmlElement) -> BaseOxmlElement | None:
+    """The table row nearest above `element`, |None| if not in a table."""
+    return next(element.iterancestors(_TR), None)
+
+
+def _path(root: BaseOxmlElement, element: BaseOxmlElement) -> Tuple[int, ...]:
+    """The child index of each element from `root` down to `element`."""
+    path: List[int] = []
+    while element is not root:
+        parent = element.getparent()
+        path.append(parent.index(element))  # pyright: ignore[reportOptionalMemberAccess]
+        element = parent  # pyright: ignore[reportAssignmentType]
+    return tuple(reversed(path))
+
+
+def _render(root: BaseOxmlElement, nodes: List[_Node], scopes: Sequence[Any]):
+    """Fill in `nodes` of `root`, a copy of the story or region content they came from."""
+    # -- find every element before changing any, since changes shift child indexes --
+    targets = []
+    for node in nodes:
+        element = root
+        for idx in node.path:
+            element = element[idx]
+        targets.append((node, element))
+    for node, element in targets:
+        node.render(element, scopes)
+
+
+def _lookup(scopes: Sequence[Any], name: str) -> Any:
+    """The value of dotted `name`, its first name looked up in each of `scopes` in turn."""
+    first, *rest = name.split(".")
+    for scope in scopes:
+        value = _get(scope, first)
+        if value is not _MISSING:
+            break
+    else:
+        raise KeyError(name)
+    for attr in rest:
+        value = _get(value, attr)
+        if value is _MISSING:
+            raise KeyError(name)
+    return value
+
+
+def _get(obj: Any, name: str) -> Any:
+    """The item `name` of `obj` when a mapping, otherwise its attribute `name`."""
+    if isinstance(obj, Mapping):
+        return cast("Mapping[str, Any]", obj).get(name, _MISSING)
+    return getattr(obj, name, _MISSING)
+
+
+def _format(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _story_root(part: Part) -> BaseOxmlElement | None:
+    """The element holding the content of `part` when it is a story part, else |None|."""
+    if isinstance(part, DocumentPart):
+        return part.element.body
+    if isinstance(part, (HeaderPart, FooterPart)):
+        return part.element
+    return None
@@ -0,0 +1,134 @@
+"""Compacting the XML of a story by removing the markup that doesn't change its content.
+
+Word records spell-checking state in `w:proofErr` elements and editing sessions in
+`w:rsid*` attributes, and starts a new run at each of them, so a paragraph edited a few
+times often has many runs with the same formatting. Removing that markup and merging the
+runs it split makes the part smaller and every later traversal of its runs faster, while
+the text and formatting stay the same.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Tuple
+
+from lxml import etree
+
+from skelmis.docx.oxml.ns import nsmap, qn
+
+if TYPE_CHECKING:
+    from skelmis.docx.oxml.xmlchemy import BaseOxmlElement
+
+_P, _HYPERLINK, _R, _RPR = qn("w:p"), qn("w:hyperlink"), qn("w:r"), qn("w:rPr")
+_T, _PROOF_ERR, _XML_SPACE = qn("w:t"), qn("w:proofErr"), qn("xml:space")
+_RSID_PREFIX = "{%s}rsid" % nsmap["w"]
+_iter_rsid_elements = etree.XPath(
+    "descendant-or-self::*[@*[namespace-uri() = $w and starts-with(local-name(), 'rsid')]]"
+)
+# -- the run content that can be moved into the run before without changing its meaning --
+_MERGEABLE_TAGS = frozenset(
+    qn(tag)
+    for tag in (
+        "w:br",
+        "w:cr",
+        "w:lastRenderedPageBreak",
+        "w:noBreakHyphen",
+        "w:ptab",
+        "w:softHyphen",
+        "w:t",
+        "w:tab",
+    )
+)
+
+
+def compact_story(
+    root: BaseOxmlElement,
+    merge_runs: bool = True,
+    drop_rsids: bool = True,
+    drop_proof_errors: bool = True,
+) -> int:
+    """Remove the markup of story `root` that doesn't change its content.
+
+    `drop_proof_errors` removes the `w:proofErr` elements and `drop_rsids` the `w:rsid*`
+    attributes of every element. `merge_runs` then removes the runs having no content and
+    merges each run into the one before it when both have the same formatting, the same
+    attributes and only text-like content. Returns the number of elements removed.
+    """
+    count = 0
+    if drop_proof_errors:
+        for proofErr in list(root.iter(_PROOF_ERR)):
+            proofErr.getparent().remove(proofErr)  # pyright: ignore[reportOptionalMemberAccess]
+            count += 1
+    if drop_rsids:
+        for e in _iter_rsid_elements(root, w=nsmap["w"]):  # pyright: ignore
+            for name in [name for name in e.attrib if name.startswith(_RSID_PREFIX)]:
+                del e.attrib[name]
+    if merge_runs:
+        for container in root.iter(_P, _HYPERLINK):
+            count += merge_runs_in(container)
+    return count
+
+
+def merge_runs_in(container: BaseOxmlElement) -> int:
+    """Merge the runs directly in `container`, a paragraph or hyperlink, in a single pass.
+
+    A run having no content is removed. A run having the same formatting and attributes as
+    the run just before it is appended to that run. Runs are only merged when both hold
+    nothing but text-like content, such as text, tabs and breaks, and nothing else comes
+    between them. Returns the number of runs removed.
+    """
+    count = 0
+    prev, prev_key = None, None
+    for child in list(container):
+        if child.tag != _R:
+            prev = None
+            continue
+        if len(child) == 0 or (len(child) == 1 and child[0].tag == _RPR):
+            container.remove(child)
+            count += 1
+            continue
+        key = _merge_key(child)
+        if key is not None and key == prev_key and prev is not None:
+            _append_run_content(prev, child)
+            container.remove(child)
+            count += 1
+        else:
+            prev, prev_key = (None, None) if key is None else (child, key)
+    return count
+
+
+def _append_run_content(r: BaseOxmlElement, other_r: BaseOxmlElement):
+    """Move the content of `other_r` to the end of `r`, joining text where they meet."""
+    for e in list(other_r):
+        if e.tag == _RPR:
+            continue
+        last = r[-1]
+        if e.tag == _T and last.tag == _T:
+            text = (last.text or "") + (e.text or "")
+            last.text = text
+            if len(text.strip()) < len(text):
+                last.set(_XML_SPACE, "preserve")
+        else:
+            r.append(e)
+
+
+def _canonical(e: BaseOxmlElement) -> Tuple[Any, ...]:
+    """A value equal for elements having the same tag, attributes, text and children.
+
+    Compares like their canonical XML does, but without serializing them.
+    """
+    return (e.tag, sorted(e.attrib.items()), e.text, [_canonical(child) for child in e])
+
+
+def _merge_key(r: BaseOxmlElement) -> Tuple[Any, ...] | None:
+    """The attributes and canonical formatting of `r`, equal for runs that can be merged.
+
+    |None| when `r` has content that can't be merged, such as a drawing or a field
+    character.
+    """
+    rPr = None
+    for e in r:
+        if e.tag == _RPR:
+            rPr = e
+        elif e.tag not in _MERGEABLE_TAGS:
+            return None
+    return (sorted(r.attrib.items()), None if rPr is None else _canonical(rPr))
@@ -26,6 +26,8 @@ class Hyperlink(Parented):
     stored.
     """
 
+    __slots__ = ("_hyperlink", "_element")
+
     def __init__(self, hyperlink: CT_Hyperlink, parent: t.ProvidesStoryPart):
         super().__init__(parent)
         self._parent = parent
@@ -0,0 +1,189 @@
+"""The pages of a document as last laid out by the application that saved it.
+
+`python-docx` has no layout engine of its own. The page breaks used here are those
+Word records when it saves a document, a `w:lastRenderedPageBreak` element where each
+page ended, together with the explicit page breaks, a `w:br w:type="page"` element,
+inserted by the author. Pages are found in a single pass over the XML of the body,
+without creating proxy objects or copying paragraphs.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from typing import TYPE_CHECKING, Iterator, List, Pattern, Sequence, Tuple, overload
+
+from skelmis.docx.oxml.ns import qn
+from skelmis.docx.text.search import compile_pattern, iter_text_runs
+
+if TYPE_CHECKING:
+    from skelmis.docx.oxml.document import CT_Body
+    from skelmis.docx.oxml.text.paragraph import CT_P
+    from skelmis.docx.oxml.xmlchemy import BaseOxmlElement
+
+_P, _TBL, _TR, _TC = qn("w:p"), qn("w:tbl"), qn("w:tr"), qn("w:tc")
+_BR, _LAST_RENDERED_PAGE_BREAK, _TYPE = qn("w:br"), qn("w:lastRenderedPageBreak"), qn("w:type")
+# -- the run content having a text equivalent, as in `CT_R.text`, and the page breaks --
+_RUN_CONTENT_TAGS = tuple(
+    qn(tag) for tag in ("w:br", "w:cr", "w:noBreakHyphen", "w:ptab", "w:t", "w:tab")
+) + (_LAST_RENDERED_PAGE_BREAK,)
+
+
+class Page:
+    """A page of the body of a document, its text and the block items on it."""
+
+    def __init__(self, number: int, text: str, blocks: range):
+        self._number = number
+        self._text = text
+        self._blocks = blocks
+
+    @property
+    def blocks(self) -> range:
+        """Indices of the paragraphs and tables on this page, in `Document.iter_inner_content()`.
+
+        A paragraph or table continued from the page before, or on the page after, is
+        included.
+        """
+        return self._blocks
+
+    @property
+    def number(self) -> int:
+        """The number of this page, the first page being 1."""
+        return self._number
+
+    @property
+    def text(self) -> str:
+        """The text on this page, the text of each paragraph or part of one on a line."""
+        return self._text
+
+
+class PageIndex(Sequence[Page]):
+    """The pages of a document, for finding the page of a block item or of search results."""
+
+    def __init__(self, pages: List[Page]):
+        self._pages = pages
+        self._block_stops = [page.blocks.stop for page in pages]
+
+    @overload
+    def __getitem__(self, idx: int) -> Page: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[Page]: ...
+
+    def __getitem__(self, idx: int | slice) -> Page | List[Page]:
+        return self._pages[idx]
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def page_of_block(self, block_idx: int) -> Page:
+        """The |Page| the block item at `block_idx` starts on.
+
+        Raises |IndexError| when the body has no block item at `block_idx`.
+        """
+        idx = bisect.bisect_right(self._block_stops, block_idx)
+        if block_idx < 0 or idx == len(self._pages):
+            raise IndexError(f"no block item at index {block_idx}")
+        return self._pages[idx]
+
+    def search(
+        self, pattern: str | Pattern[str], regex: bool = False
+    ) -> Iterator[Tuple[Page, re.Match[str]]]:
+        """Generate each match of `pattern` in the text of each page, with its page.
+
+        A str `pattern` is matched literally unless `regex` is True. Matches are found
+        within the text of a page, so text running on from one page to the next is not
+        matched.
+        """
+        compiled = compile_pattern(pattern, regex)
+        for page in self._pages:
+            for match in compiled.finditer(page.text):
+                yield page, match
+
+
+def iter_pages(body: CT_Body) -> Iterator[Page]:
+    """Generate each |Page| of `body`, in order.
+
+    A `w:lastRenderedPageBreak` following an explicit page break with no text between
+    them marks the same page break, so is not counted again. The body always has at least
+    one page.
+    """
+    splitter = _PageSplitter()
+    block_idx = -1
+    for block_idx, child in enumerate(body.iterchildren(_P, _TBL)):
+        for p in [child] if child.tag == _P else _iter_table_p(child):
+            splitter.add_paragraph(p, block_idx)  # pyright: ignore[reportArgumentType]
+            yield from splitter.pop_pages()
+    yield splitter.last_page(block_idx + 1)
+
+
+class _PageSplitter:
+    """Collects the text of paragraphs into pages, starting a new page at each page break."""
+
+    def __init__(self):
+        self._pages: List[Page] = []
+        self._number = 1
+        # -- the block items having content on the current page --
+        self._first_block = self._block_stop = 0
+        self._lines: List[str] = []
+        # -- the text so far of the paragraph being added, on the current page --
+        self._fragment: List[str] = []
+        # -- True from an explicit page break until the next text --
+        self._after_page_break = False
+
+    def add_paragraph(self, p: CT_P, block_idx: int):
+        """Add the text of `p`, in the block item at `block_idx`, breaking pages within it."""
+        for r in iter_text_runs(p):
+            for e in r.iterchildren(*_RUN_CONTENT_TAGS):
+                if e.tag == _LAST_RENDERED_PAGE_BREAK:
+                    if not self._after_page_break:
+                        self._break_page(block_idx)
+                    self._after_page_break = False
+                elif e.tag == _BR and e.get(_TYPE) == "page":
+                    self._break_page(block_idx)
+                    self._after_page_break = True
+                else:
+                    text = str(e)
+                    if text:
+                        self._fragment.append(text)
+                        self._after_page_break = False
+        self._lines.append("".join(self._fragment))
+        self._fragment = []
+        self._block_stop = block_idx + 1
+
+    def last_page(self, block_count: int) -> Page:
+        """The page holding the end of the body, which has `block_count` block items."""
+        return Page(self._number, "\n".join(self._lines), range(self._first_block, block_count))
+
+    def pop_pages(self) -> List[Page]:
+        """The pages completed since the last call."""
+        pages, self._pages = self._pages, []
+        return pages
+
+    def _break_page(self, block_idx: int):
+        """End the current page within or just before the block item at `block_idx`."""
+        if self._fragment:
+            self._lines.append("".join(self._fragment))
+            self._block_stop = block_idx + 1
+        self._pages.append(
+            Page(
+                self._number,
+                "\n".join(self._lines),
+                range(self._first_block, max(self._block_stop, self._first_block)),
+            )
+        )
+        self._number += 1
+        self._first_block = self._block_stop = block_idx
+        self._lines = []
+        self._fragment = []
+
+
+def _iter_table_p(tbl: BaseOxmlElement) -> Iterator[BaseOxmlElement]:
+    """Generate the `w:p` elements in the cells of `tbl`, including nested tables, in order."""
+    for tr in tbl.iterchildren(_TR):
+        for tc in tr.iterchildren(_TC):
+            for child in tc.iterchildren(_P, _TBL):
+                if child.tag == _P:
+                    yield child
+                else:
+                    yield from _iter_table_p(child)
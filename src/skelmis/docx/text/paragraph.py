@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING, Iterator, List, cast
 
 from skelmis.docx.enum.style import WD_STYLE_TYPE
@@ -12,7 +11,7 @@ from skelmis.docx.opc.oxml import BaseOxmlElement
 from skelmis.docx.oxml import OxmlElement
 from skelmis.docx.oxml.ns import qn
 from skelmis.docx.oxml.text.run import CT_R
-from skelmis.docx.shared import Length, StoryChild, RGBColor
+from skelmis.docx.shared import Length, RGBColor, StoryChild, proxy_cache_of
 from skelmis.docx.styles.style import ParagraphStyle
 from skelmis.docx.text.hyperlink import Hyperlink
 from skelmis.docx.text.pagebreak import RenderedPageBreak
@@ -29,6 +28,8 @@ if TYPE_CHECKING:
 class Paragraph(StoryChild):
     """Proxy object wrapping a `<w:p>` element."""
 
+    __slots__ = ("_p", "_element")
+
     def __init__(self, p: CT_P, parent: t.ProvidesStoryPart):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
@@ -45,6 +46,9 @@ class Paragraph(StoryChild):
         You may leave ``display_text`` blank and instead use the ``insert_run`` method
         on the returned :py:class:`Hyperlink` object.
 
+        The bookmark need not exist yet. Once the document is complete,
+        :meth:`.Bookmarks.unresolved_links` lists the links whose bookmark is missing.
+
         :param bookmark_name: The name of the bookmark as provided to ``add_bookmark``.
         :param display_text: The display text to put in the document and associate with this link.
         :param style: The style to associate with this link.
@@ -73,20 +77,15 @@ class Paragraph(StoryChild):
         For full control over what ends up included inside the bookmark we recommend
         using the ``_start_bookmark`` and ``_end_bookmark`` methods instead.
 
-        :param name: The name of the bookmark. Unless ``bookmark_id`` is also set
-            this name should be unique across the document.
+        :param name: The name of the bookmark, unique across the story it is added to.
         :param display_text: The text to display; and associate with; alongside the bookmark.
-        :param bookmark_id: If you don't want the internal bookmark ID to be
-            set to the ``name`` parameter, set this.
+        :param bookmark_id: The internal bookmark ID. By default a numeric ID not yet
+            used by a bookmark in the story is given.
         :returns: If display_text is not None, a Run of the text is returned else None
         :rtype: Run | None
+        :raises ValueError: When the story already has a bookmark named ``name``.
         """
-        if bookmark_id is None:
-            # ID should be unique,
-            # so we make an assumption name also is and call it a day
-            bookmark_id = re.sub(r"\s+", "_", name)
-
-        self._start_bookmark(name, bookmark_id)
+        bookmark_id = self._start_bookmark(name, bookmark_id)
 
         if display_text is not None:
             run = self.add_run(display_text)
@@ -97,14 +96,21 @@ class Paragraph(StoryChild):
             return run
         return None
 
-    def _start_bookmark(self, name: str, bookmark_id):
-        """Add's a 'bookmarkStart' entry."""
+    def _start_bookmark(self, name: str, bookmark_id=None) -> str:
+        """Add's a 'bookmarkStart' entry, returning its bookmark id.
+
+        A new numeric id is given when `bookmark_id` is None. Raises |ValueError| when the
+        story already has a bookmark named `name`.
+        """
         # http://officeopenxml.com/WPbookmark.php
         start = OxmlElement("w:bookmarkStart")
-        start.set(qn("w:id"), bookmark_id)
+        if bookmark_id is not None:
+            start.set(qn("w:id"), bookmark_id)
         start.set(qn("w:name"), name)
+        self.part.bookmarks.add(start)
         # noinspection PyTypeChecker
         self._p.append(start)
+        return start.get(qn("w:id"))
 
     def _end_bookmark(self, bookmark_id):
         """Add's a 'bookmarkEnd' entry."""
@@ -516,11 +522,13 @@ class Paragraph(StoryChild):
         precise position of the hyperlink within the paragraph text is important. Note
         that a hyperlink itself contains runs.
         """
+        cache = proxy_cache_of(self)
         for r_or_hlink in self._p.inner_content_elements:
+            proxy_cls = Run if isinstance(r_or_hlink, CT_R) else Hyperlink
             yield (
-                Run(r_or_hlink, self)
-                if isinstance(r_or_hlink, CT_R)
-                else Hyperlink(r_or_hlink, self)
+                proxy_cls(r_or_hlink, self)
+                if cache is None
+                else cache.get(r_or_hlink, proxy_cls, self)
             )
 
     @property
@@ -542,7 +550,10 @@ class Paragraph(StoryChild):
     def runs(self) -> List[Run]:
         """Sequence of |Run| instances corresponding to the <w:r> elements in this
         paragraph."""
-        return [Run(r, self) for r in self._p.r_lst]
+        cache = proxy_cache_of(self)
+        if cache is None:
+            return [Run(r, self) for r in self._p.r_lst]
+        return [cache.get(r, Run, self) for r in self._p.r_lst]
 
     @property
     def style(self) -> ParagraphStyle | None:
@@ -32,6 +32,8 @@ class Run(StoryChild):
     the style hierarchy.
     """
 
+    __slots__ = ("_r", "_element", "element")
+
     def __init__(self, r: CT_R, parent: t.ProvidesStoryPart):
         super().__init__(parent)
         self._r = self._element = self.element = r
@@ -0,0 +1,161 @@
+"""Reading and replacing paragraph text directly in the XML, without proxy objects.
+
+Word splits the text of a paragraph into runs wherever formatting, spell-checking or
+editing history happen to change, so a placeholder like "{{name}}" is often spread over
+several runs. The functions here work on the text of a paragraph as a whole and map it
+back to the runs holding each character.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import re
+from typing import TYPE_CHECKING, Callable, Iterator, Pattern, Sequence, Tuple, TypeAlias
+
+from skelmis.docx.oxml.ns import qn
+from skelmis.docx.oxml.parser import OxmlElement
+from skelmis.docx.oxml.text.run import _RunContentAppender  # pyright: ignore
+
+if TYPE_CHECKING:
+    from skelmis.docx.oxml.text.paragraph import CT_P
+    from skelmis.docx.oxml.text.run import CT_R
+
+#: The location of a stretch of paragraph text in its runs, as returned by
+#: :func:`locate_span`.
+Span: TypeAlias = Tuple[int, int, int, int]
+#: A |Span| followed by the text to replace it with.
+Edit: TypeAlias = Tuple[int, int, int, int, str]
+
+_R, _HYPERLINK, _RPR = qn("w:r"), qn("w:hyperlink"), qn("w:rPr")
+# -- the run inner-content elements having a text equivalent, as in `CT_R.text` --
+_RUN_TEXT_TAGS = tuple(
+    qn(tag) for tag in ("w:br", "w:cr", "w:noBreakHyphen", "w:ptab", "w:t", "w:tab")
+)
+
+
+def iter_text_runs(p: CT_P) -> Iterator[CT_R]:
+    """Generate the runs contributing to the text of paragraph `p`, in order.
+
+    These are the runs directly in `p` and those in its hyperlinks, the same runs whose
+    text makes up `p.text`.
+    """
+    for child in p.iterchildren(_R, _HYPERLINK):
+        if child.tag == _R:
+            yield child
+        else:
+            yield from child.iterchildren(_R)
+
+
+def run_text(r: CT_R) -> str:
+    """The text of run `r`, the same as `r.text` but without XPath."""
+    return "".join(str(e) for e in r.iterchildren(*_RUN_TEXT_TAGS))
+
+
+def paragraph_text(p: CT_P) -> str:
+    """The text of paragraph `p`, the same as `p.text` but without XPath."""
+    return "".join(run_text(r) for r in iter_text_runs(p))
+
+
+def compile_pattern(pattern: str | Pattern[str], regex: bool) -> Pattern[str]:
+    """Return `pattern` as a compiled regular expression.
+
+    A str `pattern` is matched literally unless `regex` is True.
+    """
+    if isinstance(pattern, str):
+        return re.compile(pattern if regex else re.escape(pattern))
+    return pattern
+
+
+def replace_in_paragraph(
+    p: CT_P, pattern: Pattern[str], repl: Callable[[re.Match[str]], str]
+) -> int:
+    """Replace each match of `pattern` in the text of `p` by `repl(match)`.
+
+    A match may span several runs. Its replacement goes in the run where the match
+    starts, so takes that run's formatting, and the matched text is removed from the
+    following runs. Runs left without any content are removed. Only the runs a match
+    touches are rewritten. Returns the number of replacements made.
+    """
+    runs = list(iter_text_runs(p))
+    if not runs:
+        return 0
+    texts = [run_text(r) for r in runs]
+    matches = list(pattern.finditer("".join(texts)))
+    if not matches:
+        return 0
+
+    ends = list(itertools.accumulate(len(text) for text in texts))
+    edits = [(*locate_span(ends, m.start(), m.end()), repl(m)) for m in matches]
+    splice_runs(runs, texts, edits)
+    return len(matches)
+
+
+def locate_span(ends: Sequence[int], start: int, end: int) -> Span:
+    """Locate the characters `start` to `end` of a paragraph's text in its runs.
+
+    `ends` is the offset in the paragraph text where each run ends. Returns the index of
+    the run holding the first character and the offset of that character in it, then
+    the index of the run holding the last character and the offset just past it.
+    """
+
+    def locate(idx: int, offset: int) -> Tuple[int, int]:
+        idx = min(idx, len(ends) - 1)
+        return idx, offset - (ends[idx - 1] if idx else 0)
+
+    # -- the start bisects right, into the run holding its character, and the end left,
+    # -- so a span never reaches into a run it has no characters of --
+    first, first_offset = locate(bisect.bisect_right(ends, start), start)
+    if end == start:
+        return first, first_offset, first, first_offset
+    return (first, first_offset, *locate(bisect.bisect_left(ends, end), end))
+
+
+def splice_runs(runs: Sequence[CT_R], texts: Sequence[str], edits: Sequence[Edit]):
+    """Replace the spans of run text in `edits` by their new text.
+
+    `texts` is the text of each of `runs`. Each edit is a |Span| followed by the text
+    replacing it; edits are in document order and don't overlap. A span's new text goes
+    in the run where it starts, and its characters in later runs are removed. Only runs
+    an edit touches are rewritten, and those left without any content are removed.
+    """
+    new_texts = list(texts)
+    # -- work back from the last edit so the offsets of earlier ones stay valid --
+    for first, start, last, stop, text in reversed(edits):
+        if first == last:
+            new_texts[first] = new_texts[first][:start] + text + new_texts[first][stop:]
+            continue
+        new_texts[first] = new_texts[first][:start] + text
+        for idx in range(first + 1, last):
+            new_texts[idx] = ""
+        new_texts[last] = new_texts[last][stop:]
+
+    for r, text, new_text in zip(runs, texts, new_texts):
+        if new_text != text:
+            _set_run_text(r, new_text)
+
+
+def _set_run_text(r: CT_R, text: str):
+    """Replace the text of `r` by `text`, leaving its other content in place.
+
+    The new text goes where the first of the old text elements was. A run left with no
+    content other than its properties is removed.
+    """
+    # -- a page or column break contributes no text, so is kept --
+    old = [e for e in r.iterchildren(*_RUN_TEXT_TAGS) if str(e)]
+    if text:
+        scratch = OxmlElement("w:r")
+        _RunContentAppender.append_to_run_from_text(scratch, text)
+        anchor = old[0] if old else None
+        for e in list(scratch):
+            if anchor is None:
+                r.append(e)
+            else:
+                anchor.addprevious(e)
+    for e in old:
+        r.remove(e)
+
+    if all(child.tag == _RPR for child in r):
+        parent = r.getparent()
+        if parent is not None:
+            parent.remove(r)
@@ -0,0 +1,443 @@
+"""Population of table-of-contents (TOC) fields without a round trip through Word.
+
+A TOC is a complex field: a `w:fldChar` "begin" run, a `w:instrText` run holding the
+`TOC` field instruction, a "separate" run, the field result and an "end" run, where the
+result and end may run on over following paragraphs. The result is what Word displays,
+one paragraph per entry, and is what is regenerated here from the heading paragraphs
+of the document.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from typing import TYPE_CHECKING, Dict, Iterator, List, Set, Tuple, cast
+
+from skelmis.docx.enum.style import WD_STYLE_TYPE
+from skelmis.docx.enum.text import WD_TAB_ALIGNMENT, WD_TAB_LEADER
+from skelmis.docx.oxml.ns import qn
+from skelmis.docx.oxml.parser import OxmlElement
+from skelmis.docx.shared import Pt
+from skelmis.docx.text.pages import _iter_table_p  # pyright: ignore[reportPrivateUsage]
+from skelmis.docx.text.search import iter_text_runs
+
+if TYPE_CHECKING:
+    from skelmis.docx.bookmarks import BookmarkRegistry
+    from skelmis.docx.oxml.document import CT_Body
+    from skelmis.docx.oxml.text.paragraph import CT_P
+    from skelmis.docx.oxml.xmlchemy import BaseOxmlElement
+    from skelmis.docx.shared import Length
+    from skelmis.docx.styles.styles import Styles
+
+# -- switches taking an argument, any others are flags --
+_ARG_SWITCHES = frozenset("abcdfklnopst")
+
+_NO_ENTRIES_TEXT = "No table of contents entries found."
+
+# -- (p, style-names, style-outline-level, own-outline-level, page) --
+_Heading = Tuple["CT_P", List[str], "int | None", "int | None", "int | None"]
+# -- (level, p, text, page) --
+_Entry = Tuple[int, "CT_P", str, "int | None"]
+
+
+class TocInstruction:
+    """The switches of a `TOC` field instruction such as `TOC \\o "1-3" \\h \\z \\u`.
+
+    `levels` is the (first, last) range of outline levels included, |None| when the
+    instruction has no `\\o` switch. `styles` maps the name of each style listed in a
+    `\\t` switch to the TOC level of its paragraphs. `hide_page_numbers` is the range
+    of TOC levels given no page number.
+    """
+
+    def __init__(self, instr: str):
+        self.levels: Tuple[int, int] | None = None
+        self.styles: Dict[str, int] = {}
+        self.hide_page_numbers: Tuple[int, int] = (0, 0)
+
+        switches = self._parse_switches(instr)
+        if "o" in switches:
+            self.levels = _parse_range(switches["o"]) or (1, 9)
+        if "t" in switches:
+            names_and_levels = re.split(r"[,;]", switches["t"])
+            for name, level in zip(names_and_levels[::2], names_and_levels[1::2]):
+                if level.strip().isdigit():
+                    self.styles[name.strip().lower()] = int(level)
+        if "n" in switches:
+            self.hide_page_numbers = _parse_range(switches["n"]) or (1, 9)
+        self.hyperlinks = "h" in switches
+        self.outline_levels = "u" in switches
+        if self.levels is None and not self.styles:
+            self.levels = (1, 9)
+
+    def level_of(
+        self, style_names: List[str], style_outline: int | None, own_outline: int | None
+    ) -> int | None:
+        """TOC level of a paragraph, or |None| when it is not included in the TOC.
+
+        `style_names` is the name of the paragraph's style followed by the names of the
+        styles it is based on. `style_outline` is the 1-based outline level of that style
+        and `own_outline` that of the paragraph itself, only used with the `\\u` switch.
+        """
+        for name in style_names:
+            if name.lower() in self.styles:
+                return self.styles[name.lower()]
+        outline_level = style_outline
+        if self.outline_levels and own_outline is not None:
+            outline_level = own_outline
+        if self.levels is None or outline_level is None:
+            return None
+        first, last = self.levels
+        return outline_level if first <= outline_level <= last else None
+
+    def shows_page_number(self, level: int) -> bool:
+        """True if entries at TOC `level` have a page number."""
+        first, last = self.hide_page_numbers
+        return not first <= level <= last
+
+    @staticmethod
+    def _parse_switches(instr: str) -> Dict[str, str]:
+        """Map of each switch letter in `instr` to its argument, "" for a flag."""
+        tokens = [token.strip('"') for token in re.findall(r'"[^"]*"|\S+', instr)]
+        switches: Dict[str, str] = {}
+        for idx, token in enumerate(tokens[1:], start=1):
+            if not token.startswith("\\") or len(token) < 2:
+                continue
+            switch = token[1].lower()
+            arg = tokens[idx + 1] if idx + 1 < len(tokens) else ""
+            has_arg = switch in _ARG_SWITCHES and not arg.startswith("\\")
+            switches[switch] = arg if has_arg else ""
+        return switches
+
+
+class TocUpdater:
+    """Regenerates the result of each TOC field in `body`.
+
+    Any "toc N" paragraph styles used by entries and not already present are added, with
+    a right-aligned, dot-leader tab stop for the page number at `tab_position`.
+
+    Headings are found in a single pass over the paragraphs of `body`. Page numbers are
+    counted from the `w:lastRenderedPageBreak` elements left by the application that last
+    rendered the document; when there are none the page numbers are left blank for Word
+    to fill in.
+    """
+
+    def __init__(
+        self, body: CT_Body, styles: Styles, tab_position: Length, bookmarks: BookmarkRegistry
+    ):
+        self._body = body
+        self._bookmarks = bookmarks
+        self._styles = styles
+        self._tab_position = tab_position
+        self._toc_style_ids: Dict[int, str] = {}
+
+    def update(self) -> int:
+        """Update each TOC field in the body, returning the number of fields updated."""
+        fields = list(_iter_toc_fields(self._body))
+        if not fields:
+            return 0
+
+        headings = self._headings()
+        texts: Dict[CT_P, str] = {}
+        for instr, begin_r, separate_r, end_r in fields:
+            instruction = TocInstruction(instr)
+            field_paragraphs = _field_paragraphs(begin_r, end_r)
+            entries: List[_Entry] = []
+            for p, style_names, style_outline, own_outline, page in headings:
+                level = instruction.level_of(style_names, style_outline, own_outline)
+                if level is None or p in field_paragraphs:
+                    continue
+                if p not in texts:
+                    texts[p] = p.text
+                if texts[p].strip():
+                    entries.append((level, p, texts[p], page))
+            self._write_result(instruction, entries, separate_r, end_r)
+        return len(fields)
+
+    def _headings(self) -> List[_Heading]:
+        """(p, style-names, style-outline, own-outline, page) for each paragraph in the body.
+
+        `page` is |None| when the document has no rendered page-break information.
+        """
+        styles = _StyleInfo(self._styles)
+        lrpb_tag, outlineLvl_tag = qn("w:lastRenderedPageBreak"), qn("w:outlineLvl")
+        # -- only the paragraphs of the body and its tables flow over pages, the page
+        # -- breaks rendered in a text box are not breaks of the body
+        page_breaks = {
+            p: sum(
+                1 for r in iter_text_runs(p) for _ in r.iterchildren(lrpb_tag)
+            )  # pyright: ignore
+            for p in _iter_flow_p(self._body)
+        }
+        has_rendered_pages = any(page_breaks.values())
+
+        headings: List[_Heading] = []
+        page = 1
+        for p in self._body.iter(qn("w:p")):
+            page += page_breaks.get(p, 0)
+            style_names, style_outline = styles.names_and_outline_level(p.style)
+            pPr = p.pPr
+            outlineLvl = None if pPr is None else pPr.find(outlineLvl_tag)
+            own_outline = None if outlineLvl is None else _outline_level(outlineLvl)
+            headings.append(
+                (
+                    p,
+                    style_names,
+                    style_outline,
+                    own_outline,
+                    page if has_rendered_pages else None,
+                )
+            )
+        return headings
+
+    def _write_result(
+        self,
+        instruction: TocInstruction,
+        entries: List[_Entry],
+        separate_r: BaseOxmlElement,
+        end_r: BaseOxmlElement,
+    ):
+        """Replace the result of the field between `separate_r` and `end_r` with `entries`."""
+        first_p = cast("CT_P", separate_r.getparent())
+        last_p = cast("CT_P", end_r.getparent())
+
+        # -- content following the field in its last paragraph is kept --
+        tail = list(end_r.itersiblings())
+        if last_p is not first_p:
+            for p in list(first_p.itersiblings()):
+                p.getparent().remove(p)  # pyright: ignore[reportOptionalMemberAccess]
+                if p is last_p:
+                    break
+        for e in list(separate_r.itersiblings()):
+            first_p.remove(e)
+
+        bookmarks = _BookmarkNamer(self._bookmarks)
+        paragraphs = [first_p]
+        for idx, (level, heading_p, text, page) in enumerate(entries):
+            if idx == 0:
+                p = first_p
+            else:
+                p = _new_entry_p(paragraphs[-1])
+                paragraphs.append(p)
+            p.style = self._toc_style_id(level)
+            anchor = bookmarks.bookmark(heading_p)
+            page_text = "" if page is None else str(page)
+            _append_entry(
+                p,
+                text,
+                anchor,
+                page_text if instruction.shows_page_number(level) else None,
+                instruction.hyperlinks,
+            )
+        if not entries:
+            first_p.append(_run(_t(_NO_ENTRIES_TEXT)))
+
+        last = paragraphs[-1]
+        last.append(end_r)
+        for e in tail:
+            last.append(e)
+
+    def _toc_style_id(self, level: int) -> str:
+        """Style id of the built-in "toc {level}" paragraph style, added if not present."""
+        if level not in self._toc_style_ids:
+            self._toc_style_ids[level] = self._get_or_add_toc_style_id(level)
+        return self._toc_style_ids[level]
+
+    def _get_or_add_toc_style_id(self, level: int) -> str:
+        name = f"toc {level}"
+        if name in self._styles:
+            return self._styles[name].style_id
+        style = self._styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH, builtin=True)
+        style.style_id = f"TOC{level}"
+        style.base_style = self._styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        style.paragraph_format.left_indent = Pt(11 * (level - 1))
+        style.paragraph_format.space_after = Pt(5)
+        style.paragraph_format.tab_stops.add_tab_stop(
+            self._tab_position, WD_TAB_ALIGNMENT.RIGHT, WD_TAB_LEADER.DOTS
+        )
+        return style.style_id
+
+
+class _BookmarkNamer:
+    """Provides the `_Toc` bookmark a TOC entry links to, adding it to the heading."""
+
+    def __init__(self, bookmarks: BookmarkRegistry):
+        self._bookmarks = bookmarks
+        self._names = set(bookmarks.names)
+        self._next_name = 100000000
+
+    def bookmark(self, p: CT_P) -> str:
+        """Name of the `_Toc` bookmark wrapping the content of heading paragraph `p`."""
+        for name in p.xpath("./w:bookmarkStart/@w:name"):
+            if name.startswith("_Toc"):
+                return name
+
+        name = self._new_name()
+        start = OxmlElement("w:bookmarkStart", {qn("w:name"): name})
+        self._bookmarks.add(start)
+        bookmark_id = start.get(qn("w:id"))
+        pPr = p.pPr
+        if pPr is None:
+            p.insert(0, start)
+        else:
+            pPr.addnext(start)
+        p.append(OxmlElement("w:bookmarkEnd", {qn("w:id"): bookmark_id}))
+        return name
+
+    def _new_name(self) -> str:
+        while f"_Toc{self._next_name}" in self._names:
+            self._next_name += 1
+        name = f"_Toc{self._next_name}"
+        self._names.add(name)
+        return name
+
+
+class _StyleInfo:
+    """Caches the style-names and outline level of each paragraph style by style id."""
+
+    def __init__(self, styles: Styles):
+        self._styles_elm = styles.element
+        self._cache: Dict[str | None, Tuple[List[str], int | None]] = {}
+
+    def names_and_outline_level(self, style_id: str | None) -> Tuple[List[str], int | None]:
+        """Names of style `style_id` and the styles it is based on, and its outline level.
+
+        The outline level is 1-based and taken from the nearest style in the `basedOn`
+        chain that defines one, or inferred from a built-in "heading N" style name.
+        """
+        if style_id not in self._cache:
+            self._cache[style_id] = self._lookup(style_id)
+        return self._cache[style_id]
+
+    def _lookup(self, style_id: str | None) -> Tuple[List[str], int | None]:
+        style = (
+            self._styles_elm.get_by_id(style_id)
+            if style_id
+            else self._styles_elm.default_for(WD_STYLE_TYPE.PARAGRAPH)
+        )
+        names: List[str] = []
+        outline_level: int | None = None
+        seen = set()
+        while style is not None and style.styleId not in seen:
+            seen.add(style.styleId)
+            outlineLvl = style.find(f"{qn('w:pPr')}/{qn('w:outlineLvl')}")
+            if outline_level is None and outlineLvl is not None:
+                outline_level = _outline_level(outlineLvl)
+            name = style.name_val
+            if name:
+                names.append(name)
+                match = re.fullmatch(r"heading ([1-9])", name, re.IGNORECASE)
+                if outline_level is None and match:
+                    outline_level = int(match.group(1))
+            style = style.base_style
+        return names, outline_level
+
+
+def _append_entry(p: CT_P, text: str, anchor: str, page_text: str | None, hyperlink: bool):
+    """Append the runs of a TOC entry for `text` linking to bookmark `anchor` to `p`."""
+    runs = [_run(_t(text))]
+    if page_text is not None:
+        runs.append(_run(OxmlElement("w:tab")))
+        runs.append(_run(OxmlElement("w:fldChar", {qn("w:fldCharType"): "begin"})))
+        instr = OxmlElement("w:instrText", {qn("xml:space"): "preserve"})
+        instr.text = f" PAGEREF {anchor} \\h "
+        runs.append(_run(instr))
+        runs.append(_run(OxmlElement("w:fldChar", {qn("w:fldCharType"): "separate"})))
+        runs.append(_run(_t(page_text)))
+        runs.append(_run(OxmlElement("w:fldChar", {qn("w:fldCharType"): "end"})))
+
+    parent: BaseOxmlElement = p
+    if hyperlink:
+        parent = OxmlElement("w:hyperlink", {qn("w:anchor"): anchor, qn("w:history"): "1"})
+        p.append(parent)
+    for r in runs:
+        parent.append(r)
+
+
+def _field_paragraphs(begin_r: BaseOxmlElement, end_r: BaseOxmlElement) -> Set[CT_P]:
+    """The paragraphs containing, or between, the begin and end runs of a field."""
+    begin_p, end_p = begin_r.getparent(), end_r.getparent()
+    paragraphs = {begin_p}
+    if end_p is not begin_p:
+        for p in begin_p.itersiblings():  # pyright: ignore[reportOptionalMemberAccess]
+            paragraphs.add(p)
+            if p is end_p:
+                break
+    return cast("Set[CT_P]", paragraphs)
+
+
+def _iter_flow_p(body: CT_Body) -> Iterator[BaseOxmlElement]:
+    """Generate the paragraphs of `body` and of the cells of its tables, in order."""
+    for child in body.iterchildren(qn("w:p"), qn("w:tbl")):
+        if child.tag == qn("w:p"):
+            yield child
+        else:
+            yield from _iter_table_p(child)
+
+
+def _iter_toc_fields(
+    body: CT_Body,
+) -> Iterator[Tuple[str, BaseOxmlElement, BaseOxmlElement, BaseOxmlElement]]:
+    """Generate (instr, begin_r, separate_r, end_r) for each TOC field in `body`.
+
+    Fields nested within another field, such as the PAGEREF fields in a TOC result,
+    are skipped, as are fields whose runs are not paragraph children.
+    """
+    fldChar, instrText = qn("w:fldChar"), qn("w:instrText")
+    stack: List[List] = []
+    for e in body.iter(fldChar, instrText):
+        if e.tag == instrText:
+            if stack and stack[-1][1] is None:
+                stack[-1][0] += e.text or ""
+            continue
+        fld_type = e.get(qn("w:fldCharType"))
+        r = e.getparent()
+        if fld_type == "begin":
+            stack.append(["", None, r])
+        elif fld_type == "separate" and stack:
+            stack[-1][1] = r
+        elif fld_type == "end" and stack:
+            instr, separate_r, begin_r = stack.pop()
+            if stack or separate_r is None or instr.split()[:1] != ["TOC"]:
+                continue
+            if r.getparent().tag == qn("w:p") and begin_r.getparent().tag == qn("w:p"):
+                yield instr, begin_r, separate_r, r
+
+
+def _new_entry_p(after: CT_P) -> CT_P:
+    """A new empty paragraph added after `after`, having its paragraph properties."""
+    p = OxmlElement("w:p")
+    pPr = after.pPr
+    if pPr is not None:
+        p.append(copy.deepcopy(pPr))
+    after.addnext(p)
+    return p  # pyright: ignore[reportReturnType]
+
+
+def _outline_level(outlineLvl: BaseOxmlElement) -> int | None:
+    """1-based outline level in `w:outlineLvl`.
+
+    Body text, 0-based level 9, is level 10 and so outside any TOC level range.
+    """
+    val = outlineLvl.get(qn("w:val"), "")
+    return int(val) + 1 if val.isdigit() else None
+
+
+def _parse_range(arg: str) -> Tuple[int, int] | None:
+    """(first, last) levels in a range argument such as "1-3"."""
+    match = re.fullmatch(r"\s*(\d+)\s*-\s*(\d+)\s*", arg)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def _run(*children: BaseOxmlElement) -> BaseOxmlElement:
+    r = OxmlElement("w:r")
+    for child in children:
+        r.append(child)
+    return r  # pyright: ignore[reportReturnType]
+
+
+def _t(text: str) -> BaseOxmlElement:
+    t = OxmlElement("w:t", {qn("xml:space"): "preserve"})
+    t.text = text
+    return t  # pyright: ignore[reportReturnType]
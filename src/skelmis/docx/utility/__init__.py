@@ -1,3 +1,28 @@
+from .batch import (
+    ConversionResult,
+    document_to_pdf_async,
+    document_to_pdf_many,
+    document_to_pdf_many_async,
+    update_toc_async,
+    update_toc_many,
+    update_toc_many_async,
+)
+from .cache import PdfCache
+from .converter import PdfConversionError, PdfConverter
 from .to_pdf import document_to_pdf, export_libre_macro, update_toc
 
-__all__ = ("update_toc", "export_libre_macro", "document_to_pdf")
+__all__ = (
+    "update_toc",
+    "export_libre_macro",
+    "document_to_pdf",
+    "PdfConverter",
+    "PdfConversionError",
+    "ConversionResult",
+    "PdfCache",
+    "document_to_pdf_async",
+    "document_to_pdf_many",
+    "document_to_pdf_many_async",
+    "update_toc_async",
+    "update_toc_many",
+    "update_toc_many_async",
+)
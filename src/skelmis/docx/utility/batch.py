@@ -0,0 +1,335 @@
+"""Concurrent, asyncio-based PDF conversion and TOC update of many documents.
+
+Each job runs a LibreOffice process with `asyncio.create_subprocess_exec`, so a job
+never blocks the event loop, and has its own timeout. Cancelling the awaiting task
+kills the jobs' processes. A failed job doesn't stop the others; its failure is
+reported in its |ConversionResult|.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import secrets
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, List, Sequence
+
+from .cache import PdfCache
+from .converter import _convert_args  # pyright: ignore[reportPrivateUsage]
+
+
+class ConversionResult:
+    """The outcome of converting, or updating the TOC of, a single document.
+
+    `source` is the document the job ran on and `output` the file it produced, |None|
+    when the job failed. `duration` is in seconds. `returncode` is the exit status of
+    the LibreOffice process, |None| if it was killed, or never run because the PDF was
+    found in a |PdfCache|. `stderr` is what the process wrote to its standard error.
+    `error` describes why the job failed, and is |None| on success.
+    """
+
+    def __init__(
+        self,
+        source: Path,
+        output: Path | None,
+        duration: float,
+        returncode: int | None,
+        stderr: str,
+        error: str | None = None,
+    ):
+        self.source = source
+        self.output = output
+        self.duration = duration
+        self.returncode = returncode
+        self.stderr = stderr
+        self.error = error
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"<ConversionResult {self.source.name} {status} {self.duration:.2f}s>"
+
+    @property
+    def ok(self) -> bool:
+        """True if the job succeeded."""
+        return self.error is None
+
+
+async def document_to_pdf_async(
+    docx_file: Path | str,
+    output_dir: Path | str | None = None,
+    *,
+    timeout: float = 120.0,
+    command: str | Sequence[str] = "libreoffice",
+    cache: PdfCache | None = None,
+) -> ConversionResult:
+    """Convert `docx_file` to a PDF in `output_dir`, the current directory by default."""
+    results = await document_to_pdf_many_async(
+        [docx_file],
+        concurrency=1,
+        output_dir=output_dir,
+        timeout=timeout,
+        command=command,
+        cache=cache,
+    )
+    return results[0]
+
+
+async def document_to_pdf_many_async(
+    docx_files: Iterable[Path | str],
+    *,
+    concurrency: int = 4,
+    output_dir: Path | str | None = None,
+    timeout: float = 120.0,
+    command: str | Sequence[str] = "libreoffice",
+    cache: PdfCache | None = None,
+) -> List[ConversionResult]:
+    """Convert each of `docx_files` to PDF, running up to `concurrency` conversions at once.
+
+    Each PDF has the stem of its source file and is written to `output_dir`, the current
+    working directory by default. Raises |ValueError|, before converting anything, when
+    two of `docx_files` have the same stem, as their PDFs would overwrite each other.
+    Results are returned in the order of `docx_files`.
+    Each conversion slot has its own LibreOffice profile so conversions don't contend
+    for the profile lock; the profiles are removed afterwards.
+
+    When a :class:`PdfCache` is given as `cache`, a document whose content was converted
+    before with the same `command` is not converted again. Each PDF is then kept in the
+    cache and copied to `output_dir` when one is given. Without `output_dir` the result
+    is the path of the PDF in the cache, which later conversions may evict once the
+    cache is over its limits.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be 1 or more, got {concurrency}")
+    command = [command] if isinstance(command, str) else list(command)
+    docx_files = [Path(docx_file).absolute() for docx_file in docx_files]
+    stems = collections.Counter(docx_file.stem for docx_file in docx_files)
+    duplicates = sorted(stem for stem, count in stems.items() if count > 1)
+    if duplicates:
+        raise ValueError(
+            "documents having the same name would overwrite each other's PDF: "
+            + ", ".join(f"'{stem}.pdf'" for stem in duplicates)
+        )
+    copy_dir = None if cache is None or output_dir is None else Path(output_dir).absolute()
+    output_dir = Path(output_dir if output_dir is not None else Path.cwd()).absolute()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def deliver(cached_pdf: Path, docx_file: Path) -> Path:
+        """The PDF of `docx_file` for its result, copied from the cache when wanted."""
+        if copy_dir is None:
+            return cached_pdf
+        return Path(shutil.copyfile(cached_pdf, copy_dir / f"{docx_file.stem}.pdf"))
+
+    with tempfile.TemporaryDirectory(prefix="skelmis-docx-") as tmp_dir:
+        profiles: asyncio.Queue[Path] = asyncio.Queue()
+        for idx in range(concurrency):
+            profiles.put_nowait(Path(tmp_dir) / f"worker-{idx}")
+
+        async def convert(docx_file: Path) -> ConversionResult:
+            key = None
+            if cache is not None and docx_file.is_file():
+                key = await asyncio.to_thread(
+                    cache.key, docx_file, converter="libreoffice", command=command
+                )
+                # -- no await between getting a cached PDF and copying it, so another job
+                # -- can't evict it in between
+                cached_pdf = cache.get(key)
+                if cached_pdf is not None:
+                    try:
+                        return ConversionResult(
+                            docx_file, deliver(cached_pdf, docx_file), 0.0, None, ""
+                        )
+                    except FileNotFoundError:
+                        pass  # -- evicted by another process, so convert it again --
+
+            profile_dir = await profiles.get()
+            try:
+                result = await _convert(command, profile_dir, docx_file, output_dir, timeout)
+            finally:
+                profiles.put_nowait(profile_dir)
+            if key is not None and result.output is not None:
+                result.output = deliver(cache.put(key, result.output), docx_file)  # pyright: ignore
+            return result
+
+        jobs = [convert(docx_file) for docx_file in docx_files]
+        return list(await asyncio.gather(*jobs))
+
+
+def document_to_pdf_many(
+    docx_files: Iterable[Path | str],
+    *,
+    concurrency: int = 4,
+    output_dir: Path | str | None = None,
+    timeout: float = 120.0,
+    command: str | Sequence[str] = "libreoffice",
+    cache: PdfCache | None = None,
+) -> List[ConversionResult]:
+    """Blocking form of :func:`document_to_pdf_many_async`.
+
+    Runs its own event loop, so it can't be called from a coroutine; await
+    :func:`document_to_pdf_many_async` there instead.
+    """
+    return asyncio.run(
+        document_to_pdf_many_async(
+            docx_files,
+            concurrency=concurrency,
+            output_dir=output_dir,
+            timeout=timeout,
+            command=command,
+            cache=cache,
+        )
+    )
+
+
+async def update_toc_async(
+    docx_file: Path | str,
+    *,
+    timeout: float = 120.0,
+    command: str | Sequence[str] = "libreoffice",
+) -> ConversionResult:
+    """Update the TOC of `docx_file` in place using the LibreOffice `UpdateTOC` macro.
+
+    Call :func:`export_libre_macro` first to install the macro.
+    """
+    results = await update_toc_many_async([docx_file], timeout=timeout, command=command)
+    return results[0]
+
+
+async def update_toc_many_async(
+    docx_files: Iterable[Path | str],
+    *,
+    timeout: float = 120.0,
+    command: str | Sequence[str] = "libreoffice",
+) -> List[ConversionResult]:
+    """Update the TOC of each of `docx_files` in place, returning a result for each.
+
+    The `UpdateTOC` macro lives in the user's own LibreOffice profile, and LibreOffice
+    hands a second process on the same profile over to the first, so these jobs run one
+    at a time.
+    """
+    command = [command] if isinstance(command, str) else list(command)
+    results: List[ConversionResult] = []
+    for docx_file in docx_files:
+        results.append(await _update_toc(command, Path(docx_file).absolute(), timeout))
+    return results
+
+
+def update_toc_many(
+    docx_files: Iterable[Path | str],
+    *,
+    timeout: float = 120.0,
+    command: str | Sequence[str] = "libreoffice",
+) -> List[ConversionResult]:
+    """Blocking form of :func:`update_toc_many_async`."""
+    return asyncio.run(update_toc_many_async(docx_files, timeout=timeout, command=command))
+
+
+async def _convert(
+    command: List[str], profile_dir: Path, docx_file: Path, output_dir: Path, timeout: float
+) -> ConversionResult:
+    """Convert `docx_file` to a PDF in `output_dir` using the profile in `profile_dir`."""
+    if not docx_file.is_file():
+        return ConversionResult(docx_file, None, 0.0, None, "", f"no such file: '{docx_file}'")
+
+    # -- convert into a scratch directory so a partial PDF never reaches `output_dir` --
+    with tempfile.TemporaryDirectory(dir=output_dir, prefix=".pdf-") as out_dir:
+        out_file = Path(out_dir) / f"{docx_file.stem}.pdf"
+        args = _convert_args(command, profile_dir, Path(out_dir), docx_file)
+        try:
+            duration, returncode, stderr = await _run(args, timeout)
+        except OSError as e:
+            return ConversionResult(docx_file, None, 0.0, None, "", _launch_failure(e))
+        # -- a PDF left by a process that failed or was killed may be incomplete --
+        if returncode != 0 or not out_file.is_file():
+            error = (
+                "LibreOffice produced no PDF"
+                if returncode == 0
+                else _failure(returncode, timeout, stderr)
+            )
+            return ConversionResult(docx_file, None, duration, returncode, stderr, error)
+        pdf_file = output_dir / out_file.name
+        out_file.replace(pdf_file)
+        return ConversionResult(docx_file, pdf_file, duration, returncode, stderr)
+
+
+async def _update_toc(command: List[str], docx_file: Path, timeout: float) -> ConversionResult:
+    """Update the TOC of `docx_file` in place."""
+    if not docx_file.is_file():
+        return ConversionResult(docx_file, None, 0.0, None, "", f"no such file: '{docx_file}'")
+
+    # -- the macro hangs if the file is already open, so it works on a copy --
+    tmp_file = docx_file.with_name(f"{docx_file.name}.{secrets.token_hex(4)}.docx")
+    shutil.copy(docx_file, tmp_file)
+    try:
+        args = [*command, "--headless", f"macro:///Standard.Module1.UpdateTOC({tmp_file})"]
+        try:
+            duration, returncode, stderr = await _run(args, timeout)
+        except OSError as e:
+            return ConversionResult(docx_file, None, 0.0, None, "", _launch_failure(e))
+        if returncode != 0:
+            return ConversionResult(
+                docx_file, None, duration, returncode, stderr, _failure(returncode, timeout, stderr)
+            )
+        shutil.copy(tmp_file, docx_file)
+    finally:
+        tmp_file.unlink()
+    return ConversionResult(docx_file, docx_file, duration, returncode, stderr)
+
+
+async def _run(args: List[str], timeout: float) -> tuple[float, int | None, str]:
+    """Run `args` as a process, returning its duration, exit status and standard error.
+
+    The exit status is |None| when the process was killed after `timeout` seconds, in
+    which case the standard error is what it wrote until then. The process is also
+    killed when the awaiting task is cancelled. Raises |OSError| when the process can't
+    be started, such as when `args[0]` doesn't exist.
+    """
+    start = time.monotonic()
+    process = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+    )
+    # -- standard error is collected as it is written, so what was written before a
+    # -- timeout is kept
+    stderr = bytearray()
+
+    async def communicate():
+        while chunk := await process.stderr.read(65536):  # pyright: ignore
+            stderr.extend(chunk)
+        await process.wait()
+
+    try:
+        await asyncio.wait_for(communicate(), timeout)
+        returncode = process.returncode
+    except asyncio.TimeoutError:
+        returncode = None
+        await _kill(process)
+    except asyncio.CancelledError:
+        await _kill(process)
+        raise
+    return time.monotonic() - start, returncode, stderr.decode(errors="replace").strip()
+
+
+async def _kill(process: asyncio.subprocess.Process):
+    """Kill `process` and wait for it to exit."""
+    if process.returncode is None:
+        process.kill()
+    await process.wait()
+
+
+def _launch_failure(e: OSError) -> str:
+    """Return a description of a job that failed because LibreOffice couldn't be started."""
+    return f"could not start LibreOffice: {e}"
+
+
+def _failure(returncode: int | None, timeout: float, stderr: str) -> str:
+    """Return a description of a job failure given the exit status of its process.
+
+    The standard error of a process that exited is included, as it usually says why.
+    """
+    if returncode is None:
+        return f"timed out after {timeout}s"
+    if not stderr:
+        return f"LibreOffice exited with status {returncode}"
+    return f"LibreOffice exited with status {returncode}: {stderr}"
@@ -0,0 +1,127 @@
+"""An on-disk cache of converted PDFs keyed by the content of their source document.
+
+Converting a byte-identical document again, a regenerated report whose data didn't
+change for example, returns the PDF produced the first time instead of running the
+converter again.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, List, Tuple
+
+
+class PdfCache:
+    """A directory of PDFs named by the SHA-256 of their source document and options.
+
+    When `max_bytes` is given, the least-recently used PDFs are removed once the cache
+    grows beyond that size. When `max_age` is given, PDFs not used for that many
+    seconds are removed. The cache may be shared between threads and processes.
+
+    A path returned by :meth:`get` or :meth:`put` stays valid only until the PDF is
+    evicted, which a later :meth:`put` in this or another process can do once the cache
+    is over `max_bytes`. Copy the PDF elsewhere, or use it right away, when the cache
+    has limits.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        max_bytes: int | None = None,
+        max_age: float | None = None,
+    ):
+        self._directory = Path(directory).expanduser().absolute()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+
+    @property
+    def directory(self) -> Path:
+        """The directory holding the cached PDFs."""
+        return self._directory
+
+    def key(self, docx_file: Path | str, **options: Any) -> str:
+        """The cache key of `docx_file` when converted with converter `options`.
+
+        The key is the SHA-256 hex digest of the bytes of `docx_file` followed by the
+        JSON form of `options`, so a change to either is a different key.
+        """
+        sha256 = hashlib.sha256()
+        with open(docx_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha256.update(chunk)
+        sha256.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return sha256.hexdigest()
+
+    def get(self, key: str) -> Path | None:
+        """Path of the cached PDF having `key`, or |None| if not cached or expired."""
+        path = self._path(key)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if self._max_age is not None and time.time() - mtime > self._max_age:
+            path.unlink(missing_ok=True)
+            return None
+        # -- the modification time records the last use, for least-recently-used eviction --
+        os.utime(path)
+        return path
+
+    def put(self, key: str, pdf_file: Path | str) -> Path:
+        """Move `pdf_file` into the cache under `key`, returning its path in the cache.
+
+        The cache is then brought back within its limits, evicting other PDFs but never
+        the one just put.
+        """
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=".", suffix=".tmp")
+        os.close(fd)
+        shutil.move(str(pdf_file), tmp_path)
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+        return path
+
+    def evict(self):
+        """Remove expired PDFs, then the least-recently used until within `max_bytes`."""
+        self._evict(keep=None)
+
+    def _evict(self, keep: Path | None):
+        """Evict as :meth:`evict` does, but never the PDF at `keep`."""
+        if self._max_bytes is None and self._max_age is None:
+            return
+        now = time.time()
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self._directory.glob("*.pdf"):
+            if path == keep:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if self._max_age is not None and now - stat.st_mtime > self._max_age:
+                path.unlink(missing_ok=True)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        if self._max_bytes is None:
+            return
+        total = sum(size for _, size, _ in entries)
+        if keep is not None:
+            with contextlib.suppress(FileNotFoundError):
+                total += keep.stat().st_size
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.pdf"
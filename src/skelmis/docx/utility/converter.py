@@ -0,0 +1,331 @@
+"""A pool of long-lived headless LibreOffice workers for converting documents to PDF.
+
+Each worker has its own LibreOffice user profile, so workers never contend for the
+profile lock and can convert concurrently. When the `uno` Python bridge that ships
+with LibreOffice is importable, each worker keeps a `soffice` process running and
+sends conversions to it over a socket. Otherwise each conversion runs a `soffice`
+process against the worker's already-initialized profile, which still avoids the
+first-run profile setup that dominates a cold start.
+"""
+
+from __future__ import annotations
+
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Sequence
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+class PdfConversionError(Exception):
+    """Raised when a document could not be converted to PDF."""
+
+
+class PdfConverter:
+    """Converts documents to PDF using a pool of `workers` headless LibreOffice workers.
+
+    `command` is the LibreOffice executable, or a sequence of arguments to run in its
+    place. A conversion that doesn't complete within `timeout` seconds raises
+    |PdfConversionError|. Worker profiles are created under `profile_dir`, a temporary
+    directory by default, and are kept between runs when `profile_dir` is given.
+
+    A converter is safe to share between threads; a conversion waits for a free worker.
+    Call :meth:`close`, or use the converter as a context manager, to stop its workers.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        *,
+        command: str | Sequence[str] = "libreoffice",
+        timeout: float = 120.0,
+        profile_dir: Path | str | None = None,
+        use_uno: bool | None = None,
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be 1 or more, got {workers}")
+        self._command = [command] if isinstance(command, str) else list(command)
+        self._timeout = timeout
+        self._tmp_dir = None if profile_dir else tempfile.mkdtemp(prefix="skelmis-docx-")
+        self._profile_dir = Path(profile_dir or self._tmp_dir).absolute()  # pyright: ignore
+        if use_uno is None:
+            use_uno = _uno_available()
+        worker_cls = _UnoWorker if use_uno else _ProcessWorker
+
+        self._workers: List[_Worker] = [
+            worker_cls(self._command, self._profile_dir / f"worker-{idx}", timeout)
+            for idx in range(workers)
+        ]
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._closed = False
+
+    def __enter__(self) -> PdfConverter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ):
+        self.close()
+
+    def close(self):
+        """Stop all workers and remove any temporary profile directory."""
+        if self._closed:
+            return
+        self._closed = True
+        for worker in self._workers:
+            worker.stop()
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def convert(self, docx_file: Path | str, output_dir: Path | str | None = None) -> Path:
+        """Convert `docx_file` to PDF and return the path of the PDF file.
+
+        The PDF has the same stem as `docx_file` and is written to `output_dir`, the
+        current working directory by default.
+        """
+        if self._closed:
+            raise PdfConversionError("converter is closed")
+        docx_file = Path(docx_file).absolute()
+        if not docx_file.is_file():
+            raise PdfConversionError(f"no such file: '{docx_file}'")
+        output_dir = Path(output_dir if output_dir is not None else Path.cwd()).absolute()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        pdf_file = output_dir / f"{docx_file.stem}.pdf"
+
+        worker = self._idle.get()
+        try:
+            worker.convert(docx_file, pdf_file)
+        finally:
+            self._idle.put(worker)
+        return pdf_file
+
+    @property
+    def command(self) -> List[str]:
+        """The arguments run in place of the LibreOffice executable."""
+        return list(self._command)
+
+    @property
+    def workers(self) -> int:
+        """The number of workers in this converter's pool."""
+        return len(self._workers)
+
+
+class _Worker:
+    """Base class for a worker converting one document at a time using its own profile."""
+
+    def __init__(self, command: List[str], profile_dir: Path, timeout: float):
+        self._command = command
+        self._profile_dir = profile_dir
+        self._timeout = timeout
+
+    def convert(self, docx_file: Path, pdf_file: Path):
+        """Convert `docx_file` to `pdf_file`, raising |PdfConversionError| on failure."""
+        raise NotImplementedError("must be implemented by each subclass")
+
+    def stop(self):
+        """Release any resources held by this worker."""
+
+
+class _ProcessWorker(_Worker):
+    """Runs one `soffice --convert-to pdf` process per conversion against its profile."""
+
+    def convert(self, docx_file: Path, pdf_file: Path):
+        # -- soffice names the PDF after the source, so convert into a scratch directory
+        # -- and move the result, which also keeps a partial PDF out of `pdf_file`.
+        with tempfile.TemporaryDirectory(dir=pdf_file.parent, prefix=".pdf-") as out_dir:
+            args = _convert_args(self._command, self._profile_dir, Path(out_dir), docx_file)
+            out_file = Path(out_dir) / f"{docx_file.stem}.pdf"
+            try:
+                process = subprocess.run(
+                    args,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=self._timeout,
+                )
+            except subprocess.TimeoutExpired as e:
+                # -- a PDF found then may be incomplete, and goes with the scratch directory --
+                raise PdfConversionError(
+                    f"conversion of '{docx_file}' timed out after {self._timeout}s"
+                ) from e
+            if process.returncode != 0 or not out_file.is_file():
+                raise PdfConversionError(
+                    f"conversion of '{docx_file}' failed (exit status"
+                    f" {process.returncode}): {process.stderr.decode().strip()}"
+                )
+            out_file.replace(pdf_file)
+
+
+class _UnoWorker(_Worker):
+    """Keeps a `soffice` process listening on a socket and converts over UNO.
+
+    The process is started on first use and restarted if it dies.
+    """
+
+    def __init__(self, command: List[str], profile_dir: Path, timeout: float):
+        super().__init__(command, profile_dir, timeout)
+        self._process: subprocess.Popen[bytes] | None = None
+        self._desktop: Any = None
+
+    def convert(self, docx_file: Path, pdf_file: Path):
+        import uno  # pyright: ignore[reportMissingImports]
+
+        desktop = self._ensure_started()
+        # -- a UNO call can't be given a timeout, so a watchdog kills the soffice process of a
+        # -- conversion that takes too long, which makes the blocked call raise
+        process = self._process
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()  # pyright: ignore[reportOptionalMemberAccess]
+
+        watchdog = threading.Timer(self._timeout, kill)
+        watchdog.daemon = True
+        with tempfile.TemporaryDirectory(dir=pdf_file.parent, prefix=".pdf-") as out_dir:
+            out_file = Path(out_dir) / pdf_file.name
+            watchdog.start()
+            try:
+                doc = desktop.loadComponentFromURL(
+                    docx_file.as_uri(), "_blank", 0, _uno_props(Hidden=True, ReadOnly=True)
+                )
+                if doc is None:
+                    raise PdfConversionError(f"LibreOffice could not open '{docx_file}'")
+                try:
+                    doc.storeToURL(
+                        uno.systemPathToFileUrl(str(out_file)),
+                        _uno_props(FilterName="writer_pdf_Export"),
+                    )
+                finally:
+                    doc.close(True)
+            except Exception as e:
+                if timed_out.is_set():
+                    self.stop()
+                    raise PdfConversionError(
+                        f"conversion of '{docx_file}' timed out after {self._timeout}s"
+                    ) from e
+                if isinstance(e, PdfConversionError):
+                    raise
+                # -- the connection is in an unknown state, start afresh next time --
+                self.stop()
+                raise PdfConversionError(f"conversion of '{docx_file}' failed: {e}") from e
+            finally:
+                watchdog.cancel()
+            if timed_out.is_set():
+                # -- the watchdog fired just as the conversion completed, the PDF is whole --
+                self.stop()
+            out_file.replace(pdf_file)
+
+    def stop(self):
+        self._desktop = None
+        if self._process is None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        self._process = None
+
+    def _ensure_started(self) -> Any:
+        """Return the UNO desktop of this worker's soffice process, starting it if need be."""
+        if self._process is not None and self._process.poll() is None and self._desktop:
+            return self._desktop
+        self.stop()
+
+        import uno  # pyright: ignore[reportMissingImports]
+
+        port = _free_port()
+        connection = f"socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        self._process = subprocess.Popen(
+            [
+                *self._command,
+                _profile_arg(self._profile_dir),
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                f"--accept={connection}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + self._timeout
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}")
+                break
+            except Exception as e:
+                if self._process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise PdfConversionError("could not connect to LibreOffice") from e
+                time.sleep(0.25)
+        self._desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        return self._desktop
+
+
+def _convert_args(
+    command: List[str], profile_dir: Path, out_dir: Path, docx_file: Path
+) -> List[str]:
+    """Return the `soffice` arguments converting `docx_file` to a PDF in `out_dir`."""
+    return [
+        *command,
+        _profile_arg(profile_dir),
+        "--headless",
+        "--norestore",
+        "--convert-to",
+        "pdf",
+        "--outdir",
+        str(out_dir),
+        str(docx_file),
+    ]
+
+
+def _free_port() -> int:
+    """Return a TCP port on the loopback interface that is free at the time of the call."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _profile_arg(profile_dir: Path) -> str:
+    """Return the `soffice` argument selecting the user profile in `profile_dir`."""
+    return f"-env:UserInstallation={profile_dir.as_uri()}"
+
+
+def _uno_available() -> bool:
+    try:
+        import uno  # noqa: F401  # pyright: ignore[reportMissingImports,reportUnusedImport]
+    except ImportError:
+        return False
+    return True
+
+
+def _uno_props(**kwargs: Any) -> tuple[Any, ...]:
+    """Return a tuple of UNO `PropertyValue` objects, one for each keyword argument."""
+    from com.sun.star.beans import PropertyValue  # pyright: ignore[reportMissingImports]
+
+    props: List[Any] = []
+    for name, value in kwargs.items():
+        prop = PropertyValue()
+        prop.Name, prop.Value = name, value
+        props.append(prop)
+    return tuple(props)
@@ -1,13 +1,34 @@
+import atexit
 import json
 import logging
 import secrets
 import shutil
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
+from .cache import PdfCache
+from .converter import PdfConverter
+
 log = logging.getLogger(__name__)
 
+_default_converter: PdfConverter | None = None
+_default_converter_lock = threading.Lock()
+
+
+def _get_default_converter() -> PdfConverter:
+    """Return the single-worker converter shared by calls that don't provide their own.
+
+    It is created on first use and its worker is kept for the life of the process.
+    """
+    global _default_converter
+    with _default_converter_lock:
+        if _default_converter is None:
+            _default_converter = PdfConverter()
+            atexit.register(_default_converter.close)
+        return _default_converter
+
 
 def _update_toc_linux(docx_file: Path) -> None:
     """TOC bindings for linux"""
@@ -31,7 +52,7 @@ def _update_toc_linux(docx_file: Path) -> None:
     tmp_file.unlink()
 
 
-def _create_pdf_windows(docx_file: Path) -> None:
+def _create_pdf_windows(docx_file: Path) -> Path:
     import win32com.client
 
     word = win32com.client.Dispatch("Word.Application")
@@ -48,41 +69,24 @@ def _create_pdf_windows(docx_file: Path) -> None:
         doc.Close(0)
 
     word.Quit()
+    return pdf_filepath
 
 
-def _create_pdf_linux(docx_file: Path) -> None:
-    try:
-        subprocess.call(
-            [
-                "libreoffice",
-                "--convert-to",
-                "pdf",
-                str(docx_file),
-            ],
-            timeout=5,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-    except subprocess.TimeoutExpired:
-        # New versions of LibreOffice appear to
-        # hang even after the PDF are created hence
-        # why we enforce a process timeout
-        log.debug(
-            "DOCX to PDF call timed out after 5 seconds. "
-            "This is likely fine, but if not please open an issue."
-        )
-
-
-def _create_pdf_macos(docx_file: Path) -> None:
+def _create_pdf_linux(docx_file: Path) -> Path:
+    return _get_default_converter().convert(docx_file)
+
+
+def _create_pdf_macos(docx_file: Path) -> Path:
     log.warning("DOCX -> PDF on mac is untested. Any issues please raise an issue.")
     script = (Path(__file__).parent / "convert.jxa").absolute().resolve()
+    pdf_file = Path(f"{docx_file.stem}.pdf").resolve()
     cmd = [
         "/usr/bin/osascript",
         "-l",
         "JavaScript",
         str(script),
         str(docx_file),
-        str(Path(f"{docx_file.stem}.pdf").resolve()),
+        str(pdf_file),
     ]
 
     process = subprocess.Popen(cmd, stderr=subprocess.PIPE)
@@ -109,6 +113,8 @@ def _create_pdf_macos(docx_file: Path) -> None:
             print(msg)
             sys.exit(1)
 
+    return pdf_file
+
 
 def export_libre_macro(
     macro_folder: Path = Path("~/.config/libreoffice/4/user/basic/Standard"),
@@ -142,23 +148,58 @@ def update_toc(docx_file: Path | str) -> None:
         raise ValueError(f"{sys.platform} is not implemented")
 
 
-def document_to_pdf(docx_file: Path | str) -> None:
+def document_to_pdf(
+    docx_file: Path | str,
+    converter: PdfConverter | None = None,
+    *,
+    cache: PdfCache | None = None,
+) -> Path:
     """Create a PDF from a word document.
 
     Consider calling the relevant API's yourself
     if you need to add extra context to calls
     such as watermark arguments.
+
+    Pass a :class:`PdfConverter` as `converter` to convert using its pool of
+    LibreOffice workers on any platform. On linux a shared single-worker
+    converter is used otherwise.
+
+    Pass a :class:`PdfCache` as `cache` to skip converting a document whose
+    content has been converted before with the same converter command. The
+    PDF is then kept in the cache and the path returned is that of the cached
+    PDF, which a later conversion may evict once the cache is over its limits.
+
+    Returns the path of the created PDF. See :func:`document_to_pdf_many`
+    to convert many documents concurrently.
     """
     if isinstance(docx_file, str):
         docx_file = Path(docx_file)
 
     docx_file = docx_file.absolute()
 
-    if sys.platform == "linux":
-        _create_pdf_linux(docx_file)
+    if cache is None:
+        return _document_to_pdf(docx_file, converter)
+
+    if converter is not None:
+        key = cache.key(docx_file, converter="libreoffice", command=converter.command)
+    elif sys.platform == "linux":
+        key = cache.key(docx_file, converter="libreoffice", command=["libreoffice"])
+    else:
+        key = cache.key(docx_file, converter="word")
+    cached_pdf = cache.get(key)
+    if cached_pdf is not None:
+        return cached_pdf
+    return cache.put(key, _document_to_pdf(docx_file, converter))
+
+
+def _document_to_pdf(docx_file: Path, converter: PdfConverter | None) -> Path:
+    if converter is not None:
+        return converter.convert(docx_file)
+    elif sys.platform == "linux":
+        return _create_pdf_linux(docx_file)
     elif sys.platform == "win32":
-        _create_pdf_windows(docx_file)
+        return _create_pdf_windows(docx_file)
     elif sys.platform == "darwin":
-        _create_pdf_macos(docx_file)
+        return _create_pdf_macos(docx_file)
     else:
         raise ValueError(f"{sys.platform} is not implemented")
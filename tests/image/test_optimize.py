@@ -0,0 +1,147 @@
+"""Unit test suite for skelmis.docx.image.optimize module."""
+
+from __future__ import annotations
+
+import struct
+import zlib
+
+import pytest
+
+from skelmis.docx.image.constants import MIME_TYPE
+from skelmis.docx.image.image import Image
+from skelmis.docx.image.optimize import MediaOptimizer
+
+from ..unitutil.file import test_file
+from ..unitutil.mock import function_mock, method_mock
+
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack(">L", len(data)) + chunk_type + data + struct.pack(">L", crc)
+
+
+def _png(raw: bytes, *extra_chunks: bytes) -> bytes:
+    """A 64x64 8-bit grayscale PNG whose image data is deflated at level 1."""
+    ihdr = struct.pack(">LLBBBBB", 64, 64, 8, 0, 0, 0, 0)
+    phys = struct.pack(">LLB", 5906, 5906, 1)
+    return (
+        b"\x89PNG\x0d\x0a\x1a\x0a"
+        + _chunk(b"IHDR", ihdr)
+        + _chunk(b"pHYs", phys)
+        + b"".join(extra_chunks)
+        + _chunk(b"IDAT", zlib.compress(raw, 1))
+        + _chunk(b"IEND", b"")
+    )
+
+
+def _chunk_types(png: bytes) -> list[bytes]:
+    chunk_types: list[bytes] = []
+    offset = 8
+    while offset < len(png):
+        (length,) = struct.unpack(">L", png[offset : offset + 4])
+        chunk_types.append(png[offset + 4 : offset + 8])
+        offset += 12 + length
+    return chunk_types
+
+
+def _idat(png: bytes) -> bytes:
+    data: list[bytes] = []
+    offset = 8
+    while offset < len(png):
+        (length,) = struct.unpack(">L", png[offset : offset + 4])
+        if png[offset + 4 : offset + 8] == b"IDAT":
+            data.append(png[offset + 8 : offset + 8 + length])
+        offset += 12 + length
+    return zlib.decompress(b"".join(data))
+
+
+def _jpeg_markers(jpeg: bytes) -> list[bytes]:
+    markers: list[bytes] = []
+    offset = 2
+    while True:
+        marker = jpeg[offset + 1 : offset + 2]
+        markers.append(marker)
+        if marker == b"\xda":
+            return markers
+        (length,) = struct.unpack(">H", jpeg[offset + 2 : offset + 4])
+        offset += 2 + length
+
+
+class DescribeMediaOptimizer:
+    def it_recompresses_png_image_data_and_strips_metadata_chunks(self, raw):
+        text = _chunk(b"tEXt", b"Comment\x00" + b"x" * 200)
+        trns = _chunk(b"tRNS", b"\x00\x00")
+        blob = _png(raw, text, trns)
+
+        optimized = MediaOptimizer().optimize(blob, MIME_TYPE.PNG)
+
+        assert len(optimized) < len(blob)
+        assert _chunk_types(optimized) == [b"IHDR", b"pHYs", b"tRNS", b"IDAT", b"IEND"]
+        assert _idat(optimized) == raw
+        image = Image.from_blob(optimized)
+        assert (image.px_width, image.px_height, image.horz_dpi) == (64, 64, 150)
+
+    def it_strips_metadata_segments_from_a_jfif_jpeg(self):
+        with open(test_file("300-dpi.jpg"), "rb") as f:
+            blob = f.read()
+
+        optimized = MediaOptimizer().optimize(blob, MIME_TYPE.JPEG)
+
+        assert len(optimized) < len(blob)
+        assert _jpeg_markers(optimized) == [
+            b"\xe0", b"\xe2", b"\xee", b"\xdb", b"\xc0", b"\xdd", b"\xc4", b"\xda"
+        ]  # fmt: skip
+        assert optimized.endswith(blob[16760:])
+        image = Image.from_blob(optimized)
+        assert (image.px_width, image.px_height, image.horz_dpi) == (1504, 1936, 300)
+
+    def it_replaces_the_exif_segment_of_an_exif_jpeg_with_a_jfif_one(self):
+        with open(test_file("exif-420-dpi.jpg"), "rb") as f:
+            blob = f.read()
+
+        optimized = MediaOptimizer().optimize(blob, MIME_TYPE.JPEG)
+
+        assert len(optimized) < len(blob)
+        assert _jpeg_markers(optimized)[0] == b"\xe0"
+        image, original = Image.from_blob(optimized), Image.from_blob(blob)
+        assert (image.px_width, image.px_height) == (original.px_width, original.px_height)
+        assert (image.horz_dpi, image.vert_dpi) == (original.horz_dpi, original.vert_dpi)
+
+    def it_leaves_other_and_unparseable_images_unchanged(self):
+        optimizer = MediaOptimizer()
+        assert optimizer.optimize(b"GIF89a...", MIME_TYPE.GIF) == b"GIF89a..."
+        assert optimizer.optimize(b"\x89PNG\x0d\x0a\x1a\x0a", MIME_TYPE.PNG) == (
+            b"\x89PNG\x0d\x0a\x1a\x0a"
+        )
+
+    def it_caches_results_by_digest(self, raw, request):
+        optimizer = MediaOptimizer(cache_size=2)
+        blob = _png(raw)
+        optimized = optimizer.optimize(blob, MIME_TYPE.PNG)
+        _optimize_ = method_mock(request, MediaOptimizer, "_optimize")
+
+        assert optimizer.optimize(blob, MIME_TYPE.PNG) is optimized
+        assert optimizer.optimize(optimized, MIME_TYPE.PNG) is optimized
+        _optimize_.assert_not_called()
+
+    def it_keeps_no_blob_for_an_image_it_cannot_make_smaller(self, raw):
+        optimizer = MediaOptimizer()
+        blob = _png(raw)
+        optimized = optimizer.optimize(blob, MIME_TYPE.PNG)
+
+        assert optimizer.optimize(optimized, MIME_TYPE.PNG) is optimized
+        assert list(optimizer._cache.values()) == [optimized, None]
+
+    def but_it_does_not_hide_an_error_other_than_a_parse_error(self, request):
+        _optimize_png_ = function_mock(request, "skelmis.docx.image.optimize._optimize_png")
+        _optimize_png_.side_effect = MemoryError
+
+        with pytest.raises(MemoryError):
+            MediaOptimizer().optimize(b"\x89PNG\x0d\x0a\x1a\x0a", MIME_TYPE.PNG)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def raw(self):
+        # -- 64 scanlines, each a filter-type byte followed by a gradient --
+        return b"".join(b"\x00" + bytes((x + y) % 256 for x in range(64)) for y in range(64))
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+import io
+from zipfile import ZipFile
+
 import pytest
 
 from skelmis.docx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -15,6 +18,7 @@ from skelmis.docx.opc.parts.coreprops import CorePropertiesPart
 from skelmis.docx.opc.pkgreader import PackageReader
 from skelmis.docx.opc.rel import Relationships, _Relationship
 
+from ..unitutil.file import docx_path
 from ..unitutil.mock import (
     FixtureRequest,
     Mock,
@@ -127,7 +131,43 @@ class DescribeOpcPackage:
         pkg.save(pkg_file_)
         for part in parts_:
             part.before_marshal.assert_called_once_with()
-        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg.rels, parts_)
+        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg.rels, parts_, False)
+
+    def it_can_save_the_same_content_to_identical_bytes(self):
+        pkg = OpcPackage.open(docx_path("test"))
+        first, second = io.BytesIO(), io.BytesIO()
+
+        pkg.save(first, deterministic=True)
+        OpcPackage.open(io.BytesIO(first.getvalue())).save(second, deterministic=True)
+
+        assert first.getvalue() == second.getvalue()
+        infos = ZipFile(first).infolist()
+        assert [i.filename for i in infos[:2]] == ["[Content_Types].xml", "_rels/.rels"]
+        assert {i.date_time for i in infos} == {(1980, 1, 1, 0, 0, 0)}
+
+    def it_can_hash_its_content(self):
+        pkg = OpcPackage.open(docx_path("test"))
+        saved = io.BytesIO()
+        pkg.save(saved)
+
+        content_hash = pkg.content_hash()
+
+        assert len(content_hash) == 64
+        assert OpcPackage.open(saved).content_hash() == content_hash
+        pkg.main_document_part.element.body.add_p()
+        assert pkg.content_hash() != content_hash
+
+    def it_can_clone_itself(self):
+        pkg = OpcPackage.open(docx_path("having-images"))
+
+        clone = pkg.clone()
+
+        assert type(clone) is OpcPackage
+        assert clone.content_hash() == pkg.content_hash()
+        assert {p.partname for p in clone.parts} == {p.partname for p in pkg.parts}
+        assert not {id(p) for p in clone.parts} & {id(p) for p in pkg.parts}
+        clone.main_document_part.element.body.add_p()
+        assert clone.content_hash() != pkg.content_hash()
 
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
         opc_package, core_properties_ = core_props_fixture
@@ -36,6 +36,20 @@ class DescribePart:
         init__.assert_called_once_with(ANY, "/part/name", "content/type", b"1be2", package_)
         assert isinstance(part, Part)
 
+    def it_can_clone_itself_into_another_package(self, package_: Mock):
+        part = Part(PackURI("/part/name"), "content/type", b"1be2")
+
+        clone = part.clone(package_)
+
+        assert type(clone) is Part
+        assert clone is not part
+        assert (clone.partname, clone.content_type, clone.blob) == (
+            "/part/name",
+            "content/type",
+            b"1be2",
+        )
+        assert clone.package is package_
+
     def it_knows_its_partname(self):
         part = Part(PackURI("/part/name"), "content/type")
         assert part.partname == "/part/name"
@@ -353,6 +367,49 @@ class DescribeXmlPart:
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def it_can_clone_itself_into_another_package(self, request: FixtureRequest, package_: Mock):
+        xml_part = XmlPart(PackURI("/part/name"), "content/type", element("w:p/w:r"), package_)
+        other_package_ = instance_mock(request, OpcPackage, name="other_package_")
+
+        clone = xml_part.clone(other_package_)
+
+        assert type(clone) is XmlPart
+        assert clone.element is not xml_part.element
+        assert clone.element.xml == xml_part.element.xml
+        assert (clone.partname, clone.content_type) == ("/part/name", "content/type")
+        assert clone.package is other_package_
+
+    def it_can_defer_parsing_its_xml_until_used(self, request: FixtureRequest, package_: Mock):
+        xml_part = XmlPart(PackURI("/part/name"), "content/type", element("w:p/w:r"), package_)
+        blob = xml_part.blob
+        other_package_ = instance_mock(request, OpcPackage, name="other_package_")
+
+        xml_part.defer_parsing()
+        clone = xml_part.clone(other_package_)
+
+        assert type(clone) is XmlPart
+        assert clone.blob is xml_part.blob
+        assert clone._parsed_element is None
+        assert clone.element.xml == element("w:p/w:r").xml
+        assert clone.element is not xml_part.element
+        assert clone.blob == blob
+        assert clone.package is other_package_
+
+    def it_constructs_a_part_whose_parsing_is_deferred_like_any_other(self, package_: Mock):
+        class SubXmlPart(XmlPart):
+            def __init__(self, partname, content_type, element, package):
+                super().__init__(partname, content_type, element, package)
+                self.initialized = True
+
+        blob = b'<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
+
+        part = SubXmlPart.load_deferred(PackURI("/part/name"), "content/type", blob, package_)
+
+        assert part.initialized is True
+        assert part.blob is blob
+        assert part.element.xml == element("w:p").xml
+        assert part._unparsed_blob is None
+
     def it_knows_its_the_part_for_its_child_objects(self, part_fixture):
         xml_part = part_fixture
         assert xml_part.part is xml_part
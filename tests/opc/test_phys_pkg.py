@@ -160,6 +160,22 @@ class DescribeZipPkgWriter:
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    @pytest.mark.parametrize("deterministic", [False, True])
+    def it_can_write_a_member_as_a_stream(self, pkg_file: io.BytesIO, deterministic: bool):
+        pack_uri = PackURI("/part/name.xml")
+        pkg_writer = PhysPkgWriter(pkg_file, deterministic)
+
+        with pkg_writer.open(pack_uri) as stream:
+            stream.write(b"<Blobbity")
+            stream.write(b"FooBlob/>")
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.read(pack_uri.membername) == b"<BlobbityFooBlob/>"
+            zinfo = zipf.getinfo(pack_uri.membername)
+        assert zinfo.compress_type == ZIP_DEFLATED
+        assert (zinfo.date_time == (1980, 1, 1, 0, 0, 0)) is deterministic
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -37,10 +37,10 @@ class DescribePackageWriter:
         # verify -----------------------
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
-            call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_pkg_rels(phys_writer, pkg_rels, False),
+            call._write_parts(phys_writer, parts, False),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, False)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
@@ -75,6 +75,17 @@ class DescribePackageWriter:
         ]
         assert phys_pkg_writer_.write.mock_calls == expected_calls
 
+    def it_streams_a_part_that_writes_its_own_blob(self, phys_pkg_writer_: Mock, part_: Mock):
+        part_.streams_blob = True
+        part_.rels = []
+        stream = phys_pkg_writer_.open.return_value.__enter__.return_value
+
+        PackageWriter._write_parts(phys_pkg_writer_, [part_])
+
+        phys_pkg_writer_.open.assert_called_once_with(part_.partname)
+        part_.write_blob.assert_called_once_with(stream)
+        phys_pkg_writer_.write.assert_not_called()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -93,11 +104,11 @@ class DescribePackageWriter:
 
     @pytest.fixture
     def part_(self, request: FixtureRequest):
-        return instance_mock(request, Part)
+        return instance_mock(request, Part, streams_blob=False)
 
     @pytest.fixture
     def part_2_(self, request: FixtureRequest):
-        return instance_mock(request, Part)
+        return instance_mock(request, Part, streams_blob=False)
 
     @pytest.fixture
     def parts_(self, request: FixtureRequest):
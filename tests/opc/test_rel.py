@@ -117,6 +117,16 @@ class DescribeRelationships:
             any_order=True,
         )
 
+    def it_can_compose_rels_xml_in_rId_order(self):
+        rels = Relationships("/baseURI")
+        for rId in ("rId10", "rId2", "rId1"):
+            rels.add_relationship("http://rt-hyperlink", f"http://{rId}", rId, is_external=True)
+
+        rels_xml = rels.sorted_xml
+
+        assert rels_xml.index(b'Id="rId1"') < rels_xml.index(b'Id="rId2"')
+        assert rels_xml.index(b'Id="rId2"') < rels_xml.index(b'Id="rId10"')
+
     def it_knows_the_next_available_rId_to_help(self, rels_with_rId_gap):
         rels, expected_next_rId = rels_with_rId_gap
         next_rId = rels._next_rId
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import cast
 
-from skelmis.docx.oxml.section import CT_HdrFtr
+from skelmis.docx.oxml.document import CT_Document
+from skelmis.docx.oxml.section import CT_HdrFtr, SectionIndex
 from skelmis.docx.oxml.table import CT_Tbl
 from skelmis.docx.oxml.text.paragraph import CT_P
 
@@ -17,3 +18,108 @@ class DescribeCT_HdrFtr:
     def it_knows_its_inner_content_block_item_elements(self):
         hdr = cast(CT_HdrFtr, element("w:hdr/(w:tbl,w:tbl,w:p)"))
         assert [type(e) for e in hdr.inner_content_elements] == [CT_Tbl, CT_Tbl, CT_P]
+
+
+class DescribeSectionIndex:
+    """Unit-test suite for `docx.oxml.section.SectionIndex`."""
+
+    def it_maps_each_section_to_its_block_items(self):
+        document = element(
+            "w:document/w:body/(w:p,w:tbl,w:p/w:pPr/w:sectPr,w:p,w:p/w:pPr/w:sectPr,w:tbl"
+            ",w:sectPr)"
+        )
+        body = document[0]
+        sectPrs = document.xpath("//w:sectPr")
+
+        index = SectionIndex.for_document(document)
+
+        assert index.sectPrs == sectPrs
+        assert list(index.iter_sect_block_elements(sectPrs[0])) == list(body[:3])
+        assert list(index.iter_sect_block_elements(sectPrs[1])) == list(body[3:5])
+        assert list(index.iter_sect_block_elements(sectPrs[2])) == [body[5]]
+
+    def it_is_cached_per_document(self):
+        document = element("w:document/w:body/(w:p,w:sectPr)")
+        assert SectionIndex.for_document(document) is SectionIndex.for_document(document)
+
+    def it_indexes_appended_blocks_and_section_breaks(self):
+        document = cast(CT_Document, element("w:document/w:body/(w:p,w:sectPr)"))
+        body = document.body
+        index = SectionIndex.for_document(document)
+
+        p = body.add_p()
+        new_sectPr = body.add_section_break()
+        tbl = body._insert_tbl(cast(CT_Tbl, element("w:tbl")))
+
+        sectPrs = document.sectPr_lst
+        assert len(sectPrs) == 2
+        assert sectPrs[1] is new_sectPr
+        assert list(index.iter_sect_block_elements(sectPrs[0])) == list(body[:3])
+        assert list(index.iter_sect_block_elements(sectPrs[1])) == [tbl]
+        assert body[1] is p
+
+    def it_is_rebuilt_when_body_content_is_removed(self):
+        document = cast(CT_Document, element("w:document/w:body/(w:p,w:p/w:pPr/w:sectPr,w:sectPr)"))
+        body = document.body
+        assert len(document.sectPr_lst) == 2
+
+        body.remove(body[1])
+
+        assert document.sectPr_lst == [body[1]]
+        sectPr = document.sectPr_lst[0]
+        assert list(SectionIndex.for_document(document).iter_sect_block_elements(sectPr)) == [
+            body[0]
+        ]
+
+    def it_is_discarded_when_the_body_is_cleared(self):
+        document = cast(CT_Document, element("w:document/w:body/(w:p,w:p/w:pPr/w:sectPr,w:sectPr)"))
+        body = document.body
+        assert len(document.sectPr_lst) == 2
+
+        body.clear_content()
+        body.add_p()
+        body.add_p()
+
+        assert len(document.sectPr_lst) == 1
+
+    def it_notices_a_block_replaced_by_another(self):
+        document = cast(CT_Document, element("w:document/w:body/(w:p,w:p,w:sectPr)"))
+        body = document.body
+        sectPr = document.sectPr_lst[0]
+
+        body.remove(body[1])
+        p = body.add_p()
+
+        assert list(SectionIndex.for_document(document).iter_sect_block_elements(sectPr)) == [
+            body[0],
+            p,
+        ]
+
+    def it_indexes_appended_blocks_after_other_appended_children(self):
+        document = cast(CT_Document, element("w:document/w:body/(w:p,w:sectPr)"))
+        body = document.body
+        sectPr = document.sectPr_lst[0]
+
+        body[0].addnext(element("w:bookmarkStart"))
+        assert document.sectPr_lst == [sectPr]
+        p = body.add_p()
+
+        assert document.sectPr_lst == [sectPr]
+        assert list(SectionIndex.for_document(document).iter_sect_block_elements(sectPr)) == [
+            body[0],
+            p,
+        ]
+
+    def it_is_rebuilt_once_discarded_after_a_section_break_is_added_to_a_paragraph(self):
+        document = cast(CT_Document, element("w:document/w:body/(w:p/w:pPr,w:p,w:sectPr)"))
+        body = document.body
+        assert len(document.sectPr_lst) == 1
+
+        body[0][0].append(element("w:sectPr"))
+        SectionIndex.discard(document)
+
+        assert document.sectPr_lst == [body[0][0][0], body[2]]
+        sectPr = document.sectPr_lst[1]
+        assert list(SectionIndex.for_document(document).iter_sect_block_elements(sectPr)) == [
+            body[1]
+        ]
@@ -10,12 +10,20 @@ import pytest
 
 from skelmis.docx.exceptions import InvalidSpanError
 from skelmis.docx.oxml.parser import parse_xml
-from skelmis.docx.oxml.table import CT_Row, CT_Tbl, CT_Tc
+from skelmis.docx.oxml.table import CT_Row, CT_Tbl, CT_Tc, TableGeometry
 from skelmis.docx.oxml.text.paragraph import CT_P
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
-from ..unitutil.mock import FixtureRequest, Mock, call, instance_mock, method_mock, property_mock
+from ..unitutil.mock import (
+    ANY,
+    FixtureRequest,
+    Mock,
+    call,
+    instance_mock,
+    method_mock,
+    property_mock,
+)
 
 
 class DescribeCT_Row:
@@ -39,6 +47,30 @@ class DescribeCT_Row:
         with pytest.raises(ValueError, match=f"no `tc` element at grid_offset={col_idx}"):
             tr.tc_at_grid_offset(col_idx)
 
+    @pytest.mark.parametrize(
+        ("tr_cxml", "expected_cxml", "expected_slots"),
+        [
+            ("w:tr/w:tc", "w:tr/w:tc/w:p/w:r", [(0, 0, 0)]),
+            (
+                'w:tr/(w:trPr,w:tc/(w:tcPr,w:p/(w:pPr,w:r/(w:rPr/w:b,w:t"a"),w:r/w:t"b"),w:p),'
+                'w:tc/(w:tbl,w:p/w:r/w:t"c"))',
+                "w:tr/(w:trPr,w:tc/(w:tcPr,w:p/(w:pPr,w:r/w:rPr/w:b)),w:tc/w:p/w:r)",
+                [(1, 1, 1), (2, 0, 0)],
+            ),
+        ],
+    )
+    def it_can_make_a_prototype_of_itself(
+        self, tr_cxml: str, expected_cxml: str, expected_slots: list[tuple[int, int, int]]
+    ):
+        tr = cast(CT_Row, element(tr_cxml))
+        original_xml = tr.xml
+
+        prototype, slots = tr.prototype()
+
+        assert prototype.xml == xml(expected_cxml)
+        assert slots == expected_slots
+        assert tr.xml == original_xml
+
 
 class DescribeCT_Tc:
     """Unit-test suite for `docx.oxml.table.CT_Tc` objects."""
@@ -59,22 +91,35 @@ class DescribeCT_Tc:
 
         assert tc.grid_offset == expected_value
 
-    def it_can_merge_to_another_tc(
-        self, tr_: Mock, _span_dimensions_: Mock, _tbl_: Mock, _grow_to_: Mock, top_tc_: Mock
-    ):
-        top_tr_ = tr_
-        tc, other_tc = cast(CT_Tc, element("w:tc")), cast(CT_Tc, element("w:tc"))
-        top, left, height, width = 0, 1, 2, 3
-        _span_dimensions_.return_value = top, left, height, width
-        _tbl_.return_value.tr_lst = [tr_]
-        tr_.tc_at_grid_offset.return_value = top_tc_
+    def it_can_merge_to_another_tc(self, _tbl_: Mock, _grow_to_: Mock):
+        tbl = self._snippet_tbl(0)
+        _tbl_.return_value = tbl
+        tc, other_tc = tbl.tr_lst[2].tc_lst[2], tbl.tr_lst[1].tc_lst[1]
+        top_tc = tbl.tr_lst[1].tc_lst[1]
 
         merged_tc = tc.merge(other_tc)
 
-        _span_dimensions_.assert_called_once_with(tc, other_tc)
-        top_tr_.tc_at_grid_offset.assert_called_once_with(left)
-        top_tc_._grow_to.assert_called_once_with(width, height)
-        assert merged_tc is top_tc_
+        _grow_to_.assert_called_once_with(top_tc, 2, 2, geometry=ANY)
+        assert merged_tc is top_tc
+
+    @pytest.mark.parametrize(
+        ("snippet_idx", "row", "col", "row_2", "col_2"),
+        [(0, 0, 0, 1, 1), (0, 2, 2, 0, 1), (1, 0, 0, 1, 1), (2, 0, 1, 2, 1), (4, 0, 1, 0, 0)],
+    )
+    def it_keeps_the_geometry_it_merges_with_up_to_date(
+        self, snippet_idx: int, row: int, col: int, row_2: int, col_2: int
+    ):
+        tbl = self._snippet_tbl(snippet_idx)
+        for tc in tbl.iter_tcs():
+            tc.add_p()
+        geometry = TableGeometry(tbl)
+        tc, other_tc = tbl.tr_lst[row].tc_lst[col], tbl.tr_lst[row_2].tc_lst[col_2]
+
+        tc.merge(other_tc, geometry)
+
+        assert geometry.is_current
+        for tc in tbl.iter_tcs():
+            assert geometry.extents(tc) == (tc.top, tc.left, tc.bottom, tc.right)
 
     @pytest.mark.parametrize(
         ("snippet_idx", "row", "col", "attr_name", "expected_value"),
@@ -359,10 +404,6 @@ class DescribeCT_Tc:
     def _move_content_to_(self, request: FixtureRequest):
         return method_mock(request, CT_Tc, "_move_content_to")
 
-    @pytest.fixture
-    def _span_dimensions_(self, request: FixtureRequest):
-        return method_mock(request, CT_Tc, "_span_dimensions")
-
     @pytest.fixture
     def _span_to_width_(self, request: FixtureRequest):
         return method_mock(request, CT_Tc, "_span_to_width", autospec=False)
@@ -383,6 +424,72 @@ class DescribeCT_Tc:
     def top_tc_(self, request: FixtureRequest):
         return instance_mock(request, CT_Tc)
 
-    @pytest.fixture
-    def tr_(self, request: FixtureRequest):
-        return instance_mock(request, CT_Row)
+
+class DescribeTableGeometry:
+    """Unit-test suite for `docx.oxml.table.TableGeometry` objects."""
+
+    @pytest.mark.parametrize("snippet_idx", range(7))
+    def it_knows_the_same_extents_as_each_tc(self, snippet_idx: int):
+        tbl = cast(CT_Tbl, parse_xml(snippet_seq("tbl-cells")[snippet_idx]))
+        geometry = TableGeometry(tbl)
+
+        for tc in tbl.iter_tcs():
+            assert geometry.extents(tc) == (tc.top, tc.left, tc.bottom, tc.right)
+
+    def it_finds_the_tc_at_a_grid_offset(self):
+        tbl = cast(
+            CT_Tbl,
+            element(
+                "w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),"
+                "w:tr/(w:trPr/w:gridBefore{w:val=1},w:tc/w:tcPr/w:gridSpan{w:val=2}))"
+            ),
+        )
+        geometry = TableGeometry(tbl)
+        tc = tbl.tr_lst[0].tc_lst[0]
+
+        assert geometry.tc_at(0, 1) is tc
+        with pytest.raises(ValueError, match="no `tc` element at grid_offset=2"):
+            geometry.tc_at(0, 2)
+
+    @pytest.mark.parametrize(
+        ("tbl_cxml", "expected_value"),
+        [
+            ("w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc,w:tc),w:tr/(w:tc,w:tc))", 2),
+            (
+                "w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc,w:tc),"
+                "w:tr/(w:tc/w:tcPr/w:vMerge,w:tc))",
+                0,
+            ),
+            # -- the cells of rows not filling the grid can't be located by grid position --
+            ("w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc,w:tc),w:tr/w:tc)", None),
+            (
+                "w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc,w:tc),"
+                "w:tr/(w:trPr/w:gridBefore{w:val=1},w:tc))",
+                None,
+            ),
+        ],
+    )
+    def it_finds_the_tc_holding_the_content_of_a_grid_cell(
+        self, tbl_cxml: str, expected_value: int | None
+    ):
+        tbl = cast(CT_Tbl, element(tbl_cxml))
+        tcs = list(tbl.iter_tcs())
+
+        tc = TableGeometry(tbl).cell_tc(1, 0)
+
+        assert tc is (None if expected_value is None else tcs[expected_value])
+
+    def it_knows_when_the_rows_of_its_table_have_changed(self):
+        tbl = cast(CT_Tbl, element("w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc,w:tr/w:tc)"))
+        geometry = TableGeometry(tbl)
+        assert geometry.is_current
+
+        tbl.tr_lst[0].add_tc()
+        assert not geometry.is_current
+
+        geometry.update_rows(0, 1)
+        assert geometry.is_current
+
+        tbl.remove(tbl.tr_lst[1])
+        tbl.append(tbl.tr_lst[0])
+        assert not geometry.is_current
@@ -34,6 +34,25 @@ class DescribeCT_R:
 
         assert r.xml == expected_xml
 
+    @pytest.mark.parametrize(
+        ("text", "expected_cxml"),
+        [
+            ("", "w:r"),
+            ("foo", 'w:r/w:t"foo"'),
+            ("\tfoo\t", 'w:r/(w:tab,w:t"foo",w:tab)'),
+            ("foo\r\nbar", 'w:r/(w:t"foo",w:br,w:br,w:t"bar")'),
+            ("a \t b", 'w:r/(w:t{xml:space=preserve}"a ",w:tab,w:t{xml:space=preserve}" b")'),
+            ("\n\t\r", "w:r/(w:br,w:tab,w:br)"),
+        ],
+    )
+    def it_can_set_the_text_of_the_run(self, text: str, expected_cxml: str):
+        r = cast(CT_R, element('w:r/w:t"old"'))
+
+        r.text = text
+
+        assert r.xml == xml(expected_cxml)
+        assert r.text == text.replace("\r", "\n")
+
     def it_can_assemble_the_text_in_the_run(self):
         cxml = 'w:r/(w:br,w:cr,w:noBreakHyphen,w:ptab,w:t"foobar",w:tab)'
         r = cast(CT_R, element(cxml))
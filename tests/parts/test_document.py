@@ -1,10 +1,14 @@
 """Unit test suite for the skelmis.docx.parts.document module."""
 
+import io
+
 import pytest
 
+from skelmis.docx import Document
 from skelmis.docx.enum.style import WD_STYLE_TYPE
 from skelmis.docx.opc.constants import RELATIONSHIP_TYPE as RT
 from skelmis.docx.opc.coreprops import CoreProperties
+from skelmis.docx.opc.packuri import PackURI
 from skelmis.docx.package import Package
 from skelmis.docx.parts.document import DocumentPart
 from skelmis.docx.parts.hdrftr import FooterPart, HeaderPart
@@ -44,6 +48,125 @@ class DescribeDocumentPart:
         assert header_part is header_part_
         assert rId == "rId7"
 
+    def it_enables_the_proxy_cache_of_new_header_parts_when_its_own_is_enabled(
+        self, package_, HeaderPart_, header_part_, relate_to_
+    ):
+        HeaderPart_.new.return_value = header_part_
+        document_part = DocumentPart(PackURI("/word/document.xml"), None, None, package_)
+        document_part.enable_proxy_cache()
+
+        document_part.add_header_part()
+
+        header_part_.enable_proxy_cache.assert_called_once_with()
+
+    def it_can_enable_the_proxy_cache_of_itself_and_its_headers_and_footers(self):
+        document = Document()
+        section = document.sections[0]
+        section.header.is_linked_to_previous = False
+        section.footer.is_linked_to_previous = False
+        document_part = document.part
+
+        document_part.enable_proxy_cache()
+
+        assert document_part.proxy_cache is not None
+        assert section.header.part.proxy_cache is not None
+        assert section.footer.part.proxy_cache is not None
+
+    def it_can_reuse_the_proxies_of_its_content(self):
+        document = Document()
+        document.add_paragraph("foo")
+        document.add_table(rows=1, cols=1)
+        assert document.paragraphs[0] is not document.paragraphs[0]
+
+        document.enable_proxy_cache()
+
+        paragraph = document.paragraphs[0]
+        table = document.tables[0]
+        assert document.paragraphs[0] is paragraph
+        assert paragraph.runs[0] is paragraph.runs[0]
+        assert next(document.iter_inner_content()) is paragraph
+        assert document.tables[0] is table
+        assert table.rows[0] is table.rows[0]
+        assert table.cell(0, 0) is table.rows[0].cells[0]
+
+    def it_can_share_identical_header_and_footer_parts_between_sections(self):
+        document = Document()
+        for text in ("same", "same", "other"):
+            section = document.add_section()
+            section.header.is_linked_to_previous = False
+            section.header.paragraphs[0].text = text
+            section.footer.is_linked_to_previous = False
+        document_part = document.part
+
+        dropped = document_part.dedupe_header_footer_parts()
+
+        sections = document.sections
+        header_parts = [section.header.part for section in sections[1:]]
+        footer_parts = [section.footer.part for section in sections[1:]]
+        assert dropped == 3
+        assert header_parts[0] is header_parts[1]
+        assert header_parts[2] is not header_parts[0]
+        assert footer_parts[0] is footer_parts[1] is footer_parts[2]
+        assert [section.header.paragraphs[0].text for section in sections[1:]] == [
+            "same",
+            "same",
+            "other",
+        ]
+        assert len([p for p in document_part.package.parts if isinstance(p, HeaderPart)]) == 2
+        assert len([p for p in document_part.package.parts if isinstance(p, FooterPart)]) == 1
+        assert document_part.dedupe_header_footer_parts() == 0
+
+    def it_writes_streamed_tables_in_place_as_it_is_saved(self):
+        document = Document()
+        document.add_paragraph("before")
+        document.add_table_stream(([i, f"row {i}"] for i in range(3)), header=["n", "text"])
+        removed = document.add_table_stream([["gone"]])
+        document.add_paragraph("after")
+        document.element.body.remove(removed.table._tbl)
+        document_part = document.part
+        stream = io.BytesIO()
+
+        assert document_part.streams_blob is True
+        document.save(stream)
+
+        saved = Document(stream)
+        assert [p.text for p in saved.paragraphs] == ["before", "after"]
+        assert [[c.text for c in r.cells] for r in saved.tables[0].rows] == [
+            ["n", "text"],
+            ["0", "row 0"],
+            ["1", "row 1"],
+            ["2", "row 2"],
+        ]
+        assert len(saved.tables) == 1
+        # -- the document itself is left as it was --
+        assert [len(t.rows) for t in document.tables] == [1]
+        assert "<!--" not in document.element.xml
+        # -- the writer of consumed records is dropped, the one of the removed table kept --
+        assert [w.table._tbl for _, w in document_part._table_streams] == [removed.table._tbl]
+
+    def it_saves_a_table_streamed_from_a_function_any_number_of_times(self):
+        document = Document()
+        document.add_table_stream(lambda: ([i] for i in range(2)))
+
+        for _ in range(2):
+            stream = io.BytesIO()
+            document.save(stream)
+            assert len(Document(stream).tables[0].rows) == 2
+
+    def but_it_refuses_a_second_save_of_a_table_whose_records_were_consumed(self):
+        document = Document()
+        streamed = document.add_table_stream([i] for i in range(2))
+        document.save(io.BytesIO())
+        stream = io.BytesIO()
+
+        with pytest.raises(ValueError, match="consumed when the document was first saved"):
+            document.save(stream)
+        assert stream.getvalue() == b""
+
+        document.element.body.remove(streamed.table._tbl)
+        document.save(stream)
+        assert Document(stream).tables == []
+
     def it_can_drop_a_specified_header_part(self, drop_rel_):
         document_part = DocumentPart(None, None, None, None)
 
@@ -78,7 +201,7 @@ class DescribeDocumentPart:
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document._package.save.assert_called_once_with(file_, False)
 
     def it_provides_access_to_the_document_settings(self, settings_fixture):
         document_part, settings_ = settings_fixture
@@ -3,6 +3,7 @@
 import pytest
 
 from skelmis.docx.image.image import Image
+from skelmis.docx.image.optimize import MediaOptimizer
 from skelmis.docx.opc.constants import CONTENT_TYPE as CT
 from skelmis.docx.opc.constants import RELATIONSHIP_TYPE as RT
 from skelmis.docx.opc.packuri import PackURI
@@ -42,6 +43,28 @@ class DescribeImagePart:
         image_part, expected_filename = filename_fixture
         assert image_part.filename == expected_filename
 
+    def it_can_optimize_its_blob(self, request):
+        image_part = ImagePart(None, CT.PNG, b"blob")
+        optimizer_ = instance_mock(request, MediaOptimizer)
+        optimizer_.optimize.return_value = b"smaller"
+
+        image_part.optimize(optimizer_)
+
+        optimizer_.optimize.assert_called_once_with(b"blob", CT.PNG)
+        assert image_part.blob == b"smaller"
+        assert image_part.original_sha1 == "0fd0bcfb44f83e7d5ac7a8922578276b9af48746"
+
+    def but_it_keeps_no_original_sha1_when_optimizing_changes_nothing(self, request):
+        blob = b"blob"
+        image_part = ImagePart(None, CT.PNG, blob)
+        optimizer_ = instance_mock(request, MediaOptimizer)
+        optimizer_.optimize.return_value = blob
+
+        image_part.optimize(optimizer_)
+
+        assert image_part.blob is blob
+        assert image_part.original_sha1 is None
+
     def it_knows_the_sha1_of_its_image(self):
         blob = b"fO0Bar"
         image_part = ImagePart(None, None, blob)
@@ -9,6 +9,7 @@ from skelmis.docx.package import Package
 from skelmis.docx.parts.document import DocumentPart
 from skelmis.docx.parts.image import ImagePart
 from skelmis.docx.parts.story import StoryPart
+from skelmis.docx.shared import ProxyCache
 from skelmis.docx.styles.style import BaseStyle
 
 from ..unitutil.cxml import element
@@ -17,6 +18,17 @@ from ..unitutil.mock import instance_mock, method_mock, property_mock
 
 
 class DescribeStoryPart:
+    def it_can_enable_its_proxy_cache(self):
+        story_part = StoryPart(None, None, None, None)
+        assert story_part.proxy_cache is None
+
+        story_part.enable_proxy_cache()
+        proxy_cache = story_part.proxy_cache
+        story_part.enable_proxy_cache()
+
+        assert isinstance(proxy_cache, ProxyCache)
+        assert story_part.proxy_cache is proxy_cache
+
     def it_can_get_or_add_an_image(self, package_, image_part_, image_, relate_to_):
         package_.get_or_add_image_part.return_value = image_part_
         relate_to_.return_value = "rId42"
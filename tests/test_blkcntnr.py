@@ -1,16 +1,19 @@
 """Test suite for the skelmis.docx.blkcntnr (block item container) module."""
 
+from typing import Any
+
 import pytest
 
 from skelmis.docx import Document
 from skelmis.docx.blkcntnr import BlockItemContainer
+from skelmis.docx.enum.style import WD_STYLE_TYPE
 from skelmis.docx.shared import Inches
 from skelmis.docx.table import Table
 from skelmis.docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq, test_file
-from .unitutil.mock import call, instance_mock, method_mock
+from .unitutil.mock import Mock, call, instance_mock, method_mock, property_mock
 
 
 class DescribeBlockItemContainer:
@@ -28,6 +31,28 @@ class DescribeBlockItemContainer:
         assert paragraph.style == style
         assert paragraph is paragraph_
 
+    def it_can_add_many_paragraphs(self, part_prop_: Mock):
+        part_prop_.return_value = part_ = Mock()
+        part_.get_style_id.side_effect = lambda style, style_type: style.replace(" ", "")
+        blkcntnr = BlockItemContainer(element("w:body/w:sectPr"), None)
+
+        paragraphs = blkcntnr.add_paragraphs(
+            ["Foo", ("Bar\tBaz", "Heading 1"), ("", "Heading 1"), ("", None)]
+        )
+
+        assert all(isinstance(p, Paragraph) for p in paragraphs)
+        assert [p._parent for p in paragraphs] == [blkcntnr] * 4
+        assert blkcntnr._element.xml == xml(
+            'w:body/(w:p/w:r/w:t"Foo",w:p/(w:pPr/w:pStyle{w:val=Heading1},w:r/(w:t"Bar"'
+            ',w:tab,w:t"Baz")),w:p/w:pPr/w:pStyle{w:val=Heading1},w:p,w:sectPr)'
+        )
+        part_.get_style_id.assert_called_once_with("Heading 1", WD_STYLE_TYPE.PARAGRAPH)
+
+    def it_adds_no_paragraphs_when_given_none(self):
+        blkcntnr = BlockItemContainer(element("w:body/w:sectPr"), None)
+        assert blkcntnr.add_paragraphs([]) == []
+        assert blkcntnr._element.xml == xml("w:body/w:sectPr")
+
     def it_can_add_a_table(self, add_table_fixture):
         blkcntnr, rows, cols, width, expected_xml = add_table_fixture
         table = blkcntnr.add_table(rows, cols, width)
@@ -35,6 +60,73 @@ class DescribeBlockItemContainer:
         assert table._element.xml == expected_xml
         assert table._parent is blkcntnr
 
+    def it_can_add_a_table_from_rows_of_data(self, part_prop_: Mock):
+        part_prop_.return_value = part_ = Mock()
+        part_.get_style_id.return_value = "LightGrid"
+        blkcntnr = BlockItemContainer(element("w:body/w:sectPr"), None)
+
+        table = blkcntnr.add_table_from_data(
+            [(1, "a\tb"), (2.5,), (None, "")],
+            Inches(3),
+            header=("N", "Text"),
+            style="Light Grid",
+            column_formats=[{"bold": True}],
+        )
+
+        assert isinstance(table, Table)
+        assert table._parent is blkcntnr
+        assert blkcntnr._element[-1].tag.endswith("sectPr")
+        assert table.style is part_.get_style.return_value
+        part_.get_style_id.assert_called_once_with("Light Grid", WD_STYLE_TYPE.TABLE)
+        assert [c.width for c in table.columns] == [Inches(1.5), Inches(1.5)]
+        assert [[c.text for c in r.cells] for r in table.rows] == [
+            ["N", "Text"],
+            ["1", "a\tb"],
+            ["2.5", ""],
+            ["", ""],
+        ]
+        assert [[r.bold for r in c.paragraphs[0].runs] for c in table.column_cells(0)] == [
+            [None],
+            [True],
+            [True],
+            [],
+        ]
+        assert table._tbl.tr_lst[0].xpath("./w:trPr/w:tblHeader")
+        assert not table._tbl.tr_lst[1].xpath("./w:trPr")
+
+    def it_can_add_a_table_from_columns_of_data(self, part_prop_: Mock):
+        part_prop_.return_value = Mock(**{"get_style_id.return_value": None})
+        blkcntnr = BlockItemContainer(element("w:body"), None)
+
+        table = blkcntnr.add_table_from_data(
+            {"x": [1, 2], "y": [3]}, Inches(2), col_widths=[Inches(0.5), Inches(1.5), Inches(1)]
+        )
+
+        assert [c.width for c in table.columns] == [Inches(0.5), Inches(1.5), Inches(1)]
+        assert [[c.text for c in r.cells] for r in table.rows] == [
+            ["x", "y", ""],
+            ["1", "3", ""],
+            ["2", "", ""],
+        ]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"col_widths": [Inches(1)]}, "1 column widths given for 2 columns"),
+            ({"column_formats": [None, None, None]}, "3 column formats given for 2 columns"),
+        ],
+    )
+    def but_it_raises_on_more_columns_than_the_data_has(self, kwargs: dict, message: str):
+        blkcntnr = BlockItemContainer(element("w:body"), None)
+        with pytest.raises(ValueError, match=message):
+            blkcntnr.add_table_from_data([(1, 2)], Inches(2), **kwargs)
+
+    @pytest.mark.parametrize("data", [[], [()], {}])
+    def but_it_raises_on_data_having_no_columns(self, data: Any):
+        blkcntnr = BlockItemContainer(element("w:body"), None)
+        with pytest.raises(ValueError, match="a table needs at least one column"):
+            blkcntnr.add_table_from_data(data, Inches(2))
+
     def it_can_iterate_its_inner_content(self):
         document = Document(test_file("blk-inner-content.docx"))
 
@@ -153,3 +245,7 @@ class DescribeBlockItemContainer:
     @pytest.fixture
     def paragraph_(self, request):
         return instance_mock(request, Paragraph)
+
+    @pytest.fixture
+    def part_prop_(self, request):
+        return property_mock(request, BlockItemContainer, "part", return_value=None)
@@ -0,0 +1,117 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit-test suite for the `skelmis.docx.bookmarks` module."""
+
+from __future__ import annotations
+
+import pytest
+
+from skelmis.docx import Document
+from skelmis.docx.bookmarks import BookmarkRegistry
+from skelmis.docx.oxml.ns import qn
+from skelmis.docx.oxml.parser import OxmlElement
+
+from .unitutil.cxml import element
+
+
+class DescribeBookmarks:
+    """Unit-test suite for `skelmis.docx.bookmarks.Bookmarks`."""
+
+    def it_finds_the_bookmarks_of_the_body_headers_and_footers_by_name(self):
+        document = Document()
+        document.add_paragraph("Intro ").add_bookmark("intro", "here")
+        document.sections[0].header.paragraphs[0].add_bookmark("top", "Header")
+
+        bookmarks = document.bookmarks
+
+        assert [b.name for b in bookmarks] == ["intro", "top"]
+        assert len(bookmarks) == 2
+        assert "top" in bookmarks
+        assert "nowhere" not in bookmarks
+        intro = bookmarks["intro"]
+        assert intro.part is document.part
+        assert intro.id == "0"
+        assert intro.paragraph is not None
+        assert intro.paragraph.text == "Intro here"
+        assert bookmarks["top"].part is not document.part
+        with pytest.raises(KeyError, match="no bookmark named 'nowhere'"):
+            bookmarks["nowhere"]
+
+    def it_lists_the_internal_hyperlinks_having_no_bookmark(self):
+        document = Document()
+        paragraph = document.add_paragraph()
+        for anchor in ("b", "gone", "a", "gone", "missing"):
+            paragraph.add_internal_hyperlink(anchor, anchor)
+        document.add_paragraph().add_bookmark("a")
+        document.sections[0].footer.paragraphs[0].add_bookmark("b")
+        # -- a bookmark added directly in the XML is found too --
+        p = document.add_paragraph()._p
+        p.append(OxmlElement("w:bookmarkStart", {qn("w:id"): "9", qn("w:name"): "missing"}))
+
+        assert document.bookmarks.unresolved_links() == ["gone"]
+
+
+class DescribeBookmarkRegistry:
+    """Unit-test suite for `skelmis.docx.bookmarks.BookmarkRegistry`."""
+
+    def it_registers_the_bookmarks_of_a_story(self):
+        body = element(
+            "w:body/(w:p/(w:bookmarkStart{w:id=3,w:name=a},w:bookmarkEnd{w:id=3}),"
+            "w:bookmarkStart{w:id=x,w:name=b},w:p/w:bookmarkStart{w:id=7,w:name=a})"
+        )
+
+        registry = BookmarkRegistry(body)
+
+        assert registry.names == ["a", "b"]
+        assert len(registry) == 2
+        # -- the first of several bookmarks of the same name is the one used --
+        assert registry.get("a") is body[0][0]
+        assert registry.next_id() == 8
+        assert registry.next_id() == 9
+
+    def it_keeps_up_to_date_as_bookmarks_are_added(self):
+        body = element("w:body/w:p")
+        registry = BookmarkRegistry(body)
+        start = OxmlElement("w:bookmarkStart", {qn("w:id"): "12", qn("w:name"): "a"})
+
+        registry.add(start)
+        body[0].append(start)
+
+        assert registry.get("a") is start
+        assert registry.next_id() == 13
+        with pytest.raises(ValueError, match="a bookmark named 'a' already exists"):
+            registry.add(OxmlElement("w:bookmarkStart", {qn("w:name"): "a"}))
+
+    def it_notices_bookmarks_added_or_removed_some_other_way(self):
+        body = element("w:body/(w:p/w:bookmarkStart{w:id=0,w:name=a},w:p)")
+        registry = BookmarkRegistry(body)
+
+        body[1].append(OxmlElement("w:bookmarkStart", {qn("w:id"): "1", qn("w:name"): "b"}))
+        body.remove(body[0])
+
+        assert registry.get("a") is None
+        assert registry.get("b") is body[0][0]
+        assert "a" not in registry
+
+    def it_gives_new_ids_past_those_of_bookmarks_added_some_other_way_once_refreshed(self):
+        body = element("w:body/(w:p/w:bookmarkStart{w:id=0,w:name=a},w:p)")
+        registry = BookmarkRegistry(body)
+        assert registry.next_id() == 1
+
+        body[1].append(OxmlElement("w:bookmarkStart", {qn("w:id"): "1", qn("w:name"): "b"}))
+        registry.refresh()
+        start = OxmlElement("w:bookmarkStart", {qn("w:name"): "c"})
+        registry.add(start)
+        body[1].append(start)
+
+        assert start.get(qn("w:id")) == "2"
+        assert registry.next_id() == 3
+
+    def but_it_uses_no_id_for_a_bookmark_it_refuses(self):
+        body = element("w:body/w:p/w:bookmarkStart{w:id=0,w:name=a}")
+        registry = BookmarkRegistry(body)
+
+        with pytest.raises(ValueError, match="a bookmark named 'a' already exists"):
+            registry.add(OxmlElement("w:bookmarkStart", {qn("w:name"): "a"}))
+
+        assert registry.next_id() == 1
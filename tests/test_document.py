@@ -5,20 +5,24 @@
 
 from __future__ import annotations
 
-from typing import cast
+import io
+import re
+from typing import Any, Callable, cast
 
 import pytest
 
+import skelmis.docx
 from skelmis.docx.document import Document, _Body
 from skelmis.docx.enum.section import WD_SECTION
 from skelmis.docx.enum.text import WD_BREAK
+from skelmis.docx.image.optimize import MediaOptimizer
 from skelmis.docx.opc.coreprops import CoreProperties
 from skelmis.docx.oxml.document import CT_Document
 from skelmis.docx.parts.document import DocumentPart
 from skelmis.docx.section import Section, Sections
 from skelmis.docx.settings import Settings
 from skelmis.docx.shape import InlineShape, InlineShapes
-from skelmis.docx.shared import Length
+from skelmis.docx.shared import Inches, Length
 from skelmis.docx.styles.styles import Styles
 from skelmis.docx.table import Table
 from skelmis.docx.text.paragraph import Paragraph
@@ -66,6 +70,19 @@ class DescribeDocument:
         document._body.add_paragraph.assert_called_once_with(text, style)
         assert paragraph is paragraph_
 
+    def it_can_add_many_paragraphs(
+        self, body_prop_: Mock, body_: Mock, document_part_: Mock, paragraph_: Mock
+    ):
+        body_prop_.return_value = body_
+        body_.add_paragraphs.return_value = [paragraph_]
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+        specs = ["Foo", ("Bar", "Heading 1")]
+
+        paragraphs = document.add_paragraphs(specs)
+
+        body_.add_paragraphs.assert_called_once_with(specs)
+        assert paragraphs == [paragraph_]
+
     def it_can_add_a_picture(self, add_picture_fixture):
         document, path, width, height, run_, picture_ = add_picture_fixture
         picture = document.add_picture(path, width, height)
@@ -91,10 +108,76 @@ class DescribeDocument:
         assert table == table_
         assert table.style == style
 
+    def it_can_add_a_table_from_data(
+        self,
+        _block_width_prop_: Mock,
+        body_prop_: Mock,
+        body_: Mock,
+        document_part_: Mock,
+        table_: Mock,
+    ):
+        _block_width_prop_.return_value = width = Inches(6)
+        body_prop_.return_value = body_
+        body_.add_table_from_data.return_value = table_
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+        data = [(1, 2), (3, 4)]
+
+        table = document.add_table_from_data(data, ("a", "b"), style="Grid")
+
+        body_.add_table_from_data.assert_called_once_with(
+            data, width, ("a", "b"), None, "Grid", None
+        )
+        assert table is table_
+
+    def it_can_add_a_table_streamed_from_records(self):
+        document = skelmis.docx.Document()
+        records = (("a", i, None) for i in range(2))
+
+        writer = document.add_table_stream(records, column_formats=[{"italic": True}])
+
+        table = writer.table
+        assert document.tables[0]._tbl is table._tbl
+        assert len(table.columns) == 3
+        assert len(table.rows) == 0
+        assert sum(c.width for c in table.columns) <= document._block_width
+        stream = io.BytesIO()
+        writer.write(stream)
+        assert stream.getvalue().count(b"<w:tr") == 2
+        assert stream.getvalue().count(b"<w:i/>") == 2
+
+    def it_can_add_a_table_streamed_from_a_function_returning_the_records(self):
+        document = skelmis.docx.Document()
+
+        writer = document.add_table_stream(lambda: (("a", i) for i in range(3)))
+
+        assert len(writer.table.columns) == 2
+        for _ in range(2):
+            stream = io.BytesIO()
+            writer.write(stream)
+            assert stream.getvalue().count(b"<w:tr") == 3
+
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, False)
+
+    def it_can_optimize_media_before_saving(self, save_fixture):
+        document, file_ = save_fixture
+        document.save(file_, optimize_media=True)
+        document._part.package.optimize_media.assert_called_once_with()
+        document._part.save.assert_called_once_with(file_, False)
+
+    def and_it_can_optimize_media_with_a_given_optimizer(self, save_fixture):
+        document, file_ = save_fixture
+        optimizer = MediaOptimizer()
+        document.save(file_, optimize_media=optimizer)
+        document._part.package.optimize_media.assert_called_once_with(optimizer)
+
+    def it_can_dedupe_headers_and_footers_before_saving(self, save_fixture):
+        document, file_ = save_fixture
+        document.save(file_, dedupe_headers_footers=True)
+        document._part.dedupe_header_footer_parts.assert_called_once_with()
+        document._part.save.assert_called_once_with(file_, False)
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
@@ -105,6 +188,105 @@ class DescribeDocument:
         document, inline_shapes_ = inline_shapes_fixture
         assert document.inline_shapes is inline_shapes_
 
+    @pytest.mark.parametrize(
+        ("include", "expected_value"),
+        [
+            (
+                ("body", "tables", "headers", "footers"),
+                ["P1|", "C1|", "N1|", "a\tlink|", "|", "H1|", "F1|", "H2|"],
+            ),
+            (("body",), ["P1|", "a\tlink|", "|"]),
+            (("tables",), ["C1|", "N1|"]),
+            (("headers", "tables"), ["C1|", "N1|", "H1|", "H2|"]),
+            (("footers",), ["F1|"]),
+        ],
+    )
+    def it_can_iterate_the_text_of_the_document(
+        self, include: tuple[str, ...], expected_value: list[str], document_part_: Mock
+    ):
+        document_elm = cast(
+            CT_Document,
+            element(
+                'w:document/w:body/(w:p/w:r/w:t"P1",w:tbl/w:tr/w:tc/(w:p/w:r/w:t"C1",w:tbl/w:tr'
+                '/w:tc/w:p/w:r/w:t"N1"),w:p/(w:r/(w:t"a",w:tab),w:hyperlink/w:r/w:t"link"),w:p/w'
+                ":pPr/w:sectPr/(w:headerReference{w:type=default,r:id=rId1},w:footerReference{w:"
+                "type=default,r:id=rId2}),w:sectPr/(w:headerReference{w:type=default,r:id=rId1},"
+                "w:headerReference{w:type=first,r:id=rId3}))"
+            ),
+        )
+        document_part_.related_parts = {
+            "rId1": Mock(element=element('w:hdr/w:tbl/w:tr/w:tc/w:p/w:r/w:t"H1"')),
+            "rId2": Mock(element=element('w:ftr/w:p/w:r/w:t"F1"')),
+            "rId3": Mock(element=element('w:hdr/w:p/w:r/w:t"H2"')),
+        }
+        document = Document(document_elm, document_part_)
+
+        assert list(document.iter_text(include, separator="|")) == expected_value
+
+    def but_it_raises_on_an_unknown_text_scope(self):
+        with pytest.raises(ValueError, match="unknown text scope"):
+            next(Document(None, None).iter_text(["body", "comments"]))
+
+    @pytest.mark.parametrize(
+        ("pattern", "repl", "kwargs", "expected_count", "expected_text"),
+        [
+            ("{{(a|b)}}", r"<\1>", {}, 3, ["x <a>|", "<b>|", "<a>|"]),
+            ("{{(a|b)}}", lambda m: m[1].upper(), {}, 3, ["x A|", "B|", "A|"]),
+            ("{{a}}", "$", {"regex": False}, 2, ["x $|", "{{b}}|", "$|"]),
+            ("{{a}}", "-", {"scope": ["headers"]}, 1, ["x {{a}}|", "{{b}}|", "-|"]),
+            ("{{a}}", "-", {"scope": ["body", "tables"]}, 1, ["x -|", "{{b}}|", "{{a}}|"]),
+        ],
+    )
+    def it_can_replace_text_across_the_document(
+        self,
+        pattern: str,
+        repl: str | Callable[[re.Match[str]], str],
+        kwargs: dict[str, Any],
+        expected_count: int,
+        expected_text: list[str],
+        document_part_: Mock,
+    ):
+        document_elm = cast(
+            CT_Document,
+            element(
+                'w:document/w:body/(w:p/(w:r/w:t"x {{",w:r/w:t"a}}"),w:tbl/w:tr/w:tc/w:p/w:r/w:'
+                't"{{b}}",w:sectPr/w:headerReference{w:type=default,r:id=rId1})'
+            ),
+        )
+        document_part_.related_parts = {"rId1": Mock(element=element('w:hdr/w:p/w:r/w:t"{{a}}"'))}
+        document = Document(document_elm, document_part_)
+
+        count = document.replace(pattern, repl, **kwargs)
+
+        assert count == expected_count
+        assert list(document.iter_text(separator="|")) == expected_text
+
+    def but_it_raises_on_an_unknown_replace_scope(self):
+        with pytest.raises(ValueError, match="unknown text scope"):
+            Document(None, None).replace("a", "b", scope=["footnotes"])
+
+    def it_can_compact_the_document(self, document_part_: Mock):
+        document_elm = cast(
+            CT_Document,
+            element(
+                'w:document/w:body/(w:p{w:rsidR=00A1}/(w:r/w:t"a",w:proofErr,w:r/w:t"b"),'
+                'w:tbl/w:tr/w:tc/w:p/(w:r/w:t"c",w:r),'
+                "w:sectPr/w:headerReference{w:type=default,r:id=rId1})"
+            ),
+        )
+        hdr = element('w:hdr/w:p/(w:r{w:rsidR=00B2}/w:t"d",w:r{w:rsidR=00C3}/w:t"e")')
+        document_part_.related_parts = {"rId1": Mock(element=hdr)}
+        document = Document(document_elm, document_part_)
+
+        count = document.compact()
+
+        assert count == 4
+        assert document_elm.body.xml == xml(
+            'w:body/(w:p/w:r/w:t"ab",w:tbl/w:tr/w:tc/w:p/w:r/w:t"c",'
+            "w:sectPr/w:headerReference{w:type=default,r:id=rId1})"
+        )
+        assert hdr.xml == xml('w:hdr/w:p/w:r/w:t"de"')
+
     def it_can_iterate_the_inner_content_of_the_document(
         self, body_prop_: Mock, body_: Mock, document_part_: Mock
     ):
@@ -153,6 +335,41 @@ class DescribeDocument:
         _Body_.assert_called_once_with(body_elm, document)
         assert body is body_
 
+    def it_can_save_deterministically(self, save_fixture):
+        document, file_ = save_fixture
+        document.save(file_, deterministic=True)
+        document._part.save.assert_called_once_with(file_, True)
+
+    def it_can_hash_its_content(self, document_part_: Mock):
+        document_part_.package.content_hash.return_value = "0123abcd"
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+
+        assert document.content_hash() == "0123abcd"
+
+    def it_can_enable_its_proxy_cache(self, document_part_: Mock):
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+
+        document.enable_proxy_cache()
+
+        document_part_.enable_proxy_cache.assert_called_once_with()
+
+    def it_can_update_its_tables_of_contents(
+        self, request, _block_width_prop_, document_part_: Mock
+    ):
+        TocUpdater_ = class_mock(request, "skelmis.docx.text.toc.TocUpdater")
+        TocUpdater_.return_value.update.return_value = 2
+        styles_ = property_mock(request, Document, "styles").return_value
+        _block_width_prop_.return_value = Inches(6)
+        document_elm = cast(CT_Document, element("w:document/w:body"))
+        document = Document(document_elm, document_part_)
+
+        count = document.update_toc()
+
+        TocUpdater_.assert_called_once_with(
+            document_elm.body, styles_, Inches(6), document_part_.bookmarks
+        )
+        assert count == 2
+
     def it_determines_block_width_to_help(self, block_width_fixture):
         document, expected_value = block_width_fixture
         width = document._block_width
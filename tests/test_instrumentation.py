@@ -0,0 +1,68 @@
+"""Unit test suite for the `skelmis.docx.instrumentation` module."""
+
+from __future__ import annotations
+
+import io
+from typing import List
+
+from skelmis.docx import Document, instrumentation
+from skelmis.docx.instrumentation import Event, TimingReport
+
+from .unitutil.file import docx_path
+
+
+class DescribeInstrumentation:
+    def it_is_disabled_while_no_listener_is_registered(self):
+        events: List[Event] = []
+
+        assert instrumentation.enabled is False
+        with instrumentation.listening(events.append):
+            assert instrumentation.enabled is True
+        assert instrumentation.enabled is False
+
+        Document(docx_path("having-images"))
+        assert events == []
+
+    def it_reports_each_phase_of_open_and_save(self):
+        events: List[Event] = []
+
+        with instrumentation.listening(events.append):
+            Document(docx_path("having-images")).save(io.BytesIO())
+
+        phases = {event.phase for event in events}
+        assert phases == {
+            "open",
+            "read",
+            "parse",
+            "unmarshal_parts",
+            "unmarshal_relationships",
+            "after_unmarshal",
+            "serialize",
+            "write",
+            "save",
+        }
+        read = next(e for e in events if e.phase == "read" and e.partname == "/word/document.xml")
+        assert 0 < read.bytes_in < read.bytes_out
+        assert read.elapsed_ns > 0
+
+
+class DescribeTimingReport:
+    def it_aggregates_events_by_phase_and_part(self):
+        report = TimingReport()
+
+        report(Event("parse", "/word/document.xml", 100, 0, 3000))
+        report(Event("parse", "/word/styles.xml", 50, 0, 2000))
+        report(Event("open", None, 0, 0, 9000))
+
+        assert report.elapsed_ns("parse") == 5000
+        assert report.elapsed_ns("parse", "/word/styles.xml") == 2000
+        assert report.elapsed_ns("write") == 0
+        text = str(report)
+        assert text.index("open") < text.index("parse")
+        assert text.index("/word/document.xml") < text.index("/word/styles.xml")
+
+    def it_can_time_a_block_of_code(self):
+        with instrumentation.timing() as report:
+            Document(docx_path("having-images"))
+
+        assert report.elapsed_ns("open") > report.elapsed_ns("parse") > 0
@@ -3,6 +3,7 @@
 import pytest
 
 from skelmis.docx.image.image import Image
+from skelmis.docx.image.optimize import MediaOptimizer
 from skelmis.docx.opc.packuri import PackURI
 from skelmis.docx.package import ImageParts, Package
 from skelmis.docx.parts.image import ImagePart
@@ -31,6 +32,26 @@ class DescribePackage:
         for image_part in image_parts:
             assert isinstance(image_part, ImagePart)
 
+    def it_can_optimize_its_image_parts(self, image_parts_prop_, image_part_):
+        optimizer = MediaOptimizer()
+        image_parts_prop_.return_value = [image_part_, image_part_]
+        package = Package()
+
+        package.optimize_media(optimizer)
+
+        assert image_part_.optimize.call_args_list == [((optimizer,),), ((optimizer,),)]
+
+    def and_it_uses_a_new_optimizer_for_each_call_by_default(self, image_parts_prop_, image_part_):
+        image_parts_prop_.return_value = [image_part_]
+        package = Package()
+
+        package.optimize_media()
+        package.optimize_media()
+
+        (first,), (second,) = (args for args, _ in image_part_.optimize.call_args_list)
+        assert isinstance(first, MediaOptimizer)
+        assert second is not first
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -75,6 +96,23 @@ class DescribeImageParts:
         _add_image_part_.assert_called_once_with(image_parts, image_)
         assert image_part is image_part_
 
+    @pytest.mark.parametrize(
+        ("sha1", "expected_idx"), [("a1", 0), ("b1", 1), ("b2", 1), ("c", None)]
+    )
+    def it_finds_an_image_part_by_sha1_including_from_before_it_was_optimized(
+        self, request, sha1, expected_idx
+    ):
+        image_parts = ImageParts()
+        for sha1_, original_sha1 in (("a1", None), ("b2", "b1")):
+            image_parts.append(
+                instance_mock(request, ImagePart, sha1=sha1_, original_sha1=original_sha1)
+            )
+
+        image_part = image_parts._get_by_sha1(sha1)
+
+        expected = None if expected_idx is None else list(image_parts)[expected_idx]
+        assert image_part is expected
+
     def it_knows_the_next_available_image_partname(self, next_partname_fixture):
         image_parts, ext, expected_partname = next_partname_fixture
         assert image_parts._next_image_partname(ext) == expected_partname
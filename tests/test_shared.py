@@ -1,9 +1,27 @@
 """Test suite for the skelmis.docx.shared module."""
 
+import gc
+
 import pytest
 
 from skelmis.docx.opc.part import XmlPart
-from skelmis.docx.shared import Cm, ElementProxy, Emu, Inches, Length, Mm, Pt, RGBColor, Twips
+from skelmis.docx.shared import (
+    Cm,
+    ElementProxy,
+    Emu,
+    Inches,
+    Length,
+    Mm,
+    ProxyCache,
+    Pt,
+    RGBColor,
+    Twips,
+    proxy_cache_of,
+)
+from skelmis.docx.table import _Cell, _Row
+from skelmis.docx.text.hyperlink import Hyperlink
+from skelmis.docx.text.paragraph import Paragraph
+from skelmis.docx.text.run import Run
 
 from .unitutil.cxml import element
 from .unitutil.mock import instance_mock
@@ -63,6 +81,54 @@ class DescribeElementProxy:
         return instance_mock(request, XmlPart)
 
 
+class DescribeProxyCache:
+    """Unit-test suite for `skelmis.docx.shared.ProxyCache` and slotted proxies."""
+
+    def it_reuses_the_proxy_of_an_element_while_it_is_referenced(self):
+        cache = ProxyCache()
+        p = element("w:p")
+
+        paragraph = cache.get(p, Paragraph, None)
+
+        assert cache.get(p, Paragraph, None) is paragraph
+        assert len(cache) == 1
+        del paragraph
+        gc.collect()
+        assert len(cache) == 0
+
+    def but_it_creates_a_new_proxy_when_the_proxy_class_differs(self):
+        cache = ProxyCache()
+        r = element("w:r")
+        proxy = cache.get(r, Paragraph, None)
+
+        run = cache.get(r, Run, None)
+
+        assert isinstance(run, Run)
+        assert run is not proxy
+
+    def it_is_not_looked_up_for_a_proxy_having_no_part(self):
+        ProxyCache()
+        paragraph = Paragraph(element('w:p/(w:r/w:t"a",w:r/w:t"b")'), None)
+
+        assert proxy_cache_of(paragraph) is None
+        assert [r.text for r in paragraph.runs] == ["a", "b"]
+
+    @pytest.mark.parametrize(
+        ("proxy_cls", "cxml"),
+        [
+            (Paragraph, "w:p"),
+            (Run, "w:r"),
+            (Hyperlink, "w:hyperlink"),
+            (_Row, "w:tr"),
+            (_Cell, "w:tc"),
+        ],
+    )
+    def it_allocates_proxies_without_an_instance_dict(self, proxy_cls: type, cxml: str):
+        proxy = proxy_cls(element(cxml), None)
+
+        assert not hasattr(proxy, "__dict__")
+
+
 class DescribeLength:
     def it_can_construct_from_convenient_units(self, construct_fixture):
         UnitCls, units_val, emu = construct_fixture
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import io
 from typing import cast
 
 import pytest
@@ -18,14 +19,15 @@ from skelmis.docx.enum.table import (
 )
 from skelmis.docx.oxml.parser import parse_xml
 from skelmis.docx.oxml.table import CT_Row, CT_Tbl, CT_TblGridCol, CT_Tc
+from skelmis.docx.oxml.text.font import CT_RPr
 from skelmis.docx.parts.document import DocumentPart
 from skelmis.docx.shared import Emu, Inches, Length
-from skelmis.docx.table import Table, _Cell, _Column, _Columns, _Row, _Rows
+from skelmis.docx.table import Table, TableStreamWriter, _Cell, _Column, _Columns, _Row, _Rows
 from skelmis.docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import FixtureRequest, Mock, instance_mock, property_mock
+from .unitutil.mock import FixtureRequest, Mock, instance_mock, method_mock, property_mock
 
 
 class DescribeTable:
@@ -55,6 +57,119 @@ class DescribeTable:
         assert column._gridCol is table._tbl.tblGrid.gridCol_lst[-1]
         assert column._parent is table
 
+    def it_can_extend_its_rows_from_records(self, document_: Mock):
+        tbl = cast(
+            CT_Tbl,
+            element(
+                'w:tbl/(w:tblPr,w:tblGrid,w:tr/(w:tc/w:p/w:r/w:t"head",w:tc/w:p),'
+                'w:tr/(w:trPr,w:tc/(w:tcPr,w:p/(w:pPr,w:r/(w:rPr/w:b,w:t"x"))),w:tc/w:p))'
+            ),
+        )
+        table = Table(tbl, document_)
+
+        table.extend_rows([("a", 1), (None, " b\tc"), ["d"]], template_row=1)
+
+        assert table._tbl.xml == xml(
+            'w:tbl/(w:tblPr,w:tblGrid,w:tr/(w:tc/w:p/w:r/w:t"head",w:tc/w:p),'
+            'w:tr/(w:trPr,w:tc/(w:tcPr,w:p/(w:pPr,w:r/(w:rPr/w:b,w:t"x"))),w:tc/w:p),'
+            'w:tr/(w:trPr,w:tc/(w:tcPr,w:p/(w:pPr,w:r/(w:rPr/w:b,w:t"a"))),w:tc/w:p/w:r/w:t"1"),'
+            "w:tr/(w:trPr,w:tc/(w:tcPr,w:p/w:pPr),w:tc/w:p/w:r/"
+            '(w:t{xml:space=preserve}" b",w:tab,w:t"c")),'
+            'w:tr/(w:trPr,w:tc/(w:tcPr,w:p/(w:pPr,w:r/(w:rPr/w:b,w:t"d"))),w:tc/w:p))'
+        )
+
+    def but_it_raises_when_a_record_has_more_values_than_the_row_has_cells(self, document_: Mock):
+        table = Table(cast(CT_Tbl, element("w:tbl/(w:tblPr,w:tblGrid,w:tr/w:tc/w:p)")), document_)
+        with pytest.raises(ValueError, match="record has 2 values but template row has 1 cells"):
+            table.extend_rows([("a", "b")])
+
+    @pytest.mark.parametrize(
+        ("tbl_cxml", "fill_merged", "nested", "expected_value"),
+        [
+            ("w:tbl/(w:tblPr,w:tblGrid)", True, False, []),
+            (
+                'w:tbl/(w:tblPr,w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/(w:p/w:r/w:t"a",w:p'
+                '/w:r/w:t"b"),w:tc/w:p),w:tr/(w:tc/w:p/w:r/w:t"c",w:tc/w:p/w:r/w:t"d"))',
+                True,
+                False,
+                [["a\nb", ""], ["c", "d"]],
+            ),
+            # -- horizontal and vertical spans, filled or not --
+            (
+                "w:tbl/(w:tblPr,w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),"
+                'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge{w:val=restart}),w:p/w:r/w:t"a")'
+                ',w:tc/w:p/w:r/w:t"b"),'
+                'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge),w:p),w:tc/w:p/w:r/w:t"c"))',
+                True,
+                False,
+                [["a", "a", "b"], ["a", "a", "c"]],
+            ),
+            (
+                "w:tbl/(w:tblPr,w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),"
+                'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge{w:val=restart}),w:p/w:r/w:t"a")'
+                ',w:tc/w:p/w:r/w:t"b"),'
+                'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge),w:p),w:tc/w:p/w:r/w:t"c"))',
+                False,
+                False,
+                [["a", "", "b"], ["", "", "c"]],
+            ),
+            # -- grid positions before and after the cells of a row are empty --
+            (
+                "w:tbl/(w:tblPr,w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),"
+                'w:tr/(w:trPr/w:gridBefore{w:val=1},w:tc/w:p/w:r/w:t"a"))',
+                True,
+                False,
+                [["", "a", ""]],
+            ),
+            # -- nested tables, with their text or without --
+            (
+                'w:tbl/(w:tblPr,w:tblGrid/w:gridCol,w:tr/w:tc/(w:p/w:r/w:t"a",w:tbl/(w:tblPr,'
+                'w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"b"),w:p/w:r/w:t"c"))',
+                True,
+                False,
+                [["a\nc"]],
+            ),
+            (
+                'w:tbl/(w:tblPr,w:tblGrid/w:gridCol,w:tr/w:tc/(w:p/w:r/w:t"a",w:tbl/(w:tblPr,'
+                'w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"b"),w:p/w:r/w:t"c"))',
+                True,
+                True,
+                [["a\nb\nc"]],
+            ),
+        ],
+    )
+    def it_can_extract_the_text_of_its_cells_as_records(
+        self,
+        tbl_cxml: str,
+        fill_merged: bool,
+        nested: bool,
+        expected_value: list[list[str]],
+        document_: Mock,
+    ):
+        table = Table(cast(CT_Tbl, element(tbl_cxml)), document_)
+        assert table.to_records(fill_merged, nested) == expected_value
+
+    def it_can_extract_the_text_of_its_cells_as_columns(
+        self, request: FixtureRequest, document_: Mock
+    ):
+        to_records_ = method_mock(
+            request, Table, "to_records", return_value=[["a", "b"], ["c", "d"]]
+        )
+        table = Table(cast(CT_Tbl, element("w:tbl/(w:tblPr,w:tblGrid)")), document_)
+
+        columns = table.to_columns(False, True)
+
+        to_records_.assert_called_once_with(table, False, True)
+        assert columns == [["a", "c"], ["b", "d"]]
+
+    @pytest.mark.parametrize("snippet_idx", range(7))
+    def it_extracts_the_same_text_as_its_cells(self, snippet_idx: int, document_: Mock):
+        tbl = cast(CT_Tbl, parse_xml(snippet_seq("tbl-cells")[snippet_idx]))
+        for tc in tbl.iter_tcs():
+            tc.add_p().add_r().text = f"{tc.grid_offset},{tc.top}"
+        table = Table(tbl, document_)
+        assert table.to_records() == [[c.text for c in row.cells] for row in table.rows]
+
     def it_provides_access_to_a_cell_by_row_and_col_indices(self, table: Table):
         for row_idx in range(2):
             for col_idx in range(2):
@@ -64,6 +179,52 @@ class DescribeTable:
                 tc = tr.tc_lst[col_idx]
                 assert tc is cell._tc
 
+    @pytest.mark.parametrize(
+        ("tbl_cxml", "merges"),
+        [
+            (
+                "w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p),"
+                "w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p),w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p))",
+                [(0, 0, 1, 1), (2, 2, 1, 2)],
+            ),
+            (
+                "w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p),w:tr/(w:tc/w:p,w:tc/w:p))",
+                [(0, 1, 1, 1), (0, 0, 1, 0), (1, 1, 0, 0)],
+            ),
+            # -- a row skipping its first grid column --
+            (
+                "w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p),"
+                "w:tr/(w:trPr/w:gridBefore{w:val=1},w:tc/w:p))",
+                [(0, 0, 0, 1)],
+            ),
+        ],
+    )
+    def it_finds_the_same_cells_as_its_cell_grid_as_cells_are_merged(
+        self, tbl_cxml: str, merges: list[tuple[int, int, int, int]], document_: Mock
+    ):
+        table = Table(cast(CT_Tbl, element(tbl_cxml)), document_)
+        col_count = table._column_count
+
+        def assert_same_cells():
+            cells = table._cells
+            assert [table.cell(*divmod(idx, col_count))._tc for idx in range(len(cells))] == [
+                cell._tc for cell in cells
+            ]
+
+        assert_same_cells()
+        for row_idx, col_idx, row_idx_2, col_idx_2 in merges:
+            table.cell(row_idx, col_idx).merge(table.cell(row_idx_2, col_idx_2))
+            assert_same_cells()
+
+    def it_indexes_its_cells_again_when_its_rows_change(self, document_: Mock):
+        table = Table(cast(CT_Tbl, element("w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc)")), document_)
+        geometry = table._geometry
+
+        assert table._geometry is geometry
+        table.add_row()
+        assert table._geometry is not geometry
+        assert table.cell(1, 0)._tc is table._tbl.tr_lst[1].tc_lst[0]
+
     def it_provides_access_to_the_table_rows(self, table: Table):
         rows = table.rows
         assert isinstance(rows, _Rows)
@@ -323,6 +484,76 @@ class DescribeTable:
         return Table(cast(CT_Tbl, element(tbl_cxml)), document_)
 
 
+class DescribeTableStreamWriter:
+    """Unit-test suite for `skelmis.docx.table.TableStreamWriter`."""
+
+    def it_writes_the_table_with_a_row_for_each_record(self):
+        tbl = cast(
+            CT_Tbl,
+            element(
+                "w:tbl/(w:tblPr,w:tblGrid/(w:gridCol{w:w=1440},w:gridCol),"
+                'w:tr/(w:trPr/w:tblHeader,w:tc/w:p/w:r/w:t"head",w:tc/w:p))'
+            ),
+        )
+        table = Table(tbl, None)
+        records = iter([("a", 1), (None, "b\tc"), ()])
+        writer = TableStreamWriter(table, records, [cast(CT_RPr, element("w:rPr/w:b"))])
+        stream = io.BytesIO()
+
+        writer.write(stream)
+
+        written = parse_xml(stream.getvalue())
+        assert writer.table is table
+        assert stream.getvalue().count(b"xmlns:w=") == 1
+        assert written.xml == xml(
+            "w:tbl/(w:tblPr,w:tblGrid/(w:gridCol{w:w=1440},w:gridCol),"
+            'w:tr/(w:trPr/w:tblHeader,w:tc/w:p/w:r/w:t"head",w:tc/w:p),'
+            'w:tr/(w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=1440},w:p/w:r/(w:rPr/w:b,w:t"a")),'
+            'w:tc/w:p/w:r/w:t"1"),'
+            "w:tr/(w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=1440},w:p),"
+            'w:tc/w:p/w:r/(w:t"b",w:tab,w:t"c")),'
+            "w:tr/(w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=1440},w:p),w:tc/w:p))"
+        )
+        assert list(records) == []
+        assert len(tbl.tr_lst) == 1
+
+    def it_writes_an_empty_row_when_there_are_neither_rows_nor_records(self):
+        tbl = cast(CT_Tbl, element("w:tbl/(w:tblPr,w:tblGrid/w:gridCol)"))
+        writer = TableStreamWriter(Table(tbl, None), iter([]))
+        stream = io.BytesIO()
+
+        writer.write(stream)
+
+        assert parse_xml(stream.getvalue()).xml == xml(
+            "w:tbl/(w:tblPr,w:tblGrid/w:gridCol,w:tr/w:tc/w:p)"
+        )
+
+    def it_writes_the_records_afresh_each_time_when_given_a_function_returning_them(self):
+        tbl = cast(CT_Tbl, element("w:tbl/(w:tblPr,w:tblGrid/w:gridCol)"))
+        writer = TableStreamWriter(Table(tbl, None), lambda: (("a",), ("b",)))
+
+        for _ in range(2):
+            stream = io.BytesIO()
+            writer.write(stream)
+            assert stream.getvalue().count(b"<w:tr") == 2
+        assert writer.consumed is False
+
+    def but_it_raises_on_a_second_write_of_records_already_consumed(self):
+        tbl = cast(CT_Tbl, element("w:tbl/(w:tblPr,w:tblGrid/w:gridCol)"))
+        writer = TableStreamWriter(Table(tbl, None), iter([("a",)]))
+        writer.write(io.BytesIO())
+        assert writer.consumed is True
+
+        with pytest.raises(ValueError, match="consumed when it was first saved"):
+            writer.write(io.BytesIO())
+
+    def but_it_raises_on_a_record_longer_than_a_row(self):
+        table = Table(cast(CT_Tbl, element("w:tbl/(w:tblPr,w:tblGrid/w:gridCol)")), None)
+        writer = TableStreamWriter(table, [("a", "b")])
+        with pytest.raises(ValueError, match="2 values given for a row of 1 cells"):
+            writer.write(io.BytesIO())
+
+
 class Describe_Cell:
     """Unit-test suite for `docx.table._Cell` objects."""
 
@@ -516,7 +747,7 @@ class Describe_Cell:
         merged_cell = cell.merge(other_cell)
 
         assert isinstance(merged_cell, _Cell)
-        tc_.merge.assert_called_once_with(other_cell._tc)
+        tc_.merge.assert_called_once_with(other_cell._tc, parent_._geometry)
         assert merged_cell._tc is merged_tc_
         assert merged_cell._parent is cell._parent
 
@@ -0,0 +1,163 @@
+"""Unit-test suite for the `skelmis.docx.template` module."""
+
+from __future__ import annotations
+
+import io
+from types import SimpleNamespace
+from typing import Callable
+
+import pytest
+
+from skelmis.docx import Document, Template
+from skelmis.docx.document import Document as DocumentObject
+from skelmis.docx.enum.style import WD_STYLE_TYPE
+from skelmis.docx.exceptions import TemplateError
+
+
+class DescribeTemplate:
+    """Unit-test suite for `skelmis.docx.template.Template`."""
+
+    def it_fills_in_placeholders_split_over_runs(self):
+        def build(document: DocumentObject):
+            paragraph = document.add_paragraph("Dear {{ na")
+            paragraph.add_run("me }}").bold = True
+            paragraph.add_run(", order {{order.id}} ships {{ order.date }}.")
+
+        template = Template.compile(_docx(build))
+        order = SimpleNamespace(id=42, date=None)
+
+        document = template.render({"name": "Ada", "order": order})
+
+        assert _text(document) == ["Dear Ada, order 42 ships ."]
+        assert [r.bold for r in document.paragraphs[0].runs] == [None, None]
+
+    def it_fills_in_placeholders_in_headers_and_footers(self):
+        def build(document: DocumentObject):
+            document.sections[0].header.paragraphs[0].text = "From {{sender}}"
+            document.sections[0].footer.paragraphs[0].text = "Page of {{sender}}"
+
+        document = Template.compile(_docx(build)).render({"sender": "ACME"})
+
+        section = document.sections[0]
+        assert section.header.paragraphs[0].text == "From ACME"
+        assert section.footer.paragraphs[0].text == "Page of ACME"
+
+    def it_repeats_the_paragraphs_of_a_region_for_each_item(self):
+        def build(document: DocumentObject):
+            for text in ["{{#people}}", "{{name}}:", "{{#pets}}", "- {{name}} of {{owner}}"]:
+                document.add_paragraph(text)
+            for text in ["{{/pets}}", "{{/people}}", "end"]:
+                document.add_paragraph(text)
+
+        template = Template.compile(_docx(build))
+
+        document = template.render(
+            {
+                "owner": "nobody",
+                "people": [
+                    {"name": "Ann", "pets": [{"name": "Rex"}, {"name": "Tom", "owner": "Ann"}]},
+                    {"name": "Bob", "pets": []},
+                ],
+            }
+        )
+
+        assert _text(document) == [
+            "Ann:",
+            "- Rex of nobody",
+            "- Tom of Ann",
+            "Bob:",
+            "end",
+        ]
+
+    def it_repeats_the_rows_of_a_region_for_each_item(self):
+        def build(document: DocumentObject):
+            table = document.add_table(4, 2)
+            table.cell(0, 0).text = "Item"
+            table.cell(1, 0).text = "{{#lines}}"
+            table.cell(1, 0).add_paragraph("{{item}}")
+            table.cell(1, 1).text = "{{qty}}"
+            table.cell(2, 0).text = "{{/lines}}"
+            table.cell(3, 0).text = "Total"
+            table.cell(3, 1).text = "{{total}}"
+
+        template = Template.compile(_docx(build))
+
+        document = template.render(
+            {"lines": [{"item": "Pen", "qty": 2}, {"item": "Ink", "qty": 1}], "total": 3}
+        )
+
+        assert [[c.text for c in row.cells] for row in document.tables[0].rows] == [
+            ["Item", ""],
+            ["Pen", "2"],
+            ["", ""],
+            ["Ink", "1"],
+            ["", ""],
+            ["Total", "3"],
+        ]
+
+    def it_renders_independent_documents(self):
+        template = Template.compile(_docx(lambda document: document.add_paragraph("Hi {{name}}")))
+
+        first = template.render({"name": "Ada"})
+        second = template.render({"name": "Bob"})
+        first.add_paragraph("more")
+
+        assert _text(first) == ["Hi Ada", "more"]
+        assert _text(second) == ["Hi Bob"]
+
+    def it_shares_the_parts_without_placeholders_until_they_are_used(self):
+        template = Template.compile(_docx(lambda document: document.add_paragraph("Hi {{name}}")))
+
+        first = template.render({"name": "Ada"})
+        second = template.render({"name": "Bob"})
+        styles_blob = second.part._styles_part.blob
+        first.styles.add_style("Extra", WD_STYLE_TYPE.PARAGRAPH)
+
+        assert "Extra" in first.styles
+        assert "Extra" not in second.styles
+        assert second.part._styles_part.blob == styles_blob
+        assert "Extra" not in template.render({"name": "Cy"}).styles
+
+    def it_raises_when_a_name_is_missing(self):
+        template = Template.compile(_docx(lambda document: document.add_paragraph("{{a.b}}")))
+        with pytest.raises(KeyError, match="a.b"):
+            template.render({"a": {}})
+
+    @pytest.mark.parametrize(
+        ("texts", "message"),
+        [
+            (["{{#a}}"], "'{{#a}}' has no matching closing marker"),
+            (["{{/a}}"], "'{{/a}}' has no matching '{{#a}}'"),
+            (["{{#a}}", "{{#b}}", "{{/a}}", "{{/b}}"], "'{{/a}}' has no matching '{{#a}}'"),
+            (["Hi {{#a}}", "{{/a}}"], "'{{#a}}' must be alone in its paragraph"),
+        ],
+    )
+    def it_raises_on_unbalanced_region_markers(self, texts: list[str], message: str):
+        def build(document: DocumentObject):
+            for text in texts:
+                document.add_paragraph(text)
+
+        with pytest.raises(TemplateError, match=message.replace("{", r"\{")):
+            Template.compile(_docx(build))
+
+    def it_raises_on_region_markers_in_different_containers(self):
+        def build(document: DocumentObject):
+            document.add_paragraph("{{#a}}")
+            document.add_table(1, 1).cell(0, 0).text = "{{/a}}"
+
+        with pytest.raises(TemplateError, match="markers of region 'a'"):
+            Template.compile(_docx(build))
+
+
+def _docx(build: Callable[[DocumentObject], object]) -> io.BytesIO:
+    """A stream of a new document, after adding to it with `build`."""
+    document = Document()
+    build(document)
+    stream = io.BytesIO()
+    document.save(stream)
+    stream.seek(0)
+    return stream
+
+
+def _text(document: DocumentObject) -> list[str]:
+    return list(document.iter_text(include=("body",), separator=""))
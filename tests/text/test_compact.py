@@ -0,0 +1,105 @@
+"""Unit-test suite for the `skelmis.docx.text.compact` module."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import pytest
+
+from skelmis.docx.text.compact import compact_story, merge_runs_in
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeCompactStory:
+    """Unit-test suite for `skelmis.docx.text.compact.compact_story()`."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_count", "expected_cxml"),
+        [
+            ({}, 2, 'w:body/(w:p/w:r/w:t"ab",w:tbl{w:x=1}/w:tr/w:tc/w:p/w:r/w:t"c")'),
+            (
+                {"merge_runs": False},
+                1,
+                'w:body/(w:p/(w:r/w:t"a",w:r/w:t"b"),w:tbl{w:x=1}/w:tr/w:tc/w:p/w:r/w:t"c")',
+            ),
+            (
+                {"drop_rsids": False},
+                1,
+                'w:body/(w:p{w:rsidR=00A1}/(w:r{w:rsidR=00A1}/w:t"a",w:r{w:rsidR=00B2}/w:t"b"),'
+                'w:tbl{w:x=1}/w:tr{w:rsidTr=00B2}/w:tc/w:p/w:r/w:t"c")',
+            ),
+            (
+                {"drop_proof_errors": False},
+                0,
+                'w:body/(w:p/(w:r/w:t"a",w:proofErr{w:type=spellStart},w:r/w:t"b"),'
+                'w:tbl{w:x=1}/w:tr/w:tc/w:p/w:r/w:t"c")',
+            ),
+        ],
+    )
+    def it_removes_the_markup_that_does_not_change_the_content(
+        self, kwargs: Dict[str, Any], expected_count: int, expected_cxml: str
+    ):
+        body = element(
+            'w:body/(w:p{w:rsidR=00A1}/(w:r{w:rsidR=00A1}/w:t"a",w:proofErr{w:type=spellStart},'
+            'w:r{w:rsidR=00B2}/w:t"b"),w:tbl{w:x=1}/w:tr{w:rsidTr=00B2}/w:tc/w:p/w:r/w:t"c")'
+        )
+
+        count = compact_story(body, **kwargs)
+
+        assert count == expected_count
+        assert body.xml == xml(expected_cxml)
+
+
+class DescribeMergeRunsIn:
+    """Unit-test suite for `skelmis.docx.text.compact.merge_runs_in()`."""
+
+    @pytest.mark.parametrize(
+        ("p_cxml", "expected_count", "expected_cxml"),
+        [
+            ("w:p", 0, "w:p"),
+            ('w:p/(w:r/w:t"a",w:r,w:r/w:rPr/w:b,w:r/w:t"b")', 3, 'w:p/w:r/w:t"ab"'),
+            (
+                'w:p/(w:r/(w:rPr/(w:b,w:i),w:t"a "),w:r/(w:rPr/(w:b,w:i),w:tab,w:t"b"),'
+                'w:r/(w:rPr/(w:b,w:i),w:t"c"))',
+                2,
+                'w:p/w:r/(w:rPr/(w:b,w:i),w:t"a ",w:tab,w:t"bc")',
+            ),
+            # -- differently formatted runs stay apart --
+            (
+                'w:p/(w:r/(w:rPr/w:b,w:t"a"),w:r/w:t"b",w:r/(w:rPr/w:b{w:val=0},w:t"c"))',
+                0,
+                'w:p/(w:r/(w:rPr/w:b,w:t"a"),w:r/w:t"b",w:r/(w:rPr/w:b{w:val=0},w:t"c"))',
+            ),
+            # -- as do runs separated by other markup, or holding more than text --
+            (
+                'w:p/(w:r/w:t"a",w:bookmarkStart,w:r/w:t"b",w:r/w:drawing,w:r/w:t"c")',
+                0,
+                'w:p/(w:r/w:t"a",w:bookmarkStart,w:r/w:t"b",w:r/w:drawing,w:r/w:t"c")',
+            ),
+            # -- runs in a hyperlink are left to the hyperlink --
+            (
+                'w:p/(w:r/w:t"a",w:hyperlink/(w:r/w:t"b",w:r/w:t"c"))',
+                0,
+                'w:p/(w:r/w:t"a",w:hyperlink/(w:r/w:t"b",w:r/w:t"c"))',
+            ),
+        ],
+    )
+    def it_merges_adjacent_runs_having_the_same_formatting(
+        self, p_cxml: str, expected_count: int, expected_cxml: str
+    ):
+        p = element(p_cxml)
+
+        count = merge_runs_in(p)
+
+        assert count == expected_count
+        assert p.xml == xml(expected_cxml)
+
+    def it_preserves_the_spaces_where_text_is_joined(self):
+        p = element('w:p/(w:r/w:t"a",w:r/w:t{xml:space=preserve}" b ")')
+
+        merge_runs_in(p)
+
+        t = p[0][0]
+        assert t.text == "a b "
+        assert t.get("{http://www.w3.org/XML/1998/namespace}space") == "preserve"
@@ -0,0 +1,131 @@
+"""Unit-test suite for the `skelmis.docx.text.pages` module."""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import pytest
+
+from skelmis.docx import Document
+from skelmis.docx.text.pages import Page, PageIndex, iter_pages
+
+from ..unitutil.cxml import element
+
+
+def _pages(body_cxml: str) -> List[Tuple[str, range]]:
+    return [(page.text, page.blocks) for page in iter_pages(element(body_cxml))]
+
+
+class DescribeIterPages:
+    """Unit-test suite for `skelmis.docx.text.pages.iter_pages()`."""
+
+    @pytest.mark.parametrize(
+        ("body_cxml", "expected_value"),
+        [
+            ("w:body", [("", range(0, 0))]),
+            ('w:body/(w:p/w:r/w:t"a",w:p/w:r/w:t"b")', [("a\nb", range(0, 2))]),
+            # -- a rendered page break within a paragraph splits it across pages --
+            (
+                'w:body/(w:p/w:r/w:t"a",w:p/(w:r/w:t"b",w:r/(w:lastRenderedPageBreak,w:t"c")),'
+                'w:p/w:r/w:t"d")',
+                [("a\nb", range(0, 2)), ("c\nd", range(1, 3))],
+            ),
+            # -- one at the start of a paragraph starts a page with it --
+            (
+                'w:body/(w:p/w:r/w:t"a",w:p/w:r/(w:lastRenderedPageBreak,w:t"b"))',
+                [("a", range(0, 1)), ("b", range(1, 2))],
+            ),
+            # -- a page break inserted by the author, followed by its rendered page break --
+            (
+                'w:body/(w:p/(w:r/w:t"a",w:r/w:br{w:type=page}),'
+                'w:p/w:r/(w:lastRenderedPageBreak,w:t"b"))',
+                [("a", range(0, 1)), ("\nb", range(0, 2))],
+            ),
+            # -- a line break isn't a page break --
+            ('w:body/w:p/w:r/(w:t"a",w:br,w:t"b")', [("a\nb", range(0, 1))]),
+            # -- two rendered page breaks with no text between are two pages --
+            (
+                'w:body/(w:p/w:r/w:t"a",w:p/w:r/w:lastRenderedPageBreak,'
+                'w:p/w:r/(w:lastRenderedPageBreak,w:t"b"))',
+                [("a", range(0, 1)), ("", range(1, 2)), ("b", range(2, 3))],
+            ),
+        ],
+    )
+    def it_splits_the_body_into_pages_at_its_page_breaks(
+        self, body_cxml: str, expected_value: List[Tuple[str, range]]
+    ):
+        assert _pages(body_cxml) == expected_value
+
+    def it_finds_page_breaks_in_tables(self):
+        body_cxml = (
+            'w:body/(w:p/w:r/w:t"a",w:tbl/(w:tr/w:tc/w:p/w:r/w:t"b",'
+            'w:tr/w:tc/(w:p/w:r/(w:lastRenderedPageBreak,w:t"c"),'
+            'w:tbl/w:tr/w:tc/w:p/w:r/w:t"d")),w:p/w:r/w:t"e")'
+        )
+
+        assert _pages(body_cxml) == [("a\nb", range(0, 2)), ("c\nd\ne", range(1, 3))]
+
+    def it_numbers_the_pages(self):
+        body = element("w:body/(w:p,w:p/w:r/w:lastRenderedPageBreak,w:p/w:r/w:br{w:type=page})")
+
+        assert [page.number for page in iter_pages(body)] == [1, 2, 3]
+
+
+class DescribePageIndex:
+    """Unit-test suite for `skelmis.docx.text.pages.PageIndex`."""
+
+    def it_is_a_sequence_of_pages(self, index: PageIndex):
+        assert len(index) == 3
+        assert index[1].text == "brown fox"
+        assert [page.number for page in index[1:]] == [2, 3]
+
+    @pytest.mark.parametrize(
+        ("block_idx", "expected_number"), [(0, 1), (1, 1), (2, 2), (3, 2), (4, 3)]
+    )
+    def it_finds_the_page_a_block_item_starts_on(
+        self, index: PageIndex, block_idx: int, expected_number: int
+    ):
+        assert index.page_of_block(block_idx).number == expected_number
+
+    @pytest.mark.parametrize("block_idx", [-1, 5])
+    def but_it_raises_when_there_is_no_such_block_item(self, index: PageIndex, block_idx: int):
+        with pytest.raises(IndexError, match=f"no block item at index {block_idx}"):
+            index.page_of_block(block_idx)
+
+    def it_can_search_the_text_of_its_pages(self, index: PageIndex):
+        assert [(p.number, m.group()) for p, m in index.search("o")] == [
+            (2, "o"),
+            (2, "o"),
+            (3, "o"),
+            (3, "o"),
+        ]
+        assert [(p.number, m[1]) for p, m in index.search(r"(\w+) do", regex=True)] == [(3, "lazy")]
+
+    # -- fixtures --------------------------------------------------------------------------------
+
+    @pytest.fixture
+    def index(self) -> PageIndex:
+        return PageIndex(
+            [
+                Page(1, "the quick\n", range(0, 2)),
+                Page(2, "brown fox", range(2, 4)),
+                Page(3, "jumps over the\nlazy dog", range(3, 5)),
+            ]
+        )
+
+
+class DescribeDocumentPages:
+    """Integration tests for the page methods of `skelmis.docx.document.Document`."""
+
+    def it_indexes_the_pages_of_the_document(self):
+        document = Document()
+        document.add_paragraph("Chapter 1")
+        document.add_table(rows=1, cols=1).cell(0, 0).text = "cell"
+        document.add_page_break()
+        document.add_paragraph("Chapter 2")
+
+        index = document.page_index()
+
+        assert [page.text for page in document.iter_pages()] == ["Chapter 1\ncell", "\nChapter 2"]
+        assert index.page_of_block(3).number == 2
+        assert [page.number for page, _ in index.search("Chapter")] == [1, 2]
@@ -5,8 +5,10 @@ from typing import List, cast
 import pytest
 
 from skelmis.docx import types as t
+from skelmis.docx.bookmarks import BookmarkRegistry
 from skelmis.docx.enum.style import WD_STYLE_TYPE
 from skelmis.docx.enum.text import WD_ALIGN_PARAGRAPH
+from skelmis.docx.oxml.ns import qn
 from skelmis.docx.oxml.text.paragraph import CT_P
 from skelmis.docx.oxml.text.run import CT_R
 from skelmis.docx.parts.document import DocumentPart
@@ -15,7 +17,7 @@ from skelmis.docx.text.parfmt import ParagraphFormat
 from skelmis.docx.text.run import Run
 
 from ..unitutil.cxml import element, xml
-from ..unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
+from ..unitutil.mock import Mock, call, class_mock, instance_mock, method_mock, property_mock
 
 
 class DescribeParagraph:
@@ -72,7 +74,7 @@ class DescribeParagraph:
         ],
     )
     def it_can_iterate_its_inner_content_items(
-        self, p_cxml: str, expected: List[str], fake_parent: t.ProvidesStoryPart
+        self, p_cxml: str, expected: List[str], fake_parent: t.ProvidesStoryPart, part_prop_: Mock
     ):
         p = cast(CT_P, element(p_cxml))
         paragraph = Paragraph(p, fake_parent)
@@ -184,6 +186,48 @@ class DescribeParagraph:
         if style:
             style_prop_.assert_called_once_with(style)
 
+    def it_can_add_a_bookmark_having_a_new_id(self, part_prop_: Mock, fake_parent):
+        body = element("w:body/(w:p/w:bookmarkStart{w:id=4,w:name=a},w:p)")
+        part_prop_.return_value.bookmarks = BookmarkRegistry(body)
+        paragraph = Paragraph(cast(CT_P, body[1]), fake_parent)
+
+        run = paragraph.add_bookmark("b c", "text")
+
+        assert paragraph._p.xml == xml(
+            'w:p/(w:bookmarkStart{w:id=5,w:name=b c},w:r/w:t"text",w:bookmarkEnd{w:id=5})'
+        )
+        assert run is not None
+        assert run.text == "text"
+        assert part_prop_.return_value.bookmarks.get("b c") is paragraph._p[0]
+
+    def but_it_raises_when_the_story_has_a_bookmark_of_that_name(
+        self, part_prop_: Mock, fake_parent
+    ):
+        body = element("w:body/(w:p/w:bookmarkStart{w:id=0,w:name=a},w:p)")
+        part_prop_.return_value.bookmarks = BookmarkRegistry(body)
+        paragraph = Paragraph(cast(CT_P, body[1]), fake_parent)
+
+        with pytest.raises(ValueError, match="a bookmark named 'a' already exists"):
+            paragraph.add_bookmark("a")
+        assert paragraph._p.xml == xml("w:p")
+        # -- no id was used up by the refused bookmark --
+        paragraph.add_bookmark("b")
+        assert paragraph._p[0].get(qn("w:id")) == "1"
+
+    def it_gives_a_new_bookmark_an_id_past_those_added_to_the_xml_and_refreshed(
+        self, part_prop_: Mock, fake_parent
+    ):
+        body = element("w:body/(w:p/w:bookmarkStart{w:id=0,w:name=a},w:p)")
+        part_prop_.return_value.bookmarks = BookmarkRegistry(body)
+        paragraph = Paragraph(cast(CT_P, body[1]), fake_parent)
+        paragraph.add_bookmark("b")
+
+        body[0].append(element("w:bookmarkStart{w:id=2,w:name=c}"))
+        part_prop_.return_value.bookmarks.refresh()
+        paragraph.add_bookmark("d")
+
+        assert [e.get(qn("w:id")) for e in body.iter(qn("w:bookmarkStart"))] == ["0", "2", "1", "3"]
+
     def it_can_insert_a_paragraph_before_itself(self, insert_before_fixture):
         text, style, paragraph_, add_run_calls = insert_before_fixture
         paragraph = Paragraph(None, None)
@@ -0,0 +1,133 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit-test suite for the `skelmis.docx.text.search` module."""
+
+from __future__ import annotations
+
+import re
+from typing import cast
+
+import pytest
+
+from skelmis.docx.oxml.text.paragraph import CT_P
+from skelmis.docx.text.search import (
+    compile_pattern,
+    iter_text_runs,
+    paragraph_text,
+    replace_in_paragraph,
+)
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeParagraphText:
+    """Unit-test suite for the paragraph-text functions of `skelmis.docx.text.search`."""
+
+    @pytest.mark.parametrize(
+        "p_cxml",
+        [
+            "w:p",
+            'w:p/w:r/w:t"foo"',
+            'w:p/(w:r/(w:t"foo",w:tab,w:br,w:cr,w:noBreakHyphen,w:ptab),w:r/w:t"bar")',
+            'w:p/(w:r/w:t"a",w:hyperlink/(w:r/w:t"b",w:r/w:t"c"),w:r/w:t"d")',
+            'w:p/(w:r/(w:t"a",w:br{w:type=page},w:t"b"),w:ins/w:r/w:t"not-text")',
+        ],
+    )
+    def it_reads_the_same_text_as_the_paragraph_element(self, p_cxml: str):
+        p = cast(CT_P, element(p_cxml))
+        assert paragraph_text(p) == p.text
+
+    def it_generates_the_runs_of_the_paragraph_and_its_hyperlinks(self):
+        p = element('w:p/(w:r/w:t"a",w:hyperlink/(w:r/w:t"b",w:r/w:t"c"),w:r/w:t"d")')
+        assert [r.text for r in iter_text_runs(cast(CT_P, p))] == ["a", "b", "c", "d"]
+
+
+class DescribeReplaceInParagraph:
+    """Unit-test suite for `skelmis.docx.text.search.replace_in_paragraph()`."""
+
+    @pytest.mark.parametrize(
+        ("p_cxml", "pattern", "repl", "expected_cxml", "expected_count"),
+        [
+            ('w:p/w:r/w:t"foo"', "x", "y", 'w:p/w:r/w:t"foo"', 0),
+            ('w:p/w:r/w:t"{{a}} and {{a}}"', "{{a}}", "X", 'w:p/w:r/w:t"X and X"', 2),
+            # -- a match spread over runs takes the formatting of the run it starts in --
+            (
+                'w:p/(w:r/w:t"Dear ",w:r/(w:rPr/w:b,w:t"{{na"),w:r/w:t"me}}!")',
+                "{{name}}",
+                "Bob",
+                'w:p/(w:r/w:t"Dear ",w:r/(w:rPr/w:b,w:t"Bob"),w:r/w:t"!")',
+                1,
+            ),
+            # -- runs left empty are removed --
+            (
+                'w:p/(w:r/w:t"{{",w:r/w:t"a",w:r/(w:rPr/w:i,w:t"}}"))',
+                "{{a}}",
+                "X",
+                'w:p/w:r/w:t"X"',
+                1,
+            ),
+            # -- a match can extend into a hyperlink --
+            (
+                'w:p/(w:r/w:t"go {{li",w:hyperlink/w:r/w:t"nk}} now")',
+                "{{link}}",
+                "here",
+                'w:p/(w:r/w:t"go here",w:hyperlink/w:r/w:t{xml:space=preserve}" now")',
+                1,
+            ),
+            # -- tabs and line breaks are matched and written as such --
+            (
+                'w:p/w:r/(w:t"a",w:tab,w:t"b")',
+                "a\tb",
+                "c\nd",
+                'w:p/w:r/(w:t"c",w:br,w:t"d")',
+                1,
+            ),
+            # -- content of a run other than its text is kept in place --
+            (
+                'w:p/w:r/(w:t"{{a}}",w:br{w:type=page},w:drawing)',
+                "{{a}}",
+                "",
+                "w:p/w:r/(w:br{w:type=page},w:drawing)",
+                1,
+            ),
+        ],
+    )
+    def it_replaces_matches_across_runs(
+        self, p_cxml: str, pattern: str, repl: str, expected_cxml: str, expected_count: int
+    ):
+        p = cast(CT_P, element(p_cxml))
+
+        count = replace_in_paragraph(p, compile_pattern(pattern, False), lambda m: repl)
+
+        assert p.xml == xml(expected_cxml)
+        assert count == expected_count
+
+    def it_leaves_runs_a_match_does_not_touch_alone(self):
+        p = cast(CT_P, element('w:p/(w:r/w:t"keep",w:r/w:t"{{a}}",w:r/w:t"keep")'))
+        first, _, last = list(iter_text_runs(p))
+
+        replace_in_paragraph(p, compile_pattern("{{a}}", False), lambda m: "X")
+
+        assert list(iter_text_runs(p))[0] is first
+        assert list(iter_text_runs(p))[2] is last
+        assert p.text == "keepXkeep"
+
+    def it_replaces_an_empty_match_at_the_end_of_the_text(self):
+        p = cast(CT_P, element('w:p/(w:r/w:t"a",w:r/w:t"b")'))
+
+        replace_in_paragraph(p, compile_pattern("$", True), lambda m: "!")
+
+        assert p.xml == xml('w:p/(w:r/w:t"a",w:r/w:t"b!")')
+
+    @pytest.mark.parametrize(
+        ("pattern", "regex", "text", "expected_value"),
+        [
+            ("a.c", True, "abc a.c", ["abc", "a.c"]),
+            ("a.c", False, "abc a.c", ["a.c"]),
+            (re.compile("A", re.IGNORECASE), False, "aA", ["a", "A"]),
+        ],
+    )
+    def it_can_compile_a_pattern(
+        self, pattern: str | re.Pattern[str], regex: bool, text: str, expected_value: list[str]
+    ):
+        assert compile_pattern(pattern, regex).findall(text) == expected_value
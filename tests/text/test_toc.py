@@ -0,0 +1,152 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit-test suite for the skelmis.docx.text.toc module."""
+
+from __future__ import annotations
+
+import pytest
+
+from skelmis.docx import Document
+from skelmis.docx.document import Document as DocumentCls
+from skelmis.docx.oxml.ns import qn
+from skelmis.docx.text.toc import TocInstruction
+
+from ..unitutil.cxml import element
+
+
+class DescribeTocInstruction:
+    @pytest.mark.parametrize(
+        ("instr", "levels", "styles", "hyperlinks", "outline_levels", "hidden"),
+        [
+            (' TOC \\o "1-3" \\h \\z \\u ', (1, 3), {}, True, True, (0, 0)),
+            (' TOC \\o "2-4" \\t "Title,1,My Style,2" ', (2, 4), {"title": 1, "my style": 2},
+             False, False, (0, 0)),
+            (' TOC \\t "Title;1" \\n "2-9" ', None, {"title": 1}, False, False, (2, 9)),
+            (" TOC \\n \\h ", (1, 9), {}, True, False, (1, 9)),
+            (" TOC ", (1, 9), {}, False, False, (0, 0)),
+        ],
+    )  # fmt: skip
+    def it_parses_the_switches_of_a_TOC_field_instruction(
+        self, instr, levels, styles, hyperlinks, outline_levels, hidden
+    ):
+        instruction = TocInstruction(instr)
+
+        assert instruction.levels == levels
+        assert instruction.styles == styles
+        assert instruction.hyperlinks is hyperlinks
+        assert instruction.outline_levels is outline_levels
+        assert instruction.hide_page_numbers == hidden
+
+    @pytest.mark.parametrize(
+        ("instr", "style_names", "style_outline", "own_outline", "expected"),
+        [
+            (' TOC \\o "1-3" ', ["heading 2", "Normal"], 2, None, 2),
+            (' TOC \\o "1-3" ', ["heading 4", "Normal"], 4, None, None),
+            (' TOC \\o "1-3" ', ["Normal"], None, 1, None),
+            (' TOC \\o "1-3" \\u ', ["Normal"], None, 1, 1),
+            (' TOC \\o "1-3" \\u ', ["heading 1"], 1, 10, None),
+            (' TOC \\o "1-3" \\t "Title,1" ', ["Title", "Normal"], None, None, 1),
+            (' TOC \\t "Base,2" ', ["Derived", "Base"], None, None, 2),
+        ],
+    )
+    def it_knows_the_TOC_level_of_a_paragraph(
+        self, instr, style_names, style_outline, own_outline, expected
+    ):
+        instruction = TocInstruction(instr)
+        assert instruction.level_of(style_names, style_outline, own_outline) == expected
+
+
+class DescribeTocUpdater:
+    def it_fills_in_a_table_of_contents_from_the_document_headings(self, document):
+        assert document.update_toc() == 1
+
+        entries = document.paragraphs[:3]
+        assert [p.text for p in entries] == ["Intro\t", "Sub\t", "Next\t"]
+        assert [p.style.name for p in entries] == ["toc 1", "toc 2", "toc 1"]
+        anchors = [p._p.xpath("./w:hyperlink/@w:anchor")[0] for p in entries]
+        headings = [h for h in _headings(document) if h.text != "Deep"]
+        bookmarks = [p._p.xpath("./w:bookmarkStart/@w:name")[0] for p in headings]
+        assert anchors == bookmarks
+        assert len(set(anchors)) == 3
+        # -- the field ends in the last entry, the rest of the document is untouched --
+        assert entries[2]._p.xpath("./w:r/w:fldChar/@w:fldCharType") == ["end"]
+        assert [p.text for p in document.paragraphs[3:]] == [
+            "Intro", "body", "Sub", "Deep", "Next"
+        ]  # fmt: skip
+
+    def it_leaves_page_numbers_blank_without_rendered_page_breaks(self, document):
+        document.update_toc()
+
+        assert _page_numbers(document) == ["", "", ""]
+
+    def it_takes_page_numbers_from_rendered_page_breaks(self, document):
+        sub, next_ = _headings(document)[1], _headings(document)[3]
+        for heading in (sub, next_):
+            heading._p.r_lst[0].insert(
+                0, heading._p.r_lst[0].makeelement(qn("w:lastRenderedPageBreak"))
+            )
+
+        document.update_toc()
+
+        assert _page_numbers(document) == ["1", "2", "3"]
+
+    def it_counts_only_the_page_breaks_of_the_body_and_its_tables(self, document):
+        body_p, next_ = document.paragraphs[4], _headings(document)[3]
+        # -- a page break rendered in a text box, twice over as Word writes a fallback --
+        for _ in range(2):
+            body_p._p.append(
+                element(
+                    "w:r/w:drawing/wp:anchor/a:graphic/a:graphicData/w:txbxContent/w:p/w:r/"
+                    "w:lastRenderedPageBreak"
+                )
+            )
+        table = document.add_table(rows=1, cols=1)
+        next_._p.addprevious(table._tbl)
+        cell_p = table.cell(0, 0).paragraphs[0]._p
+        cell_p.append(element("w:r/w:lastRenderedPageBreak"))
+
+        document.update_toc()
+
+        assert _page_numbers(document) == ["1", "1", "2"]
+
+    def it_can_update_a_table_of_contents_again(self, document):
+        document.update_toc()
+        document.add_heading("Last", 1)
+
+        document.update_toc()
+
+        assert [p.text for p in document.paragraphs[:4]] == ["Intro\t", "Sub\t", "Next\t", "Last\t"]
+        assert len(document.element.xpath("//w:bookmarkStart")) == 4
+        assert len(document.paragraphs) == 10
+
+    def it_reports_when_there_are_no_entries(self):
+        document = Document()
+        document.add_paragraph().insert_table_of_contents()
+
+        assert document.update_toc() == 1
+        assert document.paragraphs[0].text == "No table of contents entries found."
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def document(self) -> DocumentCls:
+        document = Document()
+        document.add_paragraph().insert_table_of_contents(levels=2)
+        document.add_heading("Intro", 1)
+        document.add_paragraph("body")
+        document.add_heading("Sub", 2)
+        document.add_heading("Deep", 3)
+        document.add_heading("Next", 1)
+        return document
+
+
+def _headings(document: DocumentCls):
+    return [p for p in document.paragraphs if p.style.name.startswith("Heading")]
+
+
+def _page_numbers(document: DocumentCls):
+    return [
+        "".join(p._p.xpath("./w:hyperlink/w:r[w:t][2]/w:t/text()"))
+        for p in document.paragraphs
+        if p.style.name.startswith("toc")
+    ]
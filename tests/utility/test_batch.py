@@ -0,0 +1,211 @@
+"""Unit test suite for skelmis.docx.utility.batch module."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from skelmis.docx.utility.batch import (
+    document_to_pdf_many,
+    document_to_pdf_many_async,
+    update_toc_many,
+)
+from skelmis.docx.utility.cache import PdfCache
+
+# -- stands in for `soffice`, either converting to PDF or running the UpdateTOC macro --
+_FAKE_SOFFICE = """
+import sys, time
+from pathlib import Path
+
+args = sys.argv[1:]
+if args[-1].startswith("macro:///"):
+    src = Path(args[-1][args[-1].index("(") + 1 : -1])
+    if src.read_bytes() == b"fail":
+        sys.exit(3)
+    src.write_bytes(b"toc updated")
+    sys.exit(0)
+out_dir = Path(args[args.index("--outdir") + 1])
+src = Path(args[-1])
+if src.read_bytes() == b"fail":
+    sys.stderr.write("source file could not be loaded")
+    sys.exit(1)
+if src.read_bytes() == b"slow":
+    sys.stderr.write("converting")
+    sys.stderr.flush()
+    time.sleep(5)
+(out_dir / (src.stem + ".pdf")).write_bytes(b"%PDF")
+if src.read_bytes() == b"crash":
+    sys.stderr.write("crashed while exporting")
+    sys.exit(134)
+"""
+
+
+class DescribeDocumentToPdfMany:
+    def it_converts_each_document_and_reports_each_outcome(
+        self, tmp_path: Path, command: list[str]
+    ):
+        docx_files = [_docx(tmp_path, "a", b"ok"), _docx(tmp_path, "b", b"fail")]
+        docx_files.append(tmp_path / "missing.docx")
+
+        results = document_to_pdf_many(
+            docx_files, concurrency=2, output_dir=tmp_path / "out", command=command
+        )
+
+        assert [r.source for r in results] == docx_files
+        assert [r.ok for r in results] == [True, False, False]
+        assert results[0].output == tmp_path / "out" / "a.pdf"
+        assert results[0].output.read_bytes() == b"%PDF"
+        assert results[0].duration > 0
+        assert results[1].output is None
+        assert results[1].returncode == 1
+        assert results[1].stderr == "source file could not be loaded"
+        assert (
+            results[1].error == "LibreOffice exited with status 1: source file could not be loaded"
+        )
+        assert results[2].error == f"no such file: '{docx_files[2]}'"
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["a.pdf"]
+
+    def it_kills_a_conversion_that_times_out(self, tmp_path: Path, command: list[str]):
+        docx_file = _docx(tmp_path, "slow", b"slow")
+
+        (result,) = document_to_pdf_many([docx_file], timeout=0.5, command=command)
+
+        assert result.returncode is None
+        assert result.error == "timed out after 0.5s"
+        assert result.stderr == "converting"
+
+    def it_reports_a_failed_conversion_even_when_it_left_a_pdf(
+        self, tmp_path: Path, command: list[str]
+    ):
+        docx_file = _docx(tmp_path, "crash", b"crash")
+
+        (result,) = document_to_pdf_many([docx_file], output_dir=tmp_path / "out", command=command)
+
+        assert result.ok is False
+        assert result.output is None
+        assert result.returncode == 134
+        assert result.error == "LibreOffice exited with status 134: crashed while exporting"
+        assert list((tmp_path / "out").iterdir()) == []
+
+    def it_reports_a_failure_for_each_job_when_libreoffice_cannot_start(self, tmp_path: Path):
+        docx_files = [_docx(tmp_path, "a", b"ok"), _docx(tmp_path, "b", b"ok")]
+
+        results = document_to_pdf_many(
+            docx_files, output_dir=tmp_path, command=str(tmp_path / "no-such-soffice")
+        )
+
+        assert [r.ok for r in results] == [False, False]
+        assert all(r.error.startswith("could not start LibreOffice: ") for r in results)
+
+    def but_it_raises_when_two_documents_would_have_the_same_pdf(self, tmp_path: Path):
+        docx_files = [_docx(tmp_path, "a", b"ok"), _docx(tmp_path / "sub", "a", b"ok")]
+
+        with pytest.raises(ValueError, match="would overwrite each other's PDF: 'a.pdf'"):
+            document_to_pdf_many(docx_files, output_dir=tmp_path, command="soffice")
+
+    def it_kills_its_conversions_when_cancelled(self, tmp_path: Path, command: list[str]):
+        docx_file = _docx(tmp_path, "slow", b"slow")
+
+        async def cancel_conversion():
+            task = asyncio.ensure_future(
+                document_to_pdf_many_async([docx_file], output_dir=tmp_path, command=command)
+            )
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(asyncio.wait_for(cancel_conversion(), 4))
+
+        assert not (tmp_path / "slow.pdf").exists()
+
+    def it_reuses_the_pdf_of_a_document_converted_before(
+        self, tmp_path: Path, command: list[str], monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        cache = PdfCache(tmp_path / "cache")
+        docx_files = [_docx(tmp_path, "a", b"ok"), _docx(tmp_path, "b", b"ok")]
+
+        first = document_to_pdf_many(docx_files[:1], command=command, cache=cache)
+        results = document_to_pdf_many(docx_files, command=command, cache=cache)
+
+        assert [r.ok for r in results] == [True, True]
+        assert results[0].output == results[1].output == first[0].output
+        assert results[0].output.parent == cache.directory
+        assert results[1].returncode is None
+
+    def it_copies_cached_pdfs_to_the_output_dir_when_one_is_given(
+        self, tmp_path: Path, command: list[str]
+    ):
+        cache = PdfCache(tmp_path / "cache")
+        docx_files = [_docx(tmp_path, "a", b"ok"), _docx(tmp_path, "b", b"ok")]
+
+        results = document_to_pdf_many(
+            docx_files, output_dir=tmp_path / "out", command=command, cache=cache
+        )
+
+        assert [r.output for r in results] == [
+            tmp_path / "out" / "a.pdf",
+            tmp_path / "out" / "b.pdf",
+        ]
+        assert all(r.output.read_bytes() == b"%PDF" for r in results)
+        assert len(list(cache.directory.glob("*.pdf"))) == 1
+
+    def but_it_converts_again_when_the_command_differs(
+        self, tmp_path: Path, command: list[str], monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        cache = PdfCache(tmp_path / "cache")
+        docx_file = _docx(tmp_path, "a", b"ok")
+        document_to_pdf_many([docx_file], command=command, cache=cache)
+
+        (result,) = document_to_pdf_many([docx_file], command=[*command, "-v"], cache=cache)
+
+        assert result.returncode == 0
+        assert len(list(cache.directory.glob("*.pdf"))) == 2
+
+
+class DescribeUpdateTocMany:
+    def it_updates_each_document_in_place(self, tmp_path: Path, command: list[str]):
+        docx_files = [_docx(tmp_path, "a", b"ok"), _docx(tmp_path, "b", b"fail")]
+
+        results = update_toc_many(docx_files, command=command)
+
+        assert [r.ok for r in results] == [True, False]
+        assert results[0].output == docx_files[0]
+        assert docx_files[0].read_bytes() == b"toc updated"
+        assert results[1].returncode == 3
+        assert docx_files[1].read_bytes() == b"fail"
+        assert sorted(p.name for p in tmp_path.glob("*.docx")) == ["a.docx", "b.docx"]
+
+    def it_reports_a_failure_when_libreoffice_cannot_start(self, tmp_path: Path):
+        docx_file = _docx(tmp_path, "a", b"ok")
+
+        (result,) = update_toc_many([docx_file], command=str(tmp_path / "no-such-soffice"))
+
+        assert result.error.startswith("could not start LibreOffice: ")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.docx"]
+
+
+# fixtures -------------------------------------------------------
+
+
+@pytest.fixture
+def command(tmp_path: Path) -> list[str]:
+    script = tmp_path / "fake_soffice.py"
+    script.write_text(textwrap.dedent(_FAKE_SOFFICE))
+    return [sys.executable, str(script)]
+
+
+# helpers --------------------------------------------------------
+
+
+def _docx(tmp_path: Path, stem: str, content: bytes) -> Path:
+    docx_file = tmp_path / f"{stem}.docx"
+    docx_file.parent.mkdir(parents=True, exist_ok=True)
+    docx_file.write_bytes(content)
+    return docx_file
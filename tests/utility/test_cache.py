@@ -0,0 +1,97 @@
+"""Unit test suite for skelmis.docx.utility.cache module."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from skelmis.docx.utility.cache import PdfCache
+from skelmis.docx.utility.converter import PdfConverter
+from skelmis.docx.utility.to_pdf import document_to_pdf
+
+from ..unitutil.mock import instance_mock
+
+
+class DescribePdfCache:
+    def it_keys_a_document_by_its_content_and_options(self, tmp_path: Path, cache: PdfCache):
+        a, b, c = (tmp_path / f"{stem}.docx" for stem in "abc")
+        a.write_bytes(b"same")
+        b.write_bytes(b"same")
+        c.write_bytes(b"different")
+
+        assert cache.key(a) == cache.key(b)
+        assert cache.key(a) != cache.key(c)
+        assert cache.key(a, converter="libreoffice") != cache.key(a, converter="word")
+        assert len(cache.key(a)) == 64
+
+    def it_stores_and_retrieves_pdfs_by_key(self, tmp_path: Path, cache: PdfCache):
+        pdf_file = _pdf(tmp_path, "report", b"%PDF")
+
+        assert cache.get("k") is None
+        cached_pdf = cache.put("k", pdf_file)
+
+        assert cached_pdf == cache.directory / "k.pdf"
+        assert cached_pdf.read_bytes() == b"%PDF"
+        assert not pdf_file.exists()
+        assert cache.get("k") == cached_pdf
+
+    def it_evicts_the_least_recently_used_pdfs_beyond_its_size(self, tmp_path: Path):
+        cache = PdfCache(tmp_path / "cache", max_bytes=12)
+        for idx, key in enumerate("abc"):
+            cache.put(key, _pdf(tmp_path, key, b"4444"))
+            os.utime(cache.directory / f"{key}.pdf", (idx, idx))
+        # -- "a" is used, leaving "b" least-recently used --
+        cache.get("a")
+
+        cache.put("d", _pdf(tmp_path, "d", b"4444"))
+
+        assert sorted(p.stem for p in cache.directory.glob("*.pdf")) == ["a", "c", "d"]
+
+    def but_it_never_evicts_the_pdf_just_put(self, tmp_path: Path):
+        cache = PdfCache(tmp_path / "cache", max_bytes=4)
+        cache.put("a", _pdf(tmp_path, "a", b"4444"))
+
+        cached_pdf = cache.put("b", _pdf(tmp_path, "b", b"88888888"))
+
+        assert cached_pdf.read_bytes() == b"88888888"
+        assert [p.stem for p in cache.directory.glob("*.pdf")] == ["b"]
+
+    def it_expires_pdfs_not_used_within_their_max_age(self, tmp_path: Path):
+        cache = PdfCache(tmp_path / "cache", max_age=60)
+        cached_pdf = cache.put("old", _pdf(tmp_path, "old", b"%PDF"))
+        an_hour_ago = time.time() - 3600
+        os.utime(cached_pdf, (an_hour_ago, an_hour_ago))
+
+        assert cache.get("old") is None
+        assert not cached_pdf.exists()
+
+    def it_lets_document_to_pdf_skip_converting_a_cached_document(
+        self, request, tmp_path: Path, cache: PdfCache
+    ):
+        docx_file = tmp_path / "report.docx"
+        docx_file.write_bytes(b"docx")
+        converter_ = instance_mock(request, PdfConverter)
+        converter_.convert.side_effect = lambda f: _pdf(tmp_path, f.stem, b"%PDF")
+
+        first = document_to_pdf(docx_file, converter_, cache=cache)
+        second = document_to_pdf(str(docx_file), converter_, cache=cache)
+
+        converter_.convert.assert_called_once_with(docx_file)
+        assert first == second
+        assert first.parent == cache.directory
+        assert first.read_bytes() == b"%PDF"
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> PdfCache:
+        return PdfCache(tmp_path / "cache")
+
+
+def _pdf(tmp_path: Path, stem: str, content: bytes) -> Path:
+    pdf_file = tmp_path / f"{stem}.pdf"
+    pdf_file.write_bytes(content)
+    return pdf_file
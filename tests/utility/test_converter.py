@@ -0,0 +1,179 @@
+"""Unit test suite for skelmis.docx.utility.converter module."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import threading
+import types
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from skelmis.docx.utility.converter import PdfConversionError, PdfConverter, _UnoWorker
+
+from ..unitutil.mock import Mock
+
+# -- stands in for `soffice --convert-to pdf`, recording the profile it was run with --
+_FAKE_SOFFICE = """
+import sys, time
+from pathlib import Path
+
+args = sys.argv[1:]
+profile = next(a for a in args if a.startswith("-env:UserInstallation="))
+out_dir = Path(args[args.index("--outdir") + 1])
+src = Path(args[-1])
+if src.read_bytes() == b"fail":
+    sys.stderr.write("source file could not be loaded")
+    sys.exit(1)
+if src.read_bytes() == b"slow":
+    time.sleep(0.3)
+(out_dir / (src.stem + ".pdf")).write_text(profile)
+if src.read_bytes() == b"linger":
+    time.sleep(0.3)
+"""
+
+
+class DescribePdfConverter:
+    def it_converts_a_document_to_pdf(self, tmp_path: Path, command: list[str]):
+        docx_file = tmp_path / "report.docx"
+        docx_file.write_bytes(b"docx")
+
+        with PdfConverter(command=command, use_uno=False) as converter:
+            pdf_file = converter.convert(docx_file, tmp_path / "out")
+
+        assert pdf_file == tmp_path / "out" / "report.pdf"
+        assert pdf_file.read_text().startswith("-env:UserInstallation=file://")
+        assert [p.name for p in (tmp_path / "out").iterdir()] == ["report.pdf"]
+
+    def it_gives_each_worker_its_own_profile(self, tmp_path: Path, command: list[str]):
+        docx_files = []
+        for idx in range(4):
+            docx_files.append(tmp_path / f"doc-{idx}.docx")
+            docx_files[-1].write_bytes(b"slow")
+
+        with PdfConverter(2, command=command, use_uno=False) as converter:
+            threads = [
+                threading.Thread(target=converter.convert, args=(f, tmp_path)) for f in docx_files
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        profiles = {(tmp_path / f"doc-{idx}.pdf").read_text() for idx in range(4)}
+        assert len(profiles) == 2
+
+    def it_raises_when_the_conversion_fails(self, tmp_path: Path, command: list[str]):
+        docx_file = tmp_path / "broken.docx"
+        docx_file.write_bytes(b"fail")
+
+        with (
+            PdfConverter(command=command, use_uno=False) as converter,
+            pytest.raises(PdfConversionError, match="could not be loaded"),
+        ):
+            converter.convert(docx_file, tmp_path)
+
+        assert not (tmp_path / "broken.pdf").exists()
+
+    def it_raises_when_the_conversion_times_out(self, tmp_path: Path, command: list[str]):
+        docx_file = tmp_path / "slow.docx"
+        docx_file.write_bytes(b"slow")
+
+        with (
+            PdfConverter(command=command, timeout=0.05, use_uno=False) as converter,
+            pytest.raises(PdfConversionError, match="timed out"),
+        ):
+            converter.convert(docx_file, tmp_path)
+
+    def and_it_discards_a_pdf_written_before_the_timeout(self, tmp_path: Path, command: list[str]):
+        docx_file = tmp_path / "linger.docx"
+        docx_file.write_bytes(b"linger")
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+
+        with (
+            PdfConverter(command=command, timeout=0.1, use_uno=False) as converter,
+            pytest.raises(PdfConversionError, match="timed out"),
+        ):
+            converter.convert(docx_file, out_dir)
+
+        assert list(out_dir.iterdir()) == []
+
+    def it_removes_its_temporary_profiles_when_closed(self, command: list[str]):
+        converter = PdfConverter(command=command, use_uno=False)
+        profile_dir = converter._profile_dir  # pyright: ignore[reportPrivateUsage]
+        profile_dir.mkdir(exist_ok=True)
+
+        converter.close()
+
+        assert not profile_dir.exists()
+        with pytest.raises(PdfConversionError):
+            converter.convert(__file__)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def command(self, tmp_path: Path) -> list[str]:
+        script = tmp_path / "fake_soffice.py"
+        script.write_text(textwrap.dedent(_FAKE_SOFFICE))
+        return [sys.executable, str(script)]
+
+
+class Describe_UnoWorker:
+    """Unit-test suite for `skelmis.docx.utility.converter._UnoWorker`."""
+
+    def it_kills_a_conversion_that_times_out(self, tmp_path: Path, worker: _UnoWorker):
+        process = worker._process  # pyright: ignore[reportPrivateUsage]
+
+        def load(*args: Any):
+            # -- like a UNO call, blocks until the soffice process goes away --
+            process.wait()  # pyright: ignore[reportOptionalMemberAccess]
+            raise RuntimeError("binary URP bridge disposed")
+
+        worker._desktop.loadComponentFromURL = load  # pyright: ignore[reportPrivateUsage]
+
+        with pytest.raises(PdfConversionError, match=r"timed out after 0.2s"):
+            worker.convert(tmp_path / "a.docx", tmp_path / "a.pdf")
+        assert process.poll() is not None  # pyright: ignore[reportOptionalMemberAccess]
+        assert worker._process is None  # pyright: ignore[reportPrivateUsage]
+
+    def it_leaves_no_partial_pdf_when_the_conversion_fails(
+        self, tmp_path: Path, worker: _UnoWorker
+    ):
+        def store(url: str, props: Any):
+            Path(url).write_text("partial")
+            raise RuntimeError("export failed")
+
+        doc = Mock(storeToURL=store)
+        worker._desktop.loadComponentFromURL = Mock(  # pyright: ignore[reportPrivateUsage]
+            return_value=doc
+        )
+
+        with pytest.raises(PdfConversionError, match="export failed"):
+            worker.convert(tmp_path / "a.docx", tmp_path / "a.pdf")
+        assert list(tmp_path.iterdir()) == []
+        doc.close.assert_called_once_with(True)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def worker(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[_UnoWorker]:
+        uno = types.ModuleType("uno")
+        uno.systemPathToFileUrl = str  # pyright: ignore[reportAttributeAccessIssue]
+        beans = types.ModuleType("com.sun.star.beans")
+        beans.PropertyValue = Mock  # pyright: ignore[reportAttributeAccessIssue]
+        monkeypatch.setitem(sys.modules, "uno", uno)
+        for name in ("com", "com.sun", "com.sun.star"):
+            monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+        monkeypatch.setitem(sys.modules, "com.sun.star.beans", beans)
+        worker = _UnoWorker([sys.executable], tmp_path / "profile", timeout=0.2)
+        # -- stands in for the soffice process listening for UNO connections --
+        worker._process = subprocess.Popen(  # pyright: ignore[reportPrivateUsage]
+            [sys.executable, "-c", "import time; time.sleep(30)"]
+        )
+        worker._desktop = Mock()  # pyright: ignore[reportPrivateUsage]
+        yield worker
+        worker.stop()